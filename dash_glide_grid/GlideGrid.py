@@ -41,6 +41,19 @@ Keyword arguments:
     - 'orthogonal': Fill horizontally or vertically (not diagonal) -
     'any': Fill in any direction including diagonal.
 
+- appendRows (list of dicts | dict with strings as keys and values of type list; optional):
+    Rows to append to the end of the grid, for live feeds. Each new
+    value is appended in place, so only the new rows go over the wire
+    (instead of resending the whole `data`). Accepts a list of row
+    dicts or a columnar dict like `dataColumns`. Appended rows are not
+    sent back through `data`.  If the user is scrolled to the last
+    row, the grid stays pinned to the tail. Add \"append\" to
+    `showCellFlash` to flash new rows. Leave `rows` unset so the row
+    count follows the data.
+
+- blockSize (number; default 100):
+    Number of rows per block when rowModel=\"server\". Default: 100.
+
 - buttonClicked (dict; optional):
     Information about the last clicked button cell. Format: {\"col\":
     0, \"row\": 1, \"title\": \"Button Text\", \"timestamp\":
@@ -111,6 +124,33 @@ Keyword arguments:
 
     - timestamp (number; optional)
 
+- cellUpdates (dict; optional):
+    Sparse cell updates for high-frequency feeds (e.g. price ticks).
+    The values are written straight into the grid's local data and
+    only the listed cells are repainted. There is no full data copy
+    and no React re-render, so Python callbacks can drive tick-level
+    updates cheaply.  - `row`: data row index (unaffected by
+    sorting/filtering) - `col`: column index or column id - `value`:
+    new cell value  Updates are not sent back through `data`, and the
+    current sort/filter order is not recomputed for them. Add
+    \"update\" to `showCellFlash` to flash the updated cells.  Format:
+    {\"updates\": [{\"row\": 0, \"col\": \"price\", \"value\":
+    101.5}], \"timestamp\": 1234567890}.
+
+    `cellUpdates` is a dict with keys:
+
+    - updates (list of dicts; optional)
+
+        `updates` is a list of dicts with keys:
+
+        - row (number; required)
+
+        - col (number | string; required)
+
+        - value (boolean | number | string | dict | list; optional)
+
+    - timestamp (number; optional)
+
 - cellsEdited (dict; optional):
     Information about batch cell edits (paste or fill operations).
     Fires when multiple cells are edited at once, such as when pasting
@@ -264,6 +304,58 @@ Keyword arguments:
 
         - function (string; required)
 
+    - format (dict; optional):
+        Declarative display format, compiled once into a cached Intl
+        formatter. Faster than a valueFormatter function, which runs
+        for every cell paint. A valueFormatter on the same column
+        takes precedence.  **Usage**: `format={\"type\": \"currency\",
+        \"currency\": \"EUR\", \"locale\": \"de-DE\", \"decimals\":
+        2}`  - `type`: \"number\" (default), \"percent\" (1 = 100%),
+        \"currency\",   \"date\", \"datetime\" or \"time\" (for ISO
+        date strings or timestamps in ms) - `decimals`: Fixed number
+        of fraction digits - `locale`: BCP 47 locale, e.g. \"en-US\"
+        (default: browser locale) - `currency`: ISO 4217 code for
+        \"currency\" (default: \"USD\") - `thousandsSeparator`: Set to
+        False to disable digit grouping - `dateStyle` / `timeStyle`:
+        \"full\", \"long\", \"medium\" or \"short\" - `timeZone`: IANA
+        time zone, e.g. \"UTC\" - `prefix` / `suffix`: Text added
+        around the formatted value - `options`: Extra
+        Intl.NumberFormat / Intl.DateTimeFormat options.
+
+        `format` is a dict with keys:
+
+        - type (a value equal to: 'number', 'percent', 'currency', 'date', 'datetime', 'time'; optional)
+
+        - decimals (number; optional)
+
+        - locale (string; optional)
+
+        - currency (string; optional)
+
+        - thousandsSeparator (boolean; optional)
+
+        - dateStyle (a value equal to: 'full', 'long', 'medium', 'short'; optional)
+
+        - timeStyle (a value equal to: 'full', 'long', 'medium', 'short'; optional)
+
+        - timeZone (string; optional)
+
+        - prefix (string; optional)
+
+        - suffix (string; optional)
+
+        - options (dict; optional)
+
+- computeWorker (boolean; default False):
+    Sort and filter in a background Web Worker instead of on the main
+    thread. The worker keeps a copy of the sorted/filtered columns
+    (only the parts that changed are sent to it) and returns the row
+    order when it is done; until then the grid keeps showing the
+    previous order, so scrolling and input stay responsive on large
+    datasets. Superseded sort or filter changes are skipped. Falls
+    back to main-thread sorting when workers are unavailable. Has no
+    effect with `rowModel=\"server\"`. Default: False.
+
 - contextMenu (dict; optional):
     Information about the last right-clicked cell. Useful for
     implementing cell context menus. Format: {\"col\": 0, \"row\": 1,
@@ -371,7 +463,7 @@ Keyword arguments:
 - copyHeaders (boolean; default False):
     Include column headers when copying to clipboard. Default: False.
 
-- data (list of dicts; required):
+- data (list of dicts; optional):
     Array of row data objects (records format). Each row is a dict
     where keys match column `id` values. Compatible with
     `df.to_dict('records')`.  **Example**: ```python columns = [
@@ -418,7 +510,93 @@ Keyword arguments:
     [\"python\", \"react\"],     \"options\": [{\"value\": \"python\",
     \"label\": \"Python\", \"color\": \"#3776ab\"}],
     \"allowedValues\": [\"python\", \"react\", \"sql\"]   },
-    \"allowOverlay\": True,   \"copyData\": \"python, react\" } ```.
+    \"allowOverlay\": True,   \"copyData\": \"python, react\" } ```
+    Either `data` or `dataColumns` must be provided.
+
+- dataColumns (dict; optional):
+    Row data in columnar format: a dict of column id -> list of
+    values, one entry per row. An alternative to `data` that avoids
+    repeating every column key in every row, which makes large
+    payloads smaller and faster to parse. Takes precedence over `data`
+    when both are set. Cell values follow the same rules as in `data`
+    (simple values or cell objects).  Edits made in the grid are sent
+    back as `dataColumns` (or as `dataPatch` when
+    dataSyncMode=\"patch\").  **Example**: ```python dataColumns = {
+    'name': ['Laptop', 'Mouse'],     'price': [1299.99, 29.99], } # Or
+    from pandas, without to_dict('records'):
+    GlideGrid.from_dataframe(df, id='grid') ```  **Binary numeric
+    columns**: a numeric column can instead be an object `{\"dtype\":
+    \"float64\", \"data\": \"<base64>\"}` holding the raw
+    little-endian bytes of a NumPy array. The grid wraps them in a
+    typed array without parsing each value. Supported dtypes: float64,
+    float32, int32, int16, int8, uint32, uint16, uint8. NaN in float
+    columns is shown as an empty cell. Use
+    `GlideGrid.from_dataframe(df, binary=True)` or
+    `dash_glide_grid.encode_typed_column(array)` to build them, and
+    `dash_glide_grid.decode_columns(dataColumns)` to read edited data
+    back.
+
+    `dataColumns` is a dict with strings as keys and values of type
+    list | dict with keys:
+
+    - dtype (a value equal to: 'float64', 'float32', 'int32', 'int16', 'int8', 'uint32', 'uint16', 'uint8'; optional)
+
+    - data (string; optional)
+
+- dataPatch (dict; optional):
+    Cell edits made in the grid when dataSyncMode=\"patch\" (read-only
+    output prop). Each edit uses the data row index (unaffected by
+    sorting/filtering) and the column id. `source` is the operation
+    that produced the edits: \"edit\", \"paste\", \"fill\",
+    \"delete\", \"undo\", \"redo\" or \"contextMenu\". Format:
+    {\"edits\": [{\"row\": 0, \"col\": 1, \"columnId\": \"price\",
+    \"oldValue\": 10, \"value\": 12}],          \"source\": \"edit\",
+    \"timestamp\": 1234567890}.
+
+    `dataPatch` is a dict with keys:
+
+    - edits (list of dicts; optional)
+
+        `edits` is a list of dicts with keys:
+
+        - row (number; optional)
+
+        - col (number; optional)
+
+        - columnId (string; optional)
+
+        - oldValue (boolean | number | string | dict | list; optional)
+
+        - value (boolean | number | string | dict | list; optional)
+
+    - source (string; optional)
+
+    - timestamp (number; optional)
+
+- dataRevision (number; optional):
+    Revision number of `data`. Used to tell fresh data from stale
+    echoes without deep-comparing the whole dataset. - The grid
+    increments it every time it sends `data` back to Dash (edits,
+    paste,   fill, delete, undo/redo), so it is also an output prop. -
+    Incoming `data` whose `dataRevision` is lower than the newest
+    revision the   grid has already applied is ignored as a stale
+    echo. - When pushing new data from a callback (including
+    `dash.Patch` updates), also   return `dataRevision` incremented
+    from its current value so it is never   treated as stale. Until a
+    revision is known, incoming data is always applied unless it is
+    the grid's own echo.
+
+- dataSyncMode (a value equal to: 'full', 'patch'; default 'full'):
+    How edits made in the grid are synced back to Dash. - \"full\"
+    (default): Every edit, paste, fill, delete and undo/redo sends the
+    entire `data` array back to Dash. - \"patch\": Only the changed
+    cells are sent, via the `dataPatch` output prop.   The grid
+    applies edits locally and `data` is NOT updated in Dash, so the
+    server holds the authoritative copy. Use
+    `dash_glide_grid.data_patch_to_dash_patch`   or
+    `dash_glide_grid.apply_data_patch` to apply the edits on the
+    server.   Recommended for large datasets where resending `data`
+    per keystroke is costly. Default: \"full\".
 
 - deletePressed (dict; optional):
     Information about delete key press events. Fires when user presses
@@ -543,6 +721,16 @@ Keyword arguments:
     (Windows/Linux), or programmatically via undoRedoAction. Default:
     False.
 
+- eventRateLimits (dict with strings as keys and values of type number | boolean; optional):
+    Rate limits for high-frequency output props, in milliseconds per
+    prop. The first event in a window is sent immediately and the
+    latest one is always delivered when the window ends, so the final
+    state is never lost. Set a prop to False to stop sending it
+    entirely (e.g. when no callback listens to it). Props not listed
+    are sent on every event.  Supported props: mouseMove, itemHovered,
+    visibleRegion, columnWidths  Example: {\"mouseMove\": 50,
+    \"visibleRegion\": 100, \"itemHovered\": False}.
+
 - experimental (dict; optional):
     Experimental options. These are not considered stable API. Use
     with caution as they may change or be removed.  Options: -
@@ -587,6 +775,12 @@ Keyword arguments:
     bottom-right of a selection to fill adjacent cells with the
     selected pattern.
 
+- filterMode (a value equal to: 'client', 'server'; default 'client'):
+    Where column filters are applied. - \"client\" (default): the grid
+    filters its rows in the browser - \"server\": the filter menu only
+    updates `columnFilters`. The server   answers with a `rowOrder`
+    that leaves out the filtered rows.
+
 - fixedShadowX (boolean; default True):
     Show shadow behind frozen columns. Default: True.
 
@@ -617,9 +811,12 @@ Keyword arguments:
     `getRowThemeOverride={\"function\": \"rowThemeByStatus(row,
     rowData)\"}`  **Return values**: - `Theme object`: Override theme
     properties for this row (e.g., bgCell, textDark) - `undefined`:
-    Use default theme  **Available parameters**: `row` (row index),
-    `rowData` (dict of cell values keyed by column id), `data` (full
-    grid data).
+    Use default theme  **Available parameters**: `row` (display row
+    index), `dataRow` (data row index, unaffected by
+    sorting/filtering), `rowData` (dict of cell values keyed by column
+    id), `data` (full grid data)  For conditions on cell values,
+    `styleRules` is faster: it doesn't run a function per row on every
+    draw.
 
     `getRowThemeOverride` is a dict with keys:
 
@@ -737,7 +934,7 @@ Keyword arguments:
     (\"600px\", \"100vh\"). The grid requires an explicit height to
     render properly.
 
-- hiddenRows (list of numbers; optional):
+- hiddenRows (list of number | list of numberss; optional):
     Array of row indices to hide. Hidden rows: - Have height 0
     (visually collapsed) - Have fully transparent theme (invisible row
     marker and cells) - Are excluded from visual selection
@@ -745,7 +942,10 @@ Keyword arguments:
     filtering) - Keep their selection state internally (reappears when
     unhidden)  Useful for tree view collapse/expand functionality
     where child rows need to hide/show while maintaining their
-    identity and selection state.
+    identity and selection state.  Entries can also be inclusive
+    ranges, so large sections take one entry: [3, [10, 500000]] hides
+    row 3 and rows 10 through 500000. See `hiddenRowsMode` for
+    removing hidden rows from the display entirely.
 
 - hiddenRowsConfig (dict; optional):
     Configuration object controlling how hidden rows affect grid
@@ -775,6 +975,17 @@ Keyword arguments:
         Skip hidden rows during keyboard navigation (Tab, Arrow keys).
         Default: True.
 
+- hiddenRowsMode (a value equal to: 'collapse', 'exclude'; default 'collapse'):
+    How hidden rows are hidden. - \"collapse\" (default): hidden rows
+    stay in the grid with height 0, as   described for `hiddenRows`.
+    Indices are display rows. - \"exclude\": hidden rows are left out
+    of the display order, like filtered   rows. Indices are data rows.
+    Cost scales with the visible rows only, so   hiding most of a
+    large grid (e.g. collapsed tree sections) stays fast.   Row
+    numbers then follow the visible rows, and `hiddenRowsConfig`
+    doesn't   apply since hidden rows can't be reached. Has no effect
+    with `rowModel=\"server\"`.
+
 - highlightRegions (list of dicts; optional):
     Array of highlight regions to display on the grid. Each region is
     drawn with a background color and dashed border. Useful for
@@ -868,12 +1079,30 @@ Keyword arguments:
 
     - timestamp (number; optional)
 
+- maxCachedBlocks (number; default 50):
+    Maximum number of blocks kept in memory when rowModel=\"server\".
+    The least recently visible blocks are dropped first. Default: 50.
+
 - maxColumnAutoWidth (number; optional):
     Maximum width for auto-sized columns. Defaults to maxColumnWidth.
 
 - maxColumnWidth (number; default 500):
     Maximum width users can resize columns to. Default: 500.
 
+- maxRows (number; optional):
+    Maximum number of rows kept when rows are appended with
+    `appendRows`. The oldest rows are dropped first, like a ring
+    buffer. Dropping rows clears the undo history, since data row
+    indices shift.
+
+- maxUndoBytes (number; optional):
+    Memory budget for the undo history, in bytes (approximate). Edit
+    batches are stored as row ranges with one array of old and new
+    values per column, and the oldest batches are discarded once the
+    history exceeds this size (a single batch larger than the budget
+    is not kept). Applies together with maxUndoSteps. Default: None
+    (no byte limit).
+
 - maxUndoSteps (number; default 50):
     Maximum number of undo steps to track. Older edits beyond this
     limit will be discarded. Default: 50.
@@ -963,6 +1192,54 @@ Keyword arguments:
 
     - timestamp (number; optional)
 
+- rowBlockRequest (dict; optional):
+    Request for a range of rows when rowModel=\"server\" (read-only
+    output prop). `endRow` is exclusive. `generation` changes whenever
+    the block cache is reset (sort/filter/row count change) and should
+    be echoed back in `rowBlocks`. Format: {\"startRow\": 0,
+    \"endRow\": 200, \"blockSize\": 100, \"sortColumns\": [...],
+    \"columnFilters\": {...}, \"generation\": 0, \"timestamp\":
+    1234567890}.
+
+    `rowBlockRequest` is a dict with keys:
+
+    - startRow (number; optional)
+
+    - endRow (number; optional)
+
+    - blockSize (number; optional)
+
+    - sortColumns (list; optional)
+
+    - columnFilters (dict; optional)
+
+    - generation (number; optional)
+
+    - timestamp (number; optional)
+
+- rowBlocks (dict; optional):
+    Rows sent by the server in answer to `rowBlockRequest`
+    (rowModel=\"server\"). Provide the rows either as records (`data`)
+    or columnar (`dataColumns`). `totalRows` optionally updates the
+    total row count. Responses whose `generation` doesn't match the
+    grid's current generation are ignored. Format: {\"startRow\": 0,
+    \"data\": [...], \"totalRows\": 20000000, \"generation\": 0,
+    \"timestamp\": 1234567890}.
+
+    `rowBlocks` is a dict with keys:
+
+    - startRow (number; optional)
+
+    - data (list of dicts; optional)
+
+    - dataColumns (dict; optional)
+
+    - totalRows (number; optional)
+
+    - generation (number; optional)
+
+    - timestamp (number; optional)
+
 - rowHeight (dict; default 34):
     Height of each data row in pixels, or a function for variable row
     heights. Can be a number (e.g., 34) or an object with a function
@@ -974,6 +1251,23 @@ Keyword arguments:
 
     - function (string; required)
 
+- rowHeights (list of dicts; optional):
+    Per-row heights in pixels, indexed by data row (heights follow
+    rows when sorting or filtering). Takes precedence over a
+    `rowHeight` function. - A list of numbers, one per data row - A
+    binary column ({\"dtype\": \"float64\", \"data\": \"<base64>\"},
+    see `dash_glide_grid.encode_typed_column`) - A string: the id of a
+    data column holding each row's height Rows without a valid height
+    use `rowHeight` (or 34). Heights are resolved once per data/row
+    order change into a lookup table, which keeps scrolling smooth
+    with variable heights on large grids.
+
+    `rowHeights` is a list of numbers | dict with keys:
+
+    - dtype (string; optional)
+
+    - data (string; optional) | string
+
 - rowMarkerStartIndex (number; default 1):
     Starting index for row numbers. Default: 1.
 
@@ -991,6 +1285,17 @@ Keyword arguments:
     'checkbox-visible': Always show checkboxes - 'clickable-number':
     Row numbers act as selection buttons.
 
+- rowModel (a value equal to: 'client', 'server'; default 'client'):
+    Where rows come from. - \"client\" (default): All rows are passed
+    in `data` / `dataColumns`. - \"server\": Only the total row count
+    is known up front (`rows`). The grid   requests blocks of rows
+    around the viewport via `rowBlockRequest` and shows   loading
+    cells until `rowBlocks` answers. Sorting and filtering are left to
+    the server (the request includes the current `sortColumns` and
+    `columnFilters`),   and edits are always sent as `dataPatch`. Use
+    `dash_glide_grid.RowBlockProvider` to serve blocks from a
+    DataFrame. Default: \"client\".
+
 - rowMovable (boolean; optional):
     Allow row reordering by dragging row markers. Default: True Note:
     rowMarkers must be enabled for row moving to work.
@@ -1010,6 +1315,22 @@ Keyword arguments:
 
     - timestamp (number; optional)
 
+- rowOrder (list of dicts; optional):
+    Display order of rows computed by the server, used when `sortMode`
+    or `filterMode` is \"server\". Each entry is a data row index.
+    Rows that are left out are hidden. Sorting or filtering that is
+    still done on the client is applied on top of this order.  Can be
+    a list of ints or a binary int32 column ({\"dtype\": \"int32\",
+    \"data\": \"<base64>\"}), as returned by
+    `dash_glide_grid.compute_row_order(..., binary=True)`. Set to None
+    to show the rows in data order.
+
+    `rowOrder` is a list of numbers | dict with keys:
+
+    - dtype (a value equal to: 'int32', 'uint32'; optional)
+
+    - data (string; optional)
+
 - rowSelect (a value equal to: 'none', 'single', 'multi'; default 'none'):
     Row selection mode. Options: 'none', 'single', 'multi'.
 
@@ -1076,6 +1397,56 @@ Keyword arguments:
 
     - vAlign (a value equal to: 'start', 'center', 'end'; optional)
 
+- searchIndex (boolean; default False):
+    Search with an index instead of Glide's cell-by-cell search. Each
+    column's distinct display texts get a trigram index, built on the
+    first search and kept up to date on edits, so searching large
+    grids takes milliseconds. Matches are case-insensitive substrings
+    of the display value (or of the `format` output for formatted
+    columns); `valueFormatter` output is not searched. Enables
+    `searchResults` and `searchNavigate`. Default: False.
+
+- searchNavigate (dict; optional):
+    Jump to the next or previous search match (requires
+    `searchIndex`). The grid scrolls to the match, selects it and
+    updates `searchResults.current`. Include a timestamp so repeated
+    jumps in the same direction trigger.  Example: {\"direction\":
+    \"next\", \"timestamp\": 1234567890}.
+
+    `searchNavigate` is a dict with keys:
+
+    - direction (a value equal to: 'next', 'prev'; optional)
+
+    - timestamp (number; optional)
+
+- searchResults (dict; optional):
+    Results of the current search (output, requires `searchIndex`). -
+    `query`: The search text - `count`: Number of matching cells -
+    `matches`: First 1000 matches as {row, col, displayRow}, in
+    display order.   `row` is the data row index. - `truncated`: True
+    if there are more matches than listed - `current`: Index of the
+    match navigated to, or -1.
+
+    `searchResults` is a dict with keys:
+
+    - query (string; optional)
+
+    - count (number; optional)
+
+    - matches (list of dicts; optional)
+
+        `matches` is a list of dicts with keys:
+
+        - row (number; optional)
+
+        - col (number; optional)
+
+        - displayRow (number; optional)
+
+    - truncated (boolean; optional)
+
+    - current (number; optional)
+
 - searchValue (string; default ''):
     The current search query string. Updated when user types in the
     search box. Can be set from Python to programmatically trigger a
@@ -1136,15 +1507,18 @@ Keyword arguments:
     selections. Useful for preventing selection of row label columns.
     Default: 0 (no restriction).
 
-- showCellFlash (boolean | list of a value equal to: "edit", "paste", "undo", "redo", "copy"s; default False):
+- showCellFlash (boolean | list of a value equal to: "edit", "paste", "undo", "redo", "copy", "append", "update"s; default False):
     Enable cell flash effect when cells are changed. When enabled,
     cells will briefly highlight and fade out to indicate changes. Can
     be: - True: Flash on all operations (edit, paste, undo, redo) -
     False: No flash (default) - Array of strings: Flash only on
     specified operations.   Valid values: \"edit\", \"paste\",
-    \"undo\", \"redo\", \"copy\"   Example: [\"paste\", \"undo\",
-    \"redo\", \"copy\"] to flash on paste, undo/redo, and copy but not
-    regular edits.
+    \"undo\", \"redo\", \"copy\", \"append\", \"update\"   (\"update\"
+    flashes cells changed through `cellUpdates`)   Example:
+    [\"paste\", \"undo\", \"redo\", \"copy\"] to flash on paste,
+    undo/redo, and copy but not regular edits Flashes don't re-render
+    the grid: flashed cells are repainted together once per animation
+    frame and forgotten when the animation ends.
 
 - showSearch (boolean; default False):
     Show/hide the built-in search interface. When enabled, displays a
@@ -1174,6 +1548,14 @@ Keyword arguments:
     - direction (a value equal to: 'asc', 'desc'; required):
         Sort direction: \"asc\" or \"desc\".
 
+- sortMode (a value equal to: 'client', 'server'; default 'client'):
+    Where sorting happens. - \"client\" (default): the grid sorts its
+    rows in the browser - \"server\": clicking a header only updates
+    `sortColumns`. The grid keeps   its current order until the server
+    sends a new `rowOrder`   (see
+    `dash_glide_grid.compute_row_order`). `sortable` must still be
+    True for header clicks to sort.
+
 - sortable (boolean; default False):
     Enable built-in column sorting. When True, clicking column headers
     will cycle through sort states (ascending → descending → none).
@@ -1188,6 +1570,44 @@ Keyword arguments:
     How to handle spans in range selection. 'default' expands to
     include full spans, 'allowPartial' allows partial span selection.
 
+- styleRules (list of dicts; optional):
+    Declarative conditional styling. Each rule tests the value in
+    `column` and applies a theme override to the whole row (`scope:
+    \"row\"`, default) or only to that cell (`scope: \"cell\"`). When
+    several rules match, the last one wins. Rules are evaluated once
+    per row when the data changes. Painting only looks up the result,
+    so no functions run while scrolling.  - `column`: Column id whose
+    value is tested - `operator`: \"==\", \"!=\", \">\", \">=\",
+    \"<\", \"<=\", \"between\" (value is [low, high]),   \"in\",
+    \"notIn\" (value is a list; items compare like \"==\", so 1
+    matches \"1\"),   \"contains\", \"startsWith\", \"endsWith\"
+    (case-insensitive), \"isBlank\", \"notBlank\" - `value`: Value to
+    compare against - `theme`: Name of a theme in `styleThemes`, or an
+    inline theme override object - `scope`: \"row\" or \"cell\"
+    Example: ``` styleRules=[     {\"column\": \"status\",
+    \"operator\": \"==\", \"value\": \"error\", \"theme\":
+    \"danger\"},     {\"column\": \"change\", \"operator\": \"<\",
+    \"value\": 0, \"theme\": \"negative\", \"scope\": \"cell\"}, ]
+    styleThemes={\"danger\": {\"bgCell\": \"#fde8e8\"}, \"negative\":
+    {\"textDark\": \"#c0392b\"}} ```.
+
+    `styleRules` is a list of dicts with keys:
+
+    - column (string; required)
+
+    - operator (a value equal to: '==', '!=', '>', '>=', '<', '<=', 'between', 'in', 'notIn', 'contains', 'startsWith', 'endsWith', 'isBlank', 'notBlank'; optional)
+
+    - value (boolean | number | string | dict | list; optional)
+
+    - theme (string | dict; required)
+
+    - scope (a value equal to: 'row', 'cell'; optional)
+
+- styleThemes (dict with strings as keys and values of type dict; optional):
+    Named theme overrides referenced by `styleRules`. Example:
+    {\"danger\": {\"bgCell\": \"#fde8e8\", \"textDark\":
+    \"#9b1c1c\"}}.
+
 - tabWrapping (boolean; default False):
     When True, Tab key navigation wraps at row boundaries. Tab at end
     of row moves to first cell of next row. Shift+Tab at start of row
@@ -1407,6 +1827,23 @@ Keyword arguments:
         }
     )
 
+    ColumnsFormat = TypedDict(
+        "ColumnsFormat",
+            {
+            "type": NotRequired[Literal["number", "percent", "currency", "date", "datetime", "time"]],
+            "decimals": NotRequired[NumberType],
+            "locale": NotRequired[str],
+            "currency": NotRequired[str],
+            "thousandsSeparator": NotRequired[bool],
+            "dateStyle": NotRequired[Literal["full", "long", "medium", "short"]],
+            "timeStyle": NotRequired[Literal["full", "long", "medium", "short"]],
+            "timeZone": NotRequired[str],
+            "prefix": NotRequired[str],
+            "suffix": NotRequired[str],
+            "options": NotRequired[dict]
+        }
+    )
+
     Columns = TypedDict(
         "Columns",
             {
@@ -1421,7 +1858,53 @@ Keyword arguments:
             "group": NotRequired[str],
             "themeOverride": NotRequired[dict],
             "grow": NotRequired[NumberType],
-            "valueFormatter": NotRequired["ColumnsValueFormatter"]
+            "valueFormatter": NotRequired["ColumnsValueFormatter"],
+            "format": NotRequired["ColumnsFormat"]
+        }
+    )
+
+    DataColumns = TypedDict(
+        "DataColumns",
+            {
+            "dtype": NotRequired[Literal["float64", "float32", "int32", "int16", "int8", "uint32", "uint16", "uint8"]],
+            "data": NotRequired[str]
+        }
+    )
+
+    CellUpdatesUpdates = TypedDict(
+        "CellUpdatesUpdates",
+            {
+            "row": NumberType,
+            "col": typing.Union[NumberType, str],
+            "value": NotRequired[typing.Any]
+        }
+    )
+
+    CellUpdates = TypedDict(
+        "CellUpdates",
+            {
+            "updates": NotRequired[typing.Sequence["CellUpdatesUpdates"]],
+            "timestamp": NotRequired[NumberType]
+        }
+    )
+
+    DataPatchEdits = TypedDict(
+        "DataPatchEdits",
+            {
+            "row": NotRequired[NumberType],
+            "col": NotRequired[NumberType],
+            "columnId": NotRequired[str],
+            "oldValue": NotRequired[typing.Any],
+            "value": NotRequired[typing.Any]
+        }
+    )
+
+    DataPatch = TypedDict(
+        "DataPatch",
+            {
+            "edits": NotRequired[typing.Sequence["DataPatchEdits"]],
+            "source": NotRequired[str],
+            "timestamp": NotRequired[NumberType]
         }
     )
 
@@ -1432,6 +1915,14 @@ Keyword arguments:
         }
     )
 
+    RowHeights = TypedDict(
+        "RowHeights",
+            {
+            "dtype": NotRequired[str],
+            "data": NotRequired[str]
+        }
+    )
+
     HiddenRowsConfig = TypedDict(
         "HiddenRowsConfig",
             {
@@ -1443,6 +1934,34 @@ Keyword arguments:
         }
     )
 
+    SearchResultsMatches = TypedDict(
+        "SearchResultsMatches",
+            {
+            "row": NotRequired[NumberType],
+            "col": NotRequired[NumberType],
+            "displayRow": NotRequired[NumberType]
+        }
+    )
+
+    SearchResults = TypedDict(
+        "SearchResults",
+            {
+            "query": NotRequired[str],
+            "count": NotRequired[NumberType],
+            "matches": NotRequired[typing.Sequence["SearchResultsMatches"]],
+            "truncated": NotRequired[bool],
+            "current": NotRequired[NumberType]
+        }
+    )
+
+    SearchNavigate = TypedDict(
+        "SearchNavigate",
+            {
+            "direction": NotRequired[Literal["next", "prev"]],
+            "timestamp": NotRequired[NumberType]
+        }
+    )
+
     Theme = TypedDict(
         "Theme",
             {
@@ -1729,6 +2248,31 @@ Keyword arguments:
         }
     )
 
+    RowBlockRequest = TypedDict(
+        "RowBlockRequest",
+            {
+            "startRow": NotRequired[NumberType],
+            "endRow": NotRequired[NumberType],
+            "blockSize": NotRequired[NumberType],
+            "sortColumns": NotRequired[typing.Sequence],
+            "columnFilters": NotRequired[dict],
+            "generation": NotRequired[NumberType],
+            "timestamp": NotRequired[NumberType]
+        }
+    )
+
+    RowBlocks = TypedDict(
+        "RowBlocks",
+            {
+            "startRow": NotRequired[NumberType],
+            "data": NotRequired[typing.Sequence[dict]],
+            "dataColumns": NotRequired[dict],
+            "totalRows": NotRequired[NumberType],
+            "generation": NotRequired[NumberType],
+            "timestamp": NotRequired[NumberType]
+        }
+    )
+
     ColumnMoved = TypedDict(
         "ColumnMoved",
             {
@@ -1870,6 +2414,17 @@ Keyword arguments:
         }
     )
 
+    StyleRules = TypedDict(
+        "StyleRules",
+            {
+            "column": str,
+            "operator": NotRequired[Literal["==", "!=", ">", ">=", "<", "<=", "between", "in", "notIn", "contains", "startsWith", "endsWith", "isBlank", "notBlank"]],
+            "value": NotRequired[typing.Any],
+            "theme": typing.Union[str, dict],
+            "scope": NotRequired[Literal["row", "cell"]]
+        }
+    )
+
     DrawCell = TypedDict(
         "DrawCell",
             {
@@ -1892,6 +2447,14 @@ Keyword arguments:
         }
     )
 
+    RowOrder = TypedDict(
+        "RowOrder",
+            {
+            "dtype": NotRequired[Literal["int32", "uint32"]],
+            "data": NotRequired[str]
+        }
+    )
+
     HeaderMenuConfigCustomItemsOnClick = TypedDict(
         "HeaderMenuConfigCustomItemsOnClick",
             {
@@ -1952,10 +2515,18 @@ Keyword arguments:
         id: typing.Optional[typing.Union[str, dict]] = None,
         columns: typing.Optional[typing.Sequence["Columns"]] = None,
         data: typing.Optional[typing.Sequence[dict]] = None,
+        dataColumns: typing.Optional[typing.Dict[typing.Union[str, float, int], typing.Union[typing.Sequence, "DataColumns"]]] = None,
+        appendRows: typing.Optional[typing.Union[typing.Sequence[dict], typing.Dict[typing.Union[str, float, int], typing.Sequence]]] = None,
+        maxRows: typing.Optional[NumberType] = None,
+        cellUpdates: typing.Optional["CellUpdates"] = None,
         rows: typing.Optional[NumberType] = None,
+        dataSyncMode: typing.Optional[Literal["full", "patch"]] = None,
+        dataPatch: typing.Optional["DataPatch"] = None,
+        dataRevision: typing.Optional[NumberType] = None,
         height: typing.Optional[typing.Union[NumberType, str]] = None,
         width: typing.Optional[typing.Union[NumberType, str]] = None,
         rowHeight: typing.Optional[typing.Union[NumberType, "RowHeight"]] = None,
+        rowHeights: typing.Optional[typing.Union[typing.Sequence[NumberType], "RowHeights", str]] = None,
         headerHeight: typing.Optional[NumberType] = None,
         freezeColumns: typing.Optional[NumberType] = None,
         freezeTrailingRows: typing.Optional[NumberType] = None,
@@ -1980,11 +2551,15 @@ Keyword arguments:
         selectionColumnMin: typing.Optional[NumberType] = None,
         unselectableColumns: typing.Optional[typing.Sequence[NumberType]] = None,
         unselectableRows: typing.Optional[typing.Sequence[NumberType]] = None,
-        hiddenRows: typing.Optional[typing.Sequence[NumberType]] = None,
+        hiddenRows: typing.Optional[typing.Sequence[typing.Union[NumberType, typing.Sequence[NumberType]]]] = None,
+        hiddenRowsMode: typing.Optional[Literal["collapse", "exclude"]] = None,
         hiddenRowsConfig: typing.Optional["HiddenRowsConfig"] = None,
         rowSelectOnCellClick: typing.Optional[bool] = None,
         showSearch: typing.Optional[bool] = None,
         searchValue: typing.Optional[str] = None,
+        searchIndex: typing.Optional[bool] = None,
+        searchResults: typing.Optional["SearchResults"] = None,
+        searchNavigate: typing.Optional["SearchNavigate"] = None,
         columnResize: typing.Optional[bool] = None,
         columnMovable: typing.Optional[bool] = None,
         rowMovable: typing.Optional[bool] = None,
@@ -2031,6 +2606,11 @@ Keyword arguments:
         deletePressed: typing.Optional["DeletePressed"] = None,
         allowDelete: typing.Optional[bool] = None,
         visibleRegion: typing.Optional["VisibleRegion"] = None,
+        rowModel: typing.Optional[Literal["client", "server"]] = None,
+        blockSize: typing.Optional[NumberType] = None,
+        maxCachedBlocks: typing.Optional[NumberType] = None,
+        rowBlockRequest: typing.Optional["RowBlockRequest"] = None,
+        rowBlocks: typing.Optional["RowBlocks"] = None,
         columnMoved: typing.Optional["ColumnMoved"] = None,
         rowMoved: typing.Optional["RowMoved"] = None,
         highlightRegions: typing.Optional[typing.Sequence["HighlightRegions"]] = None,
@@ -2039,10 +2619,11 @@ Keyword arguments:
         scrollToCell: typing.Optional["ScrollToCell"] = None,
         redrawTrigger: typing.Optional[typing.Union[NumberType, str]] = None,
         remeasureColumns: typing.Optional["RemeasureColumns"] = None,
-        showCellFlash: typing.Optional[typing.Union[bool, typing.Sequence[Literal["edit", "paste", "undo", "redo", "copy"]]]] = None,
+        showCellFlash: typing.Optional[typing.Union[bool, typing.Sequence[Literal["edit", "paste", "undo", "redo", "copy", "append", "update"]]]] = None,
         scrollOffsetX: typing.Optional[NumberType] = None,
         scrollOffsetY: typing.Optional[NumberType] = None,
         keybindings: typing.Optional[dict] = None,
+        eventRateLimits: typing.Optional[typing.Dict[typing.Union[str, float, int], typing.Union[NumberType, bool]]] = None,
         isDraggable: typing.Optional[typing.Union[bool, Literal["header", "cell"]]] = None,
         dragStarted: typing.Optional["DragStarted"] = None,
         dragOverCell: typing.Optional["DragOverCell"] = None,
@@ -2051,12 +2632,18 @@ Keyword arguments:
         validateCell: typing.Optional["ValidateCell"] = None,
         coercePasteValue: typing.Optional["CoercePasteValue"] = None,
         getRowThemeOverride: typing.Optional["GetRowThemeOverride"] = None,
+        styleRules: typing.Optional[typing.Sequence["StyleRules"]] = None,
+        styleThemes: typing.Optional[typing.Dict[typing.Union[str, float, int], dict]] = None,
         drawCell: typing.Optional["DrawCell"] = None,
         drawHeader: typing.Optional["DrawHeader"] = None,
         sortable: typing.Optional[bool] = None,
         sortColumns: typing.Optional[typing.Sequence["SortColumns"]] = None,
         sortingOrder: typing.Optional[typing.Sequence[Literal["asc", "desc", None]]] = None,
+        sortMode: typing.Optional[Literal["client", "server"]] = None,
         columnFilters: typing.Optional[typing.Dict[typing.Union[str, float, int], typing.Sequence[typing.Any]]] = None,
+        filterMode: typing.Optional[Literal["client", "server"]] = None,
+        computeWorker: typing.Optional[bool] = None,
+        rowOrder: typing.Optional[typing.Union[typing.Sequence[NumberType], "RowOrder"]] = None,
         headerMenuConfig: typing.Optional["HeaderMenuConfig"] = None,
         visibleRowIndices: typing.Optional[typing.Sequence[NumberType]] = None,
         headerMenuItemClicked: typing.Optional["HeaderMenuItemClicked"] = None,
@@ -2071,22 +2658,23 @@ Keyword arguments:
         columnSelectionMode: typing.Optional[Literal["auto", "multi"]] = None,
         enableUndoRedo: typing.Optional[bool] = None,
         maxUndoSteps: typing.Optional[NumberType] = None,
+        maxUndoBytes: typing.Optional[NumberType] = None,
         undoRedoAction: typing.Optional["UndoRedoAction"] = None,
         canUndo: typing.Optional[bool] = None,
         canRedo: typing.Optional[bool] = None,
         undoRedoPerformed: typing.Optional["UndoRedoPerformed"] = None,
         **kwargs
     ):
-        self._prop_names = ['id', 'allowDelete', 'allowedFillDirections', 'buttonClicked', 'canRedo', 'canUndo', 'cellActivated', 'cellActivationBehavior', 'cellClicked', 'cellEdited', 'cellsEdited', 'className', 'coercePasteValue', 'columnFilters', 'columnMovable', 'columnMoved', 'columnResize', 'columnSelect', 'columnSelectionBlending', 'columnSelectionMode', 'columnWidths', 'columns', 'contextMenu', 'contextMenuConfig', 'contextMenuItemClicked', 'contextMenuScrollBehavior', 'copyHeaders', 'data', 'deletePressed', 'dragOverCell', 'dragStarted', 'drawCell', 'drawFocusRing', 'drawHeader', 'droppedOnCell', 'editOnType', 'editorScrollBehavior', 'enableCopyPaste', 'enableUndoRedo', 'experimental', 'fillHandle', 'fixedShadowX', 'fixedShadowY', 'freezeColumns', 'freezeTrailingRows', 'getRowThemeOverride', 'groupHeaderClicked', 'groupHeaderHeight', 'headerClicked', 'headerContextMenu', 'headerHeight', 'headerMenuClicked', 'headerMenuConfig', 'headerMenuItemClicked', 'height', 'hiddenRows', 'hiddenRowsConfig', 'highlightRegions', 'hoverRow', 'isDraggable', 'itemHovered', 'keybindings', 'linkClicked', 'maxColumnAutoWidth', 'maxColumnWidth', 'maxUndoSteps', 'minColumnWidth', 'mouseMove', 'nClicks', 'overscrollX', 'overscrollY', 'preventDiagonalScrolling', 'rangeSelect', 'rangeSelectionBlending', 'rangeSelectionColumnSpanning', 'readonly', 'redrawTrigger', 'remeasureColumns', 'rowAppended', 'rowHeight', 'rowMarkerStartIndex', 'rowMarkerTheme', 'rowMarkerWidth', 'rowMarkers', 'rowMovable', 'rowMoved', 'rowSelect', 'rowSelectOnCellClick', 'rowSelectionBlending', 'rowSelectionMode', 'rows', 'scaleToRem', 'scrollOffsetX', 'scrollOffsetY', 'scrollToActiveCell', 'scrollToCell', 'searchValue', 'selectedCell', 'selectedColumns', 'selectedRange', 'selectedRanges', 'selectedRows', 'selectionColumnMin', 'showCellFlash', 'showSearch', 'smoothScrollX', 'smoothScrollY', 'sortColumns', 'sortable', 'sortingOrder', 'spanRangeBehavior', 'style', 'tabWrapping', 'theme', 'trailingRowOptions', 'trapFocus', 'treeNodeToggled', 'undoRedoAction', 'undoRedoPerformed', 'unselectableColumns', 'unselectableRows', 'validateCell', 'verticalBorder', 'visibleRegion', 'visibleRowIndices', 'width']
+        self._prop_names = ['id', 'allowDelete', 'allowedFillDirections', 'appendRows', 'blockSize', 'buttonClicked', 'canRedo', 'canUndo', 'cellActivated', 'cellActivationBehavior', 'cellClicked', 'cellEdited', 'cellUpdates', 'cellsEdited', 'className', 'coercePasteValue', 'columnFilters', 'columnMovable', 'columnMoved', 'columnResize', 'columnSelect', 'columnSelectionBlending', 'columnSelectionMode', 'columnWidths', 'columns', 'computeWorker', 'contextMenu', 'contextMenuConfig', 'contextMenuItemClicked', 'contextMenuScrollBehavior', 'copyHeaders', 'data', 'dataColumns', 'dataPatch', 'dataRevision', 'dataSyncMode', 'deletePressed', 'dragOverCell', 'dragStarted', 'drawCell', 'drawFocusRing', 'drawHeader', 'droppedOnCell', 'editOnType', 'editorScrollBehavior', 'enableCopyPaste', 'enableUndoRedo', 'eventRateLimits', 'experimental', 'fillHandle', 'filterMode', 'fixedShadowX', 'fixedShadowY', 'freezeColumns', 'freezeTrailingRows', 'getRowThemeOverride', 'groupHeaderClicked', 'groupHeaderHeight', 'headerClicked', 'headerContextMenu', 'headerHeight', 'headerMenuClicked', 'headerMenuConfig', 'headerMenuItemClicked', 'height', 'hiddenRows', 'hiddenRowsConfig', 'hiddenRowsMode', 'highlightRegions', 'hoverRow', 'isDraggable', 'itemHovered', 'keybindings', 'linkClicked', 'maxCachedBlocks', 'maxColumnAutoWidth', 'maxColumnWidth', 'maxRows', 'maxUndoBytes', 'maxUndoSteps', 'minColumnWidth', 'mouseMove', 'nClicks', 'overscrollX', 'overscrollY', 'preventDiagonalScrolling', 'rangeSelect', 'rangeSelectionBlending', 'rangeSelectionColumnSpanning', 'readonly', 'redrawTrigger', 'remeasureColumns', 'rowAppended', 'rowBlockRequest', 'rowBlocks', 'rowHeight', 'rowHeights', 'rowMarkerStartIndex', 'rowMarkerTheme', 'rowMarkerWidth', 'rowMarkers', 'rowModel', 'rowMovable', 'rowMoved', 'rowOrder', 'rowSelect', 'rowSelectOnCellClick', 'rowSelectionBlending', 'rowSelectionMode', 'rows', 'scaleToRem', 'scrollOffsetX', 'scrollOffsetY', 'scrollToActiveCell', 'scrollToCell', 'searchIndex', 'searchNavigate', 'searchResults', 'searchValue', 'selectedCell', 'selectedColumns', 'selectedRange', 'selectedRanges', 'selectedRows', 'selectionColumnMin', 'showCellFlash', 'showSearch', 'smoothScrollX', 'smoothScrollY', 'sortColumns', 'sortMode', 'sortable', 'sortingOrder', 'spanRangeBehavior', 'style', 'styleRules', 'styleThemes', 'tabWrapping', 'theme', 'trailingRowOptions', 'trapFocus', 'treeNodeToggled', 'undoRedoAction', 'undoRedoPerformed', 'unselectableColumns', 'unselectableRows', 'validateCell', 'verticalBorder', 'visibleRegion', 'visibleRowIndices', 'width']
         self._valid_wildcard_attributes =            []
-        self.available_properties = ['id', 'allowDelete', 'allowedFillDirections', 'buttonClicked', 'canRedo', 'canUndo', 'cellActivated', 'cellActivationBehavior', 'cellClicked', 'cellEdited', 'cellsEdited', 'className', 'coercePasteValue', 'columnFilters', 'columnMovable', 'columnMoved', 'columnResize', 'columnSelect', 'columnSelectionBlending', 'columnSelectionMode', 'columnWidths', 'columns', 'contextMenu', 'contextMenuConfig', 'contextMenuItemClicked', 'contextMenuScrollBehavior', 'copyHeaders', 'data', 'deletePressed', 'dragOverCell', 'dragStarted', 'drawCell', 'drawFocusRing', 'drawHeader', 'droppedOnCell', 'editOnType', 'editorScrollBehavior', 'enableCopyPaste', 'enableUndoRedo', 'experimental', 'fillHandle', 'fixedShadowX', 'fixedShadowY', 'freezeColumns', 'freezeTrailingRows', 'getRowThemeOverride', 'groupHeaderClicked', 'groupHeaderHeight', 'headerClicked', 'headerContextMenu', 'headerHeight', 'headerMenuClicked', 'headerMenuConfig', 'headerMenuItemClicked', 'height', 'hiddenRows', 'hiddenRowsConfig', 'highlightRegions', 'hoverRow', 'isDraggable', 'itemHovered', 'keybindings', 'linkClicked', 'maxColumnAutoWidth', 'maxColumnWidth', 'maxUndoSteps', 'minColumnWidth', 'mouseMove', 'nClicks', 'overscrollX', 'overscrollY', 'preventDiagonalScrolling', 'rangeSelect', 'rangeSelectionBlending', 'rangeSelectionColumnSpanning', 'readonly', 'redrawTrigger', 'remeasureColumns', 'rowAppended', 'rowHeight', 'rowMarkerStartIndex', 'rowMarkerTheme', 'rowMarkerWidth', 'rowMarkers', 'rowMovable', 'rowMoved', 'rowSelect', 'rowSelectOnCellClick', 'rowSelectionBlending', 'rowSelectionMode', 'rows', 'scaleToRem', 'scrollOffsetX', 'scrollOffsetY', 'scrollToActiveCell', 'scrollToCell', 'searchValue', 'selectedCell', 'selectedColumns', 'selectedRange', 'selectedRanges', 'selectedRows', 'selectionColumnMin', 'showCellFlash', 'showSearch', 'smoothScrollX', 'smoothScrollY', 'sortColumns', 'sortable', 'sortingOrder', 'spanRangeBehavior', 'style', 'tabWrapping', 'theme', 'trailingRowOptions', 'trapFocus', 'treeNodeToggled', 'undoRedoAction', 'undoRedoPerformed', 'unselectableColumns', 'unselectableRows', 'validateCell', 'verticalBorder', 'visibleRegion', 'visibleRowIndices', 'width']
+        self.available_properties = ['id', 'allowDelete', 'allowedFillDirections', 'appendRows', 'blockSize', 'buttonClicked', 'canRedo', 'canUndo', 'cellActivated', 'cellActivationBehavior', 'cellClicked', 'cellEdited', 'cellUpdates', 'cellsEdited', 'className', 'coercePasteValue', 'columnFilters', 'columnMovable', 'columnMoved', 'columnResize', 'columnSelect', 'columnSelectionBlending', 'columnSelectionMode', 'columnWidths', 'columns', 'computeWorker', 'contextMenu', 'contextMenuConfig', 'contextMenuItemClicked', 'contextMenuScrollBehavior', 'copyHeaders', 'data', 'dataColumns', 'dataPatch', 'dataRevision', 'dataSyncMode', 'deletePressed', 'dragOverCell', 'dragStarted', 'drawCell', 'drawFocusRing', 'drawHeader', 'droppedOnCell', 'editOnType', 'editorScrollBehavior', 'enableCopyPaste', 'enableUndoRedo', 'eventRateLimits', 'experimental', 'fillHandle', 'filterMode', 'fixedShadowX', 'fixedShadowY', 'freezeColumns', 'freezeTrailingRows', 'getRowThemeOverride', 'groupHeaderClicked', 'groupHeaderHeight', 'headerClicked', 'headerContextMenu', 'headerHeight', 'headerMenuClicked', 'headerMenuConfig', 'headerMenuItemClicked', 'height', 'hiddenRows', 'hiddenRowsConfig', 'hiddenRowsMode', 'highlightRegions', 'hoverRow', 'isDraggable', 'itemHovered', 'keybindings', 'linkClicked', 'maxCachedBlocks', 'maxColumnAutoWidth', 'maxColumnWidth', 'maxRows', 'maxUndoBytes', 'maxUndoSteps', 'minColumnWidth', 'mouseMove', 'nClicks', 'overscrollX', 'overscrollY', 'preventDiagonalScrolling', 'rangeSelect', 'rangeSelectionBlending', 'rangeSelectionColumnSpanning', 'readonly', 'redrawTrigger', 'remeasureColumns', 'rowAppended', 'rowBlockRequest', 'rowBlocks', 'rowHeight', 'rowHeights', 'rowMarkerStartIndex', 'rowMarkerTheme', 'rowMarkerWidth', 'rowMarkers', 'rowModel', 'rowMovable', 'rowMoved', 'rowOrder', 'rowSelect', 'rowSelectOnCellClick', 'rowSelectionBlending', 'rowSelectionMode', 'rows', 'scaleToRem', 'scrollOffsetX', 'scrollOffsetY', 'scrollToActiveCell', 'scrollToCell', 'searchIndex', 'searchNavigate', 'searchResults', 'searchValue', 'selectedCell', 'selectedColumns', 'selectedRange', 'selectedRanges', 'selectedRows', 'selectionColumnMin', 'showCellFlash', 'showSearch', 'smoothScrollX', 'smoothScrollY', 'sortColumns', 'sortMode', 'sortable', 'sortingOrder', 'spanRangeBehavior', 'style', 'styleRules', 'styleThemes', 'tabWrapping', 'theme', 'trailingRowOptions', 'trapFocus', 'treeNodeToggled', 'undoRedoAction', 'undoRedoPerformed', 'unselectableColumns', 'unselectableRows', 'validateCell', 'verticalBorder', 'visibleRegion', 'visibleRowIndices', 'width']
         self.available_wildcard_properties =            []
         _explicit_args = kwargs.pop('_explicit_args')
         _locals = locals()
         _locals.update(kwargs)  # For wildcard attrs and excess named props
         args = {k: _locals[k] for k in _explicit_args}
 
-        for k in ['columns', 'data']:
+        for k in ['columns']:
             if k not in args:
                 raise TypeError(
                     'Required argument `' + k + '` was not specified.')
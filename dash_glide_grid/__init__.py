@@ -10,6 +10,16 @@ import dash as _dash
 from ._imports_ import *
 from ._imports_ import __all__
 
+from .data_patch import apply_data_patch, data_patch_to_dash_patch
+from .dataframe import (
+    dataframe_to_columns,
+    decode_columns,
+    encode_typed_column,
+    from_dataframe as _from_dataframe,
+)
+from .row_blocks import RowBlockProvider
+from .row_order import compute_row_order, filter_mask, get_window, sort_order
+
 if not hasattr(_dash, '__plotly_dash') and not hasattr(_dash, 'development'):
     print('Dash was not successfully imported. '
           'Make sure you don\'t have a file '
@@ -85,3 +95,5 @@ _css_dist = []
 for _component in __all__:
     setattr(locals()[_component], '_js_dist', _js_dist)
     setattr(locals()[_component], '_css_dist', _css_dist)
+
+GlideGrid.from_dataframe = classmethod(_from_dataframe)
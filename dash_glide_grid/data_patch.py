@@ -0,0 +1,161 @@
+"""
+Helpers for applying ``dataPatch`` events on the server.
+
+When ``dataSyncMode="patch"`` the grid no longer sends the full ``data`` array
+back to Dash after each edit. Instead it emits a compact ``dataPatch``:
+
+    {
+        "edits": [{"row": 0, "col": 1, "columnId": "price", "oldValue": 10, "value": 12}],
+        "source": "edit",
+        "timestamp": 1234567890
+    }
+
+Rows are data row indices (unaffected by sorting/filtering), so the edits can be
+applied directly to the server-side copy of the data.
+
+Columns sent in the binary encoding (``{"dtype": ..., "data": "<base64>"}``, see
+``dataframe.py``) can't be patched value by value: they are decoded, edited and
+re-encoded as a whole. A column falls back to a plain list if an edited value
+doesn't fit its dtype, as it does in the browser.
+"""
+
+from dash import Patch
+
+from .dataframe import TYPED_DTYPES, decode_typed_column
+
+
+def _iter_edits(data_patch):
+    if not data_patch:
+        return []
+    return data_patch.get("edits") or []
+
+
+def _is_binary_column(column):
+    return isinstance(column, dict) and column.get("dtype") in TYPED_DTYPES
+
+
+def _fits_dtype(array, value):
+    """Whether ``value`` can be stored in a typed array unchanged (blanks only fit float arrays as NaN)."""
+    import numpy as np
+
+    if value is None or value == "":
+        return array.dtype.kind == "f"
+    if isinstance(value, bool) or not isinstance(value, (int, float, np.integer, np.floating)):
+        return False
+    if value != value:
+        return False
+    try:
+        return bool(np.array([value]).astype(array.dtype)[0] == value)
+    except (OverflowError, ValueError):
+        return False
+
+
+def _patch_binary_column(column, edits):
+    """Apply ``(row, value)`` edits to a binary column.
+
+    Returns:
+        The re-encoded column with the same dtype, or a plain list if a value
+        doesn't fit the dtype.
+    """
+    import base64
+
+    array = decode_typed_column(column)
+    if all(_fits_dtype(array, value) for _, value in edits):
+        for row, value in edits:
+            array[row] = float("nan") if value is None or value == "" else value
+        return {"dtype": column["dtype"], "data": base64.b64encode(array.tobytes()).decode("ascii")}
+
+    values = [None if value != value else value for value in array.tolist()]
+    for row, value in edits:
+        values[row] = value
+    return values
+
+
+def _edits_by_column(edits):
+    grouped = {}
+    for edit in edits:
+        grouped.setdefault(edit["columnId"], []).append((edit["row"], edit.get("value")))
+    return grouped
+
+
+def data_patch_to_dash_patch(data_patch, patch=None, columnar=False, data_columns=None):
+    """Convert a ``dataPatch`` event into a :class:`dash.Patch` for the ``data`` prop.
+
+    Returning the result as ``Output(grid_id, "data")`` keeps Dash's copy of
+    ``data`` in sync without sending the whole dataset over the wire.
+
+    Args:
+        data_patch: The ``dataPatch`` prop value emitted by the grid.
+        patch: Optional existing ``Patch`` to add the edits to.
+        columnar: Set to True to build a patch for ``dataColumns`` instead of ``data``.
+        data_columns: The current ``dataColumns`` value (e.g. from a ``State``).
+            Required when any column uses the binary encoding: those columns are
+            replaced as a whole (re-encoded, or as a list if a value no longer
+            fits the dtype). Without it, every column is assumed to be a list.
+
+    Returns:
+        A ``dash.Patch`` with one assignment per edited cell (per edited column
+        for binary columns).
+    """
+    if patch is None:
+        patch = Patch()
+    edits = _iter_edits(data_patch)
+
+    if not columnar:
+        for edit in edits:
+            patch[edit["row"]][edit["columnId"]] = edit.get("value")
+        return patch
+
+    for column_id, column_edits in _edits_by_column(edits).items():
+        column = data_columns.get(column_id) if data_columns else None
+        if _is_binary_column(column):
+            patch[column_id] = _patch_binary_column(column, column_edits)
+            continue
+        for row, value in column_edits:
+            patch[column_id][row] = value
+    return patch
+
+
+def apply_data_patch(target, data_patch):
+    """Apply a ``dataPatch`` event in place to a DataFrame, list of records or columnar dict.
+
+    For a DataFrame, ``row`` is treated as a positional index and ``columnId``
+    as a column label, or as the stringified label (``from_dataframe`` sends
+    non-string labels such as ``0`` as ``"0"``). Edits to columns that don't
+    exist are skipped.
+
+    In a columnar dict, binary columns are decoded, edited and re-encoded (or
+    replaced by a list if a value no longer fits the dtype).
+
+    Args:
+        target: A pandas DataFrame, a list of row dicts (``data``) or a dict of
+            column lists (``dataColumns``).
+        data_patch: The ``dataPatch`` prop value emitted by the grid.
+
+    Returns:
+        The same ``target`` object, for convenience.
+    """
+    edits = _iter_edits(data_patch)
+
+    if hasattr(target, "iat") and hasattr(target, "columns"):
+        label_by_id = {str(label): label for label in target.columns}
+        for edit in edits:
+            column_id = edit["columnId"]
+            label = column_id if column_id in target.columns else label_by_id.get(str(column_id))
+            if label is None:
+                continue
+            target.iat[edit["row"], target.columns.get_loc(label)] = edit.get("value")
+        return target
+
+    if isinstance(target, dict):
+        for column_id, column_edits in _edits_by_column(edits).items():
+            if _is_binary_column(target[column_id]):
+                target[column_id] = _patch_binary_column(target[column_id], column_edits)
+                continue
+            for row, value in column_edits:
+                target[column_id][row] = value
+        return target
+
+    for edit in edits:
+        target[edit["row"]][edit["columnId"]] = edit.get("value")
+    return target
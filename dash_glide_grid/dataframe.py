@@ -0,0 +1,157 @@
+"""
+Helpers for building grids straight from pandas DataFrames.
+
+``GlideGrid.from_dataframe(df)`` sends the frame as ``dataColumns``
+(``{"col_id": [values...]}``) instead of ``df.to_dict("records")``, so column
+keys are not repeated for every row and the browser does not allocate one
+object per row.
+
+Numeric columns can also be sent as binary typed arrays
+(``{"dtype": "float64", "data": "<base64>"}``). The browser wraps the bytes in a
+``Float64Array``/``Int32Array`` view instead of parsing one JSON number per value.
+
+pandas and numpy are not dependencies of dash-glide-grid; these helpers only use
+the API of the objects passed in and import numpy lazily.
+"""
+
+import base64
+
+# dtypes the grid can decode into a JS typed array
+TYPED_DTYPES = ("float64", "float32", "int32", "int16", "int8", "uint32", "uint16", "uint8")
+
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+_MAX_SAFE_INTEGER = 2**53
+
+
+def _column_values(series):
+    """Convert a Series to a JSON-friendly list (NaN/NaT become None)."""
+    kind = series.dtype.kind
+
+    if kind == "M":
+        # Datetimes are sent as ISO strings, the format the date-picker cell and sorting expect
+        return [value.isoformat() if value == value else None for value in series]
+
+    if kind in "iub":
+        return series.tolist()
+
+    mask = series.isna()
+    if not mask.any():
+        return series.tolist()
+    return series.astype(object).where(~mask, None).tolist()
+
+
+def _typed_dtype(array):
+    """Pick the typed-array dtype for a numeric array, or None if it can't be sent as binary."""
+    import numpy as np
+
+    dtype = array.dtype
+    if dtype.kind == "f":
+        return "float64" if dtype.itemsize > 4 else "float32"
+    if dtype.kind in "iu":
+        name = np.dtype(dtype.kind + str(dtype.itemsize)).name
+        if name in TYPED_DTYPES:
+            return name
+        # 64-bit integers: narrow to int32 if the values fit, else float64 if exact
+        if array.size == 0:
+            return "int32"
+        low, high = int(array.min()), int(array.max())
+        if _INT32_MIN <= low and high <= _INT32_MAX:
+            return "int32"
+        if -_MAX_SAFE_INTEGER <= low and high <= _MAX_SAFE_INTEGER:
+            return "float64"
+    return None
+
+
+def encode_typed_column(values):
+    """Encode a numeric array as a binary ``dataColumns`` column.
+
+    Args:
+        values: A NumPy array, pandas Series or list of numbers.
+
+    Returns:
+        ``{"dtype": ..., "data": <base64 little-endian bytes>}``, or None if the
+        values are not numeric (booleans and objects are not encoded).
+    """
+    import numpy as np
+
+    array = np.asarray(values)
+    dtype = _typed_dtype(array)
+    if dtype is None:
+        return None
+    raw = array.astype(np.dtype(dtype).newbyteorder("<"), copy=False).tobytes()
+    return {"dtype": dtype, "data": base64.b64encode(raw).decode("ascii")}
+
+
+def decode_typed_column(column):
+    """Decode a binary ``dataColumns`` column back into a (writable) NumPy array.
+
+    Plain lists are returned unchanged.
+    """
+    if not (isinstance(column, dict) and column.get("dtype") in TYPED_DTYPES):
+        return column
+
+    import numpy as np
+
+    dtype = np.dtype(column["dtype"]).newbyteorder("<")
+    return np.frombuffer(base64.b64decode(column["data"]), dtype=dtype).copy()
+
+
+def decode_columns(data_columns):
+    """Decode every binary column in a ``dataColumns`` dict (e.g. from a callback State).
+
+    The result can be passed straight to ``pd.DataFrame``.
+    """
+    return {column_id: decode_typed_column(column) for column_id, column in data_columns.items()}
+
+
+def dataframe_to_columns(df, columns=None, binary=False):
+    """Convert a DataFrame into the ``dataColumns`` format.
+
+    Args:
+        df: A pandas DataFrame.
+        columns: Optional list of column labels to include. Defaults to all columns.
+        binary: If True, numeric columns are sent as binary typed arrays.
+
+    Returns:
+        A dict of column id (stringified column label) -> list of values
+        (or binary column).
+    """
+    labels = list(df.columns) if columns is None else list(columns)
+    result = {}
+    for label in labels:
+        series = df[label]
+        encoded = encode_typed_column(series.to_numpy()) if binary and series.dtype.kind in "iuf" else None
+        result[str(label)] = encoded if encoded is not None else _column_values(series)
+    return result
+
+
+def from_dataframe(cls, df, columns=None, index=False, binary=False, **kwargs):
+    """Create a GlideGrid from a pandas DataFrame using columnar data.
+
+    Args:
+        df: A pandas DataFrame.
+        columns: Optional list of column definitions. Defaults to one text column
+            per DataFrame column (``{"title": label, "id": label}``). Only the
+            columns listed here are sent to the browser.
+        index: If True, include the DataFrame index as the first column.
+        binary: If True, numeric columns are sent as binary typed arrays
+            (float NaN is shown as an empty cell).
+        **kwargs: Any other GlideGrid props.
+
+    Returns:
+        A GlideGrid component with ``dataColumns`` set.
+
+    Example:
+        grid = GlideGrid.from_dataframe(df, id="grid", height=500)
+    """
+    if index:
+        df = df.reset_index()
+
+    if columns is None:
+        columns = [{"title": str(label), "id": str(label)} for label in df.columns]
+
+    label_by_id = {str(label): label for label in df.columns}
+    column_ids = [col.get("id") or col.get("title") for col in columns]
+    labels = [label_by_id[col_id] for col_id in column_ids if col_id in label_by_id]
+
+    return cls(columns=columns, dataColumns=dataframe_to_columns(df, labels, binary=binary), **kwargs)
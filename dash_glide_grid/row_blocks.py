@@ -0,0 +1,161 @@
+"""
+Server-side row provider for ``rowModel="server"``.
+
+With the server row model the grid only knows the total row count. As the user
+scrolls it emits ``rowBlockRequest`` for the rows around the viewport, and the
+server answers through the ``rowBlocks`` prop:
+
+    provider = RowBlockProvider(df, block_size=100)
+
+    @callback(
+        Output("grid", "rowBlocks"),
+        Input("grid", "rowBlockRequest"),
+    )
+    def serve_rows(request):
+        return provider.handle_request(request)
+
+The grid's ``blockSize`` should match the provider's ``block_size`` so requests
+line up with cached blocks. Requests carry the grid's ``sortColumns`` and
+``columnFilters``, and blocks are served in that order.
+"""
+
+import json
+from collections import OrderedDict
+
+from .data_patch import apply_data_patch
+from .dataframe import dataframe_to_columns
+from .row_order import filter_mask, sort_order
+
+
+class RowBlockProvider:
+    """Slice a DataFrame into row blocks for the grid, with an LRU cache of serialized blocks.
+
+    Args:
+        df: The pandas DataFrame to serve.
+        block_size: Number of rows per block. Should match the grid's ``blockSize``.
+        cache_size: Maximum number of serialized blocks to keep.
+        columnar: If True, blocks are sent as ``dataColumns`` instead of records.
+        columns: The grid's ``columns`` definitions, used to map the column indices
+            in ``sortColumns``/``columnFilters`` to DataFrame columns. Defaults to
+            the DataFrame's own column order.
+    """
+
+    def __init__(self, df, block_size=100, cache_size=64, columnar=False, columns=None):
+        self.df = df
+        self.block_size = max(1, int(block_size))
+        self.cache_size = max(1, int(cache_size))
+        self.columnar = columnar
+        self.columns = columns
+        self._cache = OrderedDict()
+        # Positional row order for the current sort/filter (None means data order)
+        self._order = None
+        self._order_key = None
+
+    @property
+    def total_rows(self):
+        return len(self.df) if self._order is None else len(self._order)
+
+    def set_view(self, sort_columns=None, column_filters=None):
+        """Sort and filter the served rows. Cached blocks are dropped if the view changed."""
+        key = json.dumps([sort_columns or [], column_filters or {}], sort_keys=True)
+        if key == self._order_key:
+            return
+        self._order_key = key
+        self._cache.clear()
+        if not sort_columns and not column_filters:
+            self._order = None
+            return
+
+        import numpy as np
+
+        rows = np.flatnonzero(filter_mask(self.df, column_filters, self.columns))
+        self._order = sort_order(self.df, sort_columns, self.columns, rows=rows)
+
+    def set_dataframe(self, df):
+        """Replace the served DataFrame and drop all cached blocks."""
+        self.df = df
+        self._order = None
+        self._order_key = None
+        self.invalidate()
+
+    def invalidate(self, blocks=None):
+        """Drop cached blocks (all of them, or the given block indices)."""
+        if blocks is None:
+            self._cache.clear()
+            return
+        for block in blocks:
+            self._cache.pop(block, None)
+
+    def _serialize(self, frame):
+        columns = dataframe_to_columns(frame)
+        if self.columnar:
+            return columns
+        keys = list(columns)
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+    def _block(self, block):
+        payload = self._cache.get(block)
+        if payload is not None:
+            self._cache.move_to_end(block)
+            return payload
+
+        start = block * self.block_size
+        if self._order is None:
+            frame = self.df.iloc[start:start + self.block_size]
+        else:
+            frame = self.df.iloc[self._order[start:start + self.block_size]]
+        payload = self._serialize(frame)
+        self._cache[block] = payload
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return payload
+
+    def get_rows(self, start_row, end_row, generation=None):
+        """Build a ``rowBlocks`` value for rows ``[start_row, end_row)``.
+
+        The range is widened to whole blocks so every block the grid asked for is complete.
+        """
+        total = self.total_rows
+        first_block = max(0, int(start_row)) // self.block_size
+        last_block = (min(int(end_row), total) - 1) // self.block_size
+
+        if self.columnar:
+            rows = {str(label): [] for label in self.df.columns}
+            for block in range(first_block, last_block + 1):
+                for column_id, values in self._block(block).items():
+                    rows[column_id].extend(values)
+            payload = {"dataColumns": rows}
+        else:
+            rows = []
+            for block in range(first_block, last_block + 1):
+                rows.extend(self._block(block))
+            payload = {"data": rows}
+
+        payload["startRow"] = first_block * self.block_size
+        payload["totalRows"] = total
+        if generation is not None:
+            payload["generation"] = generation
+        return payload
+
+    def handle_request(self, request):
+        """Answer a ``rowBlockRequest`` event with a ``rowBlocks`` value."""
+        if not request:
+            return self.get_rows(0, self.block_size)
+        self.set_view(request.get("sortColumns"), request.get("columnFilters"))
+        return self.get_rows(
+            request.get("startRow", 0),
+            request.get("endRow", self.block_size),
+            generation=request.get("generation"),
+        )
+
+    def apply_patch(self, data_patch):
+        """Apply a ``dataPatch`` event to the DataFrame and drop the blocks it touched.
+
+        Edit rows are positions in the served (sorted/filtered) order and are mapped
+        back to DataFrame rows.
+        """
+        edits = (data_patch or {}).get("edits") or []
+        if self._order is not None:
+            edits = [dict(edit, row=int(self._order[edit["row"]])) for edit in edits]
+        apply_data_patch(self.df, {"edits": edits})
+        self.invalidate({edit["row"] // self.block_size for edit in (data_patch or {}).get("edits") or []})
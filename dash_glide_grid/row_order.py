@@ -0,0 +1,176 @@
+"""
+Server-side sorting and filtering for ``sortMode="server"`` / ``filterMode="server"``.
+
+In these modes the grid emits ``sortColumns`` and ``columnFilters`` but keeps its
+rows in place. The server computes the order with vectorized pandas/numpy and
+answers with a ``rowOrder`` (data row indices in display order):
+
+    @callback(
+        Output("grid", "rowOrder"),
+        Input("grid", "sortColumns"),
+        Input("grid", "columnFilters"),
+    )
+    def sort_rows(sort_columns, column_filters):
+        return compute_row_order(df, sort_columns, column_filters, COLUMNS, binary=True)
+
+The ordering follows the grid's own sort: numbers compare numerically, strings
+case-insensitively, blanks sort after all values (so first when descending) and
+ties keep their data order. One difference: the grid compares strings with the
+browser's ``Intl.Collator``, while this module compares lowercased code points,
+so accented letters and punctuation can sort differently (``"é"`` sorts after
+``"z"`` here but between ``"e"`` and ``"f"`` in the grid).
+
+Filter values are matched like the filter menu's, against the values as
+``from_dataframe`` sends them (datetimes as ISO strings), with ``"(Blank)"``
+standing for empty cells.
+"""
+
+from .dataframe import _column_values, encode_typed_column
+
+BLANK = "(Blank)"
+
+
+def _column_label(df, columns, col_index):
+    """Map a grid column index to a DataFrame column label, or None if it isn't in the frame."""
+    if columns is None:
+        return df.columns[col_index] if 0 <= col_index < len(df.columns) else None
+    if not 0 <= col_index < len(columns):
+        return None
+    column_id = columns[col_index].get("id") or columns[col_index].get("title")
+    for label in df.columns:
+        if str(label) == column_id:
+            return label
+    return None
+
+
+def _blank_mask(series):
+    mask = series.isna()
+    if series.dtype.kind == "O":
+        mask |= series.eq("")
+    return mask.to_numpy()
+
+
+def _sent_values(series):
+    """The column as the grid holds it: datetimes become the ISO strings ``from_dataframe`` sends."""
+    if series.dtype.kind == "M":
+        return type(series)(_column_values(series), index=series.index, dtype=object)
+    return series
+
+
+def filter_mask(df, column_filters, columns=None):
+    """Build a boolean mask of the rows that pass ``columnFilters``.
+
+    Args:
+        df: A pandas DataFrame.
+        column_filters: The grid's ``columnFilters`` prop (column index -> selected values).
+        columns: The grid's ``columns`` definitions, used to map column indices to
+            DataFrame columns. Defaults to the DataFrame's own column order.
+
+    Returns:
+        A numpy bool array with one entry per row.
+    """
+    import numpy as np
+
+    mask = np.ones(len(df), dtype=bool)
+    for col_index, selected in (column_filters or {}).items():
+        label = _column_label(df, columns, int(col_index))
+        if label is None:
+            continue
+        if not selected:
+            # An empty selection filters out everything, as in the grid
+            return np.zeros(len(df), dtype=bool)
+
+        series = df[label]
+        values = [value for value in selected if value != BLANK]
+        column_mask = _sent_values(series).isin(values).to_numpy()
+        if len(values) < len(selected):
+            column_mask = column_mask | _blank_mask(series)
+        mask &= column_mask
+    return mask
+
+
+def _sort_codes(series, descending):
+    """Rank a column into integer codes; blanks get the highest code."""
+    import numpy as np
+
+    blank = _blank_mask(series)
+    if series.dtype.kind in "iufbM":
+        values = series.to_numpy()
+    else:
+        values = series.astype(str).str.lower().to_numpy()
+
+    codes = np.empty(len(series), dtype=np.int64)
+    _, inverse = np.unique(values[~blank], return_inverse=True)
+    codes[~blank] = inverse
+    top = inverse.max() + 1 if inverse.size else 0
+    codes[blank] = top
+    return top - codes if descending else codes
+
+
+def sort_order(df, sort_columns, columns=None, rows=None):
+    """Compute the multi-column sort order with a single ``numpy.lexsort``.
+
+    Args:
+        df: A pandas DataFrame.
+        sort_columns: The grid's ``sortColumns`` prop.
+        columns: The grid's ``columns`` definitions (see :func:`filter_mask`).
+        rows: Optional array of positional row indices to sort (e.g. the rows that
+            passed the filters). Defaults to all rows.
+
+    Returns:
+        A numpy int array of positional row indices in display order.
+    """
+    import numpy as np
+
+    if rows is None:
+        rows = np.arange(len(df))
+    frame = df.iloc[rows]
+
+    keys = []
+    for sort_col in sort_columns or []:
+        label = _column_label(df, columns, int(sort_col["columnIndex"]))
+        if label is not None:
+            keys.append(_sort_codes(frame[label], sort_col.get("direction") == "desc"))
+    if not keys:
+        return np.asarray(rows)
+
+    # lexsort treats the last key as the primary one, and is stable for ties
+    return np.asarray(rows)[np.lexsort(keys[::-1])]
+
+
+def compute_row_order(df, sort_columns=None, column_filters=None, columns=None, binary=False):
+    """Filter and sort a DataFrame, returning the grid's ``rowOrder``.
+
+    Args:
+        df: A pandas DataFrame holding the same rows as the grid's data.
+        sort_columns: The grid's ``sortColumns`` prop.
+        column_filters: The grid's ``columnFilters`` prop.
+        columns: The grid's ``columns`` definitions (see :func:`filter_mask`).
+        binary: If True, return a binary int32 column instead of a list.
+
+    Returns:
+        A list of row indices, a binary column, or None when there is nothing to
+        sort or filter (rows are shown in data order).
+    """
+    import numpy as np
+
+    if not sort_columns and not column_filters:
+        return None
+
+    rows = np.flatnonzero(filter_mask(df, column_filters, columns))
+    order = sort_order(df, sort_columns, columns, rows=rows).astype(np.int32)
+    return encode_typed_column(order) if binary else order.tolist()
+
+
+def get_window(df, sort_columns=None, column_filters=None, columns=None, start_row=0, end_row=None):
+    """Sort and filter a DataFrame, returning only rows ``[start_row, end_row)`` of the result.
+
+    Returns:
+        A ``(window, total_rows)`` tuple, where ``window`` is a DataFrame slice and
+        ``total_rows`` is the number of rows after filtering.
+    """
+    import numpy as np
+
+    rows = np.flatnonzero(filter_mask(df, column_filters, columns))
+    order = sort_order(df, sort_columns, columns, rows=rows)
+    return df.iloc[order[start_row:end_row]], len(order)
@@ -0,0 +1,75 @@
+"""
+Example: Server Row Model
+
+Demonstrates rowModel="server" for datasets too large to send to the browser.
+- The grid only receives the total row count up front
+- Scrolling emits rowBlockRequest for the blocks around the viewport
+- RowBlockProvider slices the DataFrame and answers with rowBlocks
+- Edits come back as dataPatch and are applied to the server DataFrame
+"""
+
+import dash
+from dash import html, callback, Input, Output
+import numpy as np
+import pandas as pd
+import dash_glide_grid as dgg
+
+app = dash.Dash(__name__)
+
+N_ROWS = 5_000_000
+BLOCK_SIZE = 200
+
+rng = np.random.default_rng(0)
+DF = pd.DataFrame({
+    "id": np.arange(N_ROWS),
+    "symbol": rng.choice(["AAPL", "MSFT", "GOOG", "AMZN"], N_ROWS),
+    "price": rng.uniform(10, 500, N_ROWS).round(2),
+    "qty": rng.integers(1, 1000, N_ROWS),
+})
+
+PROVIDER = dgg.RowBlockProvider(DF, block_size=BLOCK_SIZE)
+
+COLUMNS = [
+    {"title": "ID", "id": "id", "width": 100},
+    {"title": "Symbol", "id": "symbol", "width": 100},
+    {"title": "Price", "id": "price", "width": 100},
+    {"title": "Qty", "id": "qty", "width": 100},
+]
+
+app.layout = html.Div([
+    html.H1("Server Row Model Example"),
+    html.P(f"{N_ROWS:,} rows. Only the visible blocks are sent to the browser."),
+
+    dgg.GlideGrid(
+        id="server-grid",
+        columns=COLUMNS,
+        rows=N_ROWS,
+        height=500,
+        rowModel="server",
+        blockSize=BLOCK_SIZE,
+    ),
+
+    html.Pre(id="server-output", style={"marginTop": "20px"}),
+], style={"padding": "20px"})
+
+
+@callback(
+    Output("server-grid", "rowBlocks"),
+    Input("server-grid", "rowBlockRequest"),
+)
+def serve_rows(request):
+    return PROVIDER.handle_request(request)
+
+
+@callback(
+    Output("server-output", "children"),
+    Input("server-grid", "dataPatch"),
+    prevent_initial_call=True,
+)
+def apply_edits(data_patch):
+    PROVIDER.apply_patch(data_patch)
+    return f"Applied {len(data_patch['edits'])} edit(s)"
+
+
+if __name__ == "__main__":
+    app.run(debug=True, port=8069)
@@ -0,0 +1,66 @@
+"""
+Example: Streaming Append
+
+Demonstrates appendRows and maxRows for live feeds.
+- Each tick sends only the new rows, not the whole data
+- maxRows keeps the last 10,000 rows, dropping the oldest
+- New rows flash, and the grid stays pinned to the tail while scrolled to the bottom
+"""
+
+import time
+
+import dash
+from dash import html, dcc, callback, Input, Output
+import numpy as np
+import dash_glide_grid as dgg
+
+app = dash.Dash(__name__)
+
+ROWS_PER_TICK = 20
+MAX_ROWS = 10_000
+
+rng = np.random.default_rng(0)
+
+COLUMNS = [
+    {"title": "Time", "id": "time", "width": 120},
+    {"title": "Symbol", "id": "symbol", "width": 100},
+    {"title": "Price", "id": "price", "width": 100},
+    {"title": "Qty", "id": "qty", "width": 100},
+]
+
+app.layout = html.Div([
+    html.H1("Streaming Append Example"),
+    html.P(f"{ROWS_PER_TICK} new trades per tick, keeping the last {MAX_ROWS:,}."),
+
+    dgg.GlideGrid(
+        id="stream-grid",
+        columns=COLUMNS,
+        data=[],
+        height=500,
+        maxRows=MAX_ROWS,
+        showCellFlash=["append"],
+    ),
+
+    dcc.Interval(id="stream-tick", interval=500),
+], style={"padding": "20px"})
+
+
+@callback(
+    Output("stream-grid", "appendRows"),
+    Input("stream-tick", "n_intervals"),
+)
+def append_trades(_):
+    now = time.strftime("%H:%M:%S")
+    return [
+        {
+            "time": now,
+            "symbol": str(rng.choice(["AAPL", "MSFT", "GOOG", "AMZN"])),
+            "price": round(float(rng.uniform(10, 500)), 2),
+            "qty": int(rng.integers(1, 1000)),
+        }
+        for _ in range(ROWS_PER_TICK)
+    ]
+
+
+if __name__ == "__main__":
+    app.run(debug=True, port=8071)
@@ -0,0 +1,59 @@
+"""
+Example: Sparse Cell Updates
+
+Demonstrates the cellUpdates prop for tick-level updates from a Python callback.
+- Each tick updates a few random prices
+- Only the touched cells are repainted; the full data is never resent
+- No clientside JS or window._glideGridRefs access is needed
+"""
+
+import time
+
+import dash
+from dash import html, dcc, callback, Input, Output
+import numpy as np
+import dash_glide_grid as dgg
+
+app = dash.Dash(__name__)
+
+N_ROWS = 50_000
+UPDATES_PER_TICK = 200
+
+rng = np.random.default_rng(0)
+PRICES = rng.uniform(10, 500, N_ROWS).round(2)
+
+COLUMNS = [
+    {"title": "ID", "id": "id", "width": 100},
+    {"title": "Price", "id": "price", "width": 120},
+]
+
+app.layout = html.Div([
+    html.H1("Sparse Cell Updates Example"),
+    html.P(f"{UPDATES_PER_TICK} random price updates every 100ms across {N_ROWS:,} rows."),
+
+    dgg.GlideGrid(
+        id="ticks-grid",
+        columns=COLUMNS,
+        dataColumns={"id": list(range(N_ROWS)), "price": PRICES.tolist()},
+        height=500,
+    ),
+
+    dcc.Interval(id="ticks-interval", interval=100),
+], style={"padding": "20px"})
+
+
+@callback(
+    Output("ticks-grid", "cellUpdates"),
+    Input("ticks-interval", "n_intervals"),
+)
+def tick(_):
+    rows = rng.integers(0, N_ROWS, UPDATES_PER_TICK)
+    PRICES[rows] = (PRICES[rows] * rng.uniform(0.99, 1.01, UPDATES_PER_TICK)).round(2)
+    return {
+        "updates": [{"row": int(row), "col": "price", "value": float(PRICES[row])} for row in rows],
+        "timestamp": int(time.time() * 1000),
+    }
+
+
+if __name__ == "__main__":
+    app.run(debug=True, port=8072)
@@ -0,0 +1,84 @@
+"""
+Example: Indexed Search
+
+Demonstrates the searchIndex prop on 100k rows x 10 columns (1M cells).
+- Search runs against a per-column trigram index instead of building every cell
+- searchResults reports the match count and positions (as data rows)
+- Previous/Next buttons jump between matches with searchNavigate
+"""
+
+import time
+
+import dash
+from dash import html, dcc, callback, Input, Output, ctx
+import dash_glide_grid as dgg
+
+app = dash.Dash(__name__)
+
+N_ROWS = 100_000
+WORDS = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "theta"]
+
+COLUMNS = [{"title": f"Col {c}", "id": f"c{c}", "width": 120} for c in range(10)]
+DATA_COLUMNS = {
+    f"c{c}": [f"{WORDS[(i + c) % len(WORDS)]} {(i * (c + 1)) % 5000}" for i in range(N_ROWS)]
+    for c in range(10)
+}
+
+app.layout = html.Div([
+    html.H1("Indexed Search Example"),
+    html.Div([
+        dcc.Input(id="search-input", type="text", placeholder="Search...", debounce=False),
+        html.Button("Previous", id="search-prev", style={"marginLeft": "10px"}),
+        html.Button("Next", id="search-next", style={"marginLeft": "5px"}),
+        html.Span(id="search-status", style={"marginLeft": "15px"}),
+    ], style={"marginBottom": "15px"}),
+
+    dgg.GlideGrid(
+        id="search-grid",
+        columns=COLUMNS,
+        dataColumns=DATA_COLUMNS,
+        height=500,
+        searchIndex=True,
+    ),
+], style={"padding": "20px"})
+
+
+@callback(
+    Output("search-grid", "searchValue"),
+    Input("search-input", "value"),
+)
+def set_search(value):
+    return value or ""
+
+
+@callback(
+    Output("search-grid", "searchNavigate"),
+    Input("search-prev", "n_clicks"),
+    Input("search-next", "n_clicks"),
+    prevent_initial_call=True,
+)
+def navigate(_prev, _next):
+    direction = "prev" if ctx.triggered_id == "search-prev" else "next"
+    return {"direction": direction, "timestamp": int(time.time() * 1000)}
+
+
+@callback(
+    Output("search-status", "children"),
+    Input("search-grid", "searchResults"),
+)
+def show_results(results):
+    if not results or not results.get("query"):
+        return ""
+    count = results["count"]
+    current = results.get("current", -1)
+    if count == 0:
+        return "No matches"
+    if current < 0:
+        return f"{count:,} matches"
+    match = results["matches"][current] if current < len(results["matches"]) else None
+    where = f" (data row {match['row']}, column {match['col']})" if match else ""
+    return f"Match {current + 1:,} of {count:,}{where}"
+
+
+if __name__ == "__main__":
+    app.run(debug=True, port=8074)
@@ -0,0 +1,48 @@
+"""
+Example: Per-Row Heights
+
+Demonstrates the rowHeights prop with 200k rows of varying height.
+- Heights come from a data column ("height"), so they follow rows when sorting
+- Heights are resolved once into a lookup table instead of calling a
+  function for every row on every layout
+"""
+
+import dash
+from dash import html
+import numpy as np
+import dash_glide_grid as dgg
+
+app = dash.Dash(__name__)
+
+N_ROWS = 200_000
+
+rng = np.random.default_rng(0)
+HEIGHTS = rng.choice([28, 34, 48, 64], N_ROWS)
+
+COLUMNS = [
+    {"title": "ID", "id": "id", "width": 100},
+    {"title": "Height", "id": "height", "width": 100},
+    {"title": "Value", "id": "value", "width": 120},
+]
+
+app.layout = html.Div([
+    html.H1("Per-Row Heights Example"),
+    html.P(f"{N_ROWS:,} rows with heights taken from the Height column. Click headers to sort."),
+
+    dgg.GlideGrid(
+        id="row-heights-grid",
+        columns=COLUMNS,
+        dataColumns={
+            "id": list(range(N_ROWS)),
+            "height": HEIGHTS.tolist(),
+            "value": rng.uniform(0, 1000, N_ROWS).round(2).tolist(),
+        },
+        rowHeights="height",
+        sortable=True,
+        height=500,
+    ),
+], style={"padding": "20px"})
+
+
+if __name__ == "__main__":
+    app.run(debug=True, port=8075)
@@ -0,0 +1,66 @@
+"""
+Example: Excluding Hidden Row Ranges
+
+Demonstrates hiddenRowsMode="exclude" with range-encoded hiddenRows.
+- 1M rows in 1,000 groups of 1,000 rows; each group is one [start, end] range
+- Collapsed groups are removed from the display order, like filtered rows,
+  so collapsing 999 groups leaves ~1k rows of work instead of 1M
+- Each collapsed group is a single hiddenRows entry
+"""
+
+import dash
+from dash import html, dcc, callback, Input, Output
+import dash_glide_grid as dgg
+
+app = dash.Dash(__name__)
+
+N_GROUPS = 1_000
+GROUP_SIZE = 1_000
+N_ROWS = N_GROUPS * GROUP_SIZE
+
+COLUMNS = [
+    {"title": "Group", "id": "group", "width": 100},
+    {"title": "Row", "id": "row", "width": 100},
+]
+
+app.layout = html.Div([
+    html.H1("Excluding Hidden Row Ranges Example"),
+    html.Div([
+        html.Label("Expanded groups: "),
+        dcc.Dropdown(
+            id="expanded-groups",
+            options=[{"label": f"Group {g}", "value": g} for g in range(N_GROUPS)],
+            value=[0],
+            multi=True,
+            style={"width": "400px", "display": "inline-block", "verticalAlign": "middle"},
+        ),
+    ], style={"marginBottom": "15px"}),
+
+    dgg.GlideGrid(
+        id="ranges-grid",
+        columns=COLUMNS,
+        dataColumns={
+            "group": [row // GROUP_SIZE for row in range(N_ROWS)],
+            "row": list(range(N_ROWS)),
+        },
+        hiddenRowsMode="exclude",
+        height=500,
+    ),
+], style={"padding": "20px"})
+
+
+@callback(
+    Output("ranges-grid", "hiddenRows"),
+    Input("expanded-groups", "value"),
+)
+def collapse_groups(expanded):
+    expanded = set(expanded or [])
+    return [
+        [group * GROUP_SIZE, (group + 1) * GROUP_SIZE - 1]
+        for group in range(N_GROUPS)
+        if group not in expanded
+    ]
+
+
+if __name__ == "__main__":
+    app.run(debug=True, port=8076)
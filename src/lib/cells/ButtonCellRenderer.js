@@ -7,6 +7,7 @@
  * Uses a factory function pattern to inject the callback.
  */
 import { GridCellKind, getMiddleCenterBias } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 /**
  * Draw a rounded rectangle on canvas
@@ -121,7 +122,7 @@ export function createButtonCellRenderer(onButtonClick) {
 
         measure: (ctx, cell, theme) => {
             const { title } = cell.data;
-            const textWidth = ctx.measureText(title ?? "Button").width;
+            const textWidth = measureTextCached(title ?? "Button", ctx).width;
             // Add padding for the button
             return textWidth + theme.cellHorizontalPadding * 2 + 24;
         },
@@ -16,6 +16,7 @@
  */
 import { useCallback, useEffect, useRef } from "react";
 import { GridCellKind } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 
 /**
@@ -266,7 +267,7 @@ export function createDatePickerCellRenderer() {
             }
 
             ctx.font = `12px ${theme.fontFamily}`;
-            const textWidth = ctx.measureText(text).width;
+            const textWidth = measureTextCached(text, ctx).width;
 
             return padding * 2 + textWidth + iconSpace;
         },
@@ -17,8 +17,8 @@ import {
     TextCellEntry,
     roundedRect,
     getLuminance,
-    measureTextCached,
 } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 // Module-level image cache for icons and images rendered on the canvas
 const imageCache = new Map();
@@ -461,7 +461,7 @@ const renderer = {
     },
     measure: (ctx, cell, theme) => {
         const { value, allowedValues = [], showBubble } = cell.data;
-        const textWidth = value ? ctx.measureText(value).width : 0;
+        const textWidth = value ? measureTextCached(value, ctx).width : 0;
         const foundOption = allowedValues.find((opt) =>
             typeof opt === "object" && opt !== null ? opt.value === value : opt === value
         );
@@ -5,6 +5,7 @@
  * Fires Dash callbacks when a link is clicked.
  */
 import { GridCellKind, getMiddleCenterBias } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 /**
  * Factory function to create a LinksCellRenderer with a click callback
@@ -32,7 +33,7 @@ export function createLinksCellRenderer(onLinkClick) {
 
             // Calculate link positions (relative to cell, not absolute)
             const separator = ", ";
-            const separatorWidth = ctx.measureText(separator).width;
+            const separatorWidth = measureTextCached(separator, ctx).width;
             const linkPositions = [];
             let relativeX = padding; // Start position relative to cell left edge
 
@@ -42,7 +43,7 @@ export function createLinksCellRenderer(onLinkClick) {
             for (let i = 0; i < displayLinks.length; i++) {
                 const link = displayLinks[i];
                 const title = link.title || link.href || "Link";
-                const textWidth = ctx.measureText(title).width;
+                const textWidth = measureTextCached(title, ctx).width;
 
                 // Check if this link fits
                 const needsSeparator = i < displayLinks.length - 1;
@@ -118,13 +119,13 @@ export function createLinksCellRenderer(onLinkClick) {
         measure: (ctx, cell, theme) => {
             const { links = [] } = cell.data;
             const separator = ", ";
-            const separatorWidth = ctx.measureText(separator).width;
+            const separatorWidth = measureTextCached(separator, ctx).width;
 
             let totalWidth = 0;
             for (let i = 0; i < links.length; i++) {
                 const link = links[i];
                 const title = link.title || link.href || "Link";
-                totalWidth += ctx.measureText(title).width;
+                totalWidth += measureTextCached(title, ctx).width;
                 if (i < links.length - 1) {
                     totalWidth += separatorWidth;
                 }
@@ -9,13 +9,13 @@
  */
 import * as React from "react";
 import {
-    measureTextCached,
     getMiddleCenterBias,
     useTheme,
     GridCellKind,
     roundedRect,
     getLuminance,
 } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 import Select, { components } from "react-select";
 import CreatableSelect from "react-select/creatable";
 
@@ -528,7 +528,7 @@ const renderer = {
             (x) => x.label ?? x.value
         );
         const bubblesWidth = labels.reduce(
-            (acc, data) => ctx.measureText(data).width + acc + theme.bubblePadding * 2 + theme.bubbleMargin,
+            (acc, data) => measureTextCached(data, ctx).width + acc + theme.bubblePadding * 2 + theme.bubbleMargin,
             0
         );
         if (labels.length === 0) {
@@ -18,6 +18,7 @@
  */
 import { useCallback, useState } from "react";
 import { GridCellKind } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 /**
  * Draw a rounded rectangle on canvas
@@ -134,7 +135,7 @@ export function createRangeCellRenderer() {
             if (label !== undefined && label !== null) {
                 ctx.font = `12px ${theme.fontFamily}`;
                 const measureText = measureLabel !== undefined ? String(measureLabel) : String(label);
-                labelWidth = ctx.measureText(measureText).width + labelSpacing;
+                labelWidth = measureTextCached(measureText, ctx).width + labelSpacing;
             }
 
             // Calculate bar dimensions
@@ -192,7 +193,7 @@ export function createRangeCellRenderer() {
                 ctx.font = `12px ${theme.fontFamily}`;
                 // Use measureLabel for sizing if provided, otherwise use label
                 const measureText = measureLabel !== undefined ? String(measureLabel) : String(label);
-                labelWidth = ctx.measureText(measureText).width + 8;
+                labelWidth = measureTextCached(measureText, ctx).width + 8;
             }
 
             return padding * 2 + minBarWidth + labelWidth;
@@ -7,6 +7,7 @@
  * Based on upstream @glideapps/glide-data-grid-cells sparkline-cell.
  */
 import { GridCellKind } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 /**
  * Parse color to rgba array (simplified version)
@@ -32,6 +33,96 @@ function parseToRgba(color) {
     return [59, 130, 246, 1]; // blue
 }
 
+// Line/area series are downsampled to about this many points per pixel of width
+const POINTS_PER_PIXEL = 2;
+
+// Normalized geometry per values array (see getGeometry)
+const geometryCache = new WeakMap();
+
+/**
+ * Largest-Triangle-Three-Buckets downsampling
+ * Keeps the first and last points, and from each bucket in between the point
+ * forming the largest triangle with the previous kept point and the next
+ * bucket's average, so peaks and dips survive.
+ *
+ * @param {Float64Array} ys - Series values (x is the index)
+ * @param {number} threshold - Number of points to keep
+ * @returns {Uint32Array} - Indices of the kept points, in order
+ */
+function largestTriangleThreeBuckets(ys, threshold) {
+    const n = ys.length;
+    const kept = new Uint32Array(threshold);
+    const bucketSize = (n - 2) / (threshold - 2);
+    let a = 0;
+    for (let i = 0; i < threshold - 2; i++) {
+        // Average point of the next bucket
+        const avgStart = Math.floor((i + 1) * bucketSize) + 1;
+        const avgEnd = Math.min(Math.floor((i + 2) * bucketSize) + 1, n);
+        let avgX = 0;
+        let avgY = 0;
+        for (let j = avgStart; j < avgEnd; j++) {
+            avgX += j;
+            avgY += ys[j];
+        }
+        avgX /= avgEnd - avgStart;
+        avgY /= avgEnd - avgStart;
+
+        // Point of this bucket with the largest triangle
+        const start = Math.floor(i * bucketSize) + 1;
+        const end = Math.floor((i + 1) * bucketSize) + 1;
+        const ay = ys[a];
+        let maxArea = -1;
+        let next = start;
+        for (let j = start; j < end; j++) {
+            const area = Math.abs((a - avgX) * (ys[j] - ay) - (a - j) * (avgY - ay));
+            if (area > maxArea) {
+                maxArea = area;
+                next = j;
+            }
+        }
+        kept[i + 1] = next;
+        a = next;
+    }
+    kept[threshold - 1] = n - 1;
+    return kept;
+}
+
+/**
+ * Normalized sparkline geometry, cached per values array and cell width
+ * Hover repaints redraw the cell many times a second; they reuse this instead
+ * of renormalizing (and downsampling) the series on every draw.
+ *
+ * @returns {object} - {ys: normalized (0-1) values of the drawn points,
+ *   indices: series index of each drawn point (null when all are drawn)}
+ */
+function getGeometry(values, minY, maxY, graphKind, width) {
+    const downsample = graphKind !== "bar";
+    const cached = typeof values === "object" ? geometryCache.get(values) : undefined;
+    if (cached && cached.minY === minY && cached.maxY === maxY &&
+        cached.downsample === downsample && (!downsample || cached.width === width)) {
+        return cached.geometry;
+    }
+
+    const normalized = new Float64Array(values.length);
+    for (let i = 0; i < values.length; i++) {
+        normalized[i] = Math.min(1, Math.max(0, (values[i] - minY) / (maxY - minY)));
+    }
+
+    let geometry = { ys: normalized, indices: null };
+    const threshold = Math.max(3, Math.ceil(width * POINTS_PER_PIXEL));
+    if (downsample && values.length > threshold) {
+        const indices = largestTriangleThreeBuckets(normalized, threshold);
+        const ys = new Float64Array(indices.length);
+        for (let k = 0; k < indices.length; k++) ys[k] = normalized[indices[k]];
+        geometry = { ys, indices };
+    }
+
+    if (typeof values === "object") {
+        geometryCache.set(values, { minY, maxY, downsample, width, geometry });
+    }
+    return geometry;
+}
+
 /**
  * Factory function to create a SparklineCellRenderer
  */
@@ -62,10 +153,9 @@ export function createSparklineCellRenderer() {
             if (!yAxis || yAxis.length !== 2) yAxis = [0, 100];
 
             const [minY, maxY] = yAxis;
-            const originalValues = [...values]; // Keep original for display
 
-            // Normalize values to 0-1 range
-            values = values.map(x => Math.min(1, Math.max(0, (x - minY) / (maxY - minY))));
+            // Values normalized to 0-1 (line/area series downsampled to the cell width)
+            const { ys, indices } = getGeometry(values, minY, maxY, graphKind, rect.width - 16);
 
             const padX = theme.cellHorizontalPadding ?? 8;
             const drawX = padX + rect.x;
@@ -91,21 +181,21 @@ export function createSparklineCellRenderer() {
 
             if (graphKind === "bar") {
                 const margin = 2;
-                const spacing = (values.length - 1) * margin;
-                const barWidth = (width - spacing) / values.length;
+                const spacing = (ys.length - 1) * margin;
+                const barWidth = (width - spacing) / ys.length;
 
                 // Calculate which bar is hovered
                 let hoveredBar = -1;
                 if (hoverX !== undefined && displayValues !== undefined) {
                     const relX = hoverX - padX;
                     hoveredBar = Math.floor(relX / (barWidth + margin));
-                    if (hoveredBar < 0 || hoveredBar >= values.length) hoveredBar = -1;
+                    if (hoveredBar < 0 || hoveredBar >= ys.length) hoveredBar = -1;
                 }
 
                 // Draw bars
                 let x = drawX;
-                for (let idx = 0; idx < values.length; idx++) {
-                    const val = values[idx];
+                for (let idx = 0; idx < ys.length; idx++) {
+                    const val = ys[idx];
                     const barY = y + height - val * height;
                     const isHovered = idx === hoveredBar;
 
@@ -129,7 +219,7 @@ export function createSparklineCellRenderer() {
 
                     if (hoverStyle === "dot") {
                         // Dot + tooltip style
-                        const barY = y + height - values[hoveredBar] * height;
+                        const barY = y + height - ys[hoveredBar] * height;
 
                         // Draw dot at top of bar
                         ctx.beginPath();
@@ -143,7 +233,7 @@ export function createSparklineCellRenderer() {
                         // Draw tooltip
                         const displayVal = displayValues[hoveredBar];
                         ctx.font = `10px ${theme.fontFamily}`;
-                        const textWidth = ctx.measureText(displayVal).width;
+                        const textWidth = measureTextCached(displayVal, ctx).width;
                         const tooltipPadding = 4;
                         const tooltipWidth = textWidth + tooltipPadding * 2;
                         const tooltipHeight = 16;
@@ -179,31 +269,25 @@ export function createSparklineCellRenderer() {
                 }
             } else {
                 // Line or Area chart
-                if (values.length === 1) {
-                    values = [values[0], values[0]];
-                    if (displayValues) {
-                        displayValues = [displayValues[0], displayValues[0]];
-                    }
-                }
+                // A single value is drawn as a flat line (two points)
+                const seriesLength = Math.max(2, values.length);
+                const xStep = (rect.width - 16) / (seriesLength - 1);
+                const pointCount = Math.max(2, ys.length);
+                const pointX = (k) => drawX + xStep * (indices ? indices[k] : k);
+                const pointY = (k) => y + height - ys[Math.min(k, ys.length - 1)] * height;
 
                 // Draw line
                 ctx.beginPath();
-                const xStep = (rect.width - 16) / (values.length - 1);
-                const points = values.map((val, ind) => ({
-                    x: drawX + xStep * ind,
-                    y: y + height - val * height,
-                }));
-
-                ctx.moveTo(points[0].x, points[0].y);
+                ctx.moveTo(pointX(0), pointY(0));
                 let i = 0;
-                if (points.length > 2) {
-                    for (i = 1; i < points.length - 2; i++) {
-                        const xControl = (points[i].x + points[i + 1].x) / 2;
-                        const yControl = (points[i].y + points[i + 1].y) / 2;
-                        ctx.quadraticCurveTo(points[i].x, points[i].y, xControl, yControl);
+                if (pointCount > 2) {
+                    for (i = 1; i < pointCount - 2; i++) {
+                        const xControl = (pointX(i) + pointX(i + 1)) / 2;
+                        const yControl = (pointY(i) + pointY(i + 1)) / 2;
+                        ctx.quadraticCurveTo(pointX(i), pointY(i), xControl, yControl);
                     }
                 }
-                ctx.quadraticCurveTo(points[i].x, points[i].y, points[i + 1].x, points[i + 1].y);
+                ctx.quadraticCurveTo(pointX(i), pointY(i), pointX(i + 1), pointY(i + 1));
                 ctx.strokeStyle = chartColor;
                 ctx.lineWidth = 1 + hoverAmount * 0.5;
                 ctx.stroke();
@@ -225,15 +309,17 @@ export function createSparklineCellRenderer() {
 
                 // Draw hover indicator only if displayValues provided
                 if (hoverX !== undefined && displayValues !== undefined) {
-                    const closest = Math.min(values.length - 1, Math.max(0, Math.round((hoverX - padX) / xStep)));
-                    const pointX = drawX + closest * xStep;
-                    const pointY = points[closest].y;
+                    // Hover reads the full series, not the downsampled points
+                    const closest = Math.min(seriesLength - 1, Math.max(0, Math.round((hoverX - padX) / xStep)));
+                    const valueIndex = Math.min(closest, values.length - 1);
+                    const hoverPointX = drawX + closest * xStep;
+                    const hoverPointY = y + height - Math.min(1, Math.max(0, (values[valueIndex] - minY) / (maxY - minY))) * height;
 
                     if (hoverStyle === "dot") {
                         // Dot + tooltip style
                         // Draw dot
                         ctx.beginPath();
-                        ctx.arc(pointX, pointY, 4, 0, Math.PI * 2);
+                        ctx.arc(hoverPointX, hoverPointY, 4, 0, Math.PI * 2);
                         ctx.fillStyle = chartColor;
                         ctx.fill();
                         ctx.strokeStyle = theme.bgCellEditor || theme.bgCell || "#ffffff";
@@ -241,15 +327,15 @@ export function createSparklineCellRenderer() {
                         ctx.stroke();
 
                         // Draw tooltip
-                        const displayVal = displayValues[closest];
+                        const displayVal = displayValues[values.length === 1 ? 0 : closest];
                         ctx.font = `10px ${theme.fontFamily}`;
-                        const textWidth = ctx.measureText(displayVal).width;
+                        const textWidth = measureTextCached(displayVal, ctx).width;
                         const tooltipPadding = 4;
                         const tooltipWidth = textWidth + tooltipPadding * 2;
                         const tooltipHeight = 16;
-                        let tooltipX = pointX - tooltipWidth / 2;
+                        let tooltipX = hoverPointX - tooltipWidth / 2;
                         tooltipX = Math.max(rect.x + 2, Math.min(tooltipX, rect.x + rect.width - tooltipWidth - 2));
-                        const tooltipY = pointY > y + height / 2 ? rect.y + 2 : rect.y + rect.height - tooltipHeight - 2;
+                        const tooltipY = hoverPointY > y + height / 2 ? rect.y + 2 : rect.y + rect.height - tooltipHeight - 2;
 
                         ctx.fillStyle = theme.bgCellEditor || theme.bgCell || "#ffffff";
                         ctx.fillRect(tooltipX, tooltipY, tooltipWidth, tooltipHeight);
@@ -263,8 +349,8 @@ export function createSparklineCellRenderer() {
                     } else {
                         // Line style (default, like upstream)
                         ctx.beginPath();
-                        ctx.moveTo(pointX, rect.y + 1);
-                        ctx.lineTo(pointX, rect.y + rect.height);
+                        ctx.moveTo(hoverPointX, rect.y + 1);
+                        ctx.lineTo(hoverPointX, rect.y + rect.height);
                         ctx.lineWidth = 1;
                         ctx.strokeStyle = theme.textLight || "#d1d5db";
                         ctx.stroke();
@@ -273,7 +359,7 @@ export function createSparklineCellRenderer() {
                         ctx.font = `8px ${theme.fontFamily}`;
                         ctx.fillStyle = theme.textMedium || "#6b7280";
                         ctx.textBaseline = "top";
-                        ctx.fillText(displayValues[closest], drawX, rect.y + (theme.cellVerticalPadding ?? 3));
+                        ctx.fillText(displayValues[values.length === 1 ? 0 : closest], drawX, rect.y + (theme.cellVerticalPadding ?? 3));
                         ctx.restore();
                     }
                 }
@@ -17,6 +17,7 @@
  */
 import { useCallback } from "react";
 import { GridCellKind } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 /**
  * Draw a rounded rectangle on canvas
@@ -192,7 +193,7 @@ export function createTagsCellRenderer() {
 
             // Pre-calculate tag widths
             const tagWidths = tags.map(tagName => {
-                const textWidth = ctx.measureText(tagName).width;
+                const textWidth = measureTextCached(tagName, ctx).width;
                 return textWidth + tagPaddingX * 2;
             });
 
@@ -207,7 +208,7 @@ export function createTagsCellRenderer() {
             if (totalWidth > availableWidth) {
                 // Calculate how many tags fit with overflow indicator
                 // Reserve space for "+N" badge (estimate max width for "+99")
-                const overflowBadgeWidth = ctx.measureText("+99").width + tagPaddingX * 2;
+                const overflowBadgeWidth = measureTextCached("+99", ctx).width + tagPaddingX * 2;
                 const maxWidthWithOverflow = availableWidth - overflowBadgeWidth - tagSpacing;
 
                 let usedWidth = 0;
@@ -256,7 +257,7 @@ export function createTagsCellRenderer() {
             // Draw overflow indicator
             if (showOverflow) {
                 const overflowText = `+${overflowCount}`;
-                const overflowTextWidth = ctx.measureText(overflowText).width;
+                const overflowTextWidth = measureTextCached(overflowText, ctx).width;
                 const overflowWidth = overflowTextWidth + tagPaddingX * 2;
 
                 // Use theme colors for light/dark mode compatibility
@@ -288,7 +289,7 @@ export function createTagsCellRenderer() {
 
             let totalWidth = theme.cellHorizontalPadding;
             for (const tagName of tags) {
-                const textWidth = ctx.measureText(tagName).width;
+                const textWidth = measureTextCached(tagName, ctx).width;
                 totalWidth += textWidth + tagPaddingX * 2 + tagSpacing;
             }
 
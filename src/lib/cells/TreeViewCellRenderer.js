@@ -5,6 +5,7 @@
  * Fires Dash callbacks when a node is toggled.
  */
 import { GridCellKind, getMiddleCenterBias } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 // Constants for tree layout
 const DEPTH_SHIFT = 16; // Pixels per indentation level
@@ -111,7 +112,7 @@ export function createTreeViewCellRenderer(onToggle) {
             const { text = "", depth = 0, canOpen = false } = cell.data;
             const padding = theme.cellHorizontalPadding ?? DEFAULT_PADDING;
             const inset = depth * DEPTH_SHIFT;
-            const textWidth = ctx.measureText(text).width;
+            const textWidth = measureTextCached(text, ctx).width;
             return padding * 2 + inset + (canOpen ? ICON_SIZE + 4 : 0) + textWidth;
         },
 
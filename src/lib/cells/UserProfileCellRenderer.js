@@ -13,6 +13,7 @@
  * }
  */
 import { GridCellKind, getMiddleCenterBias } from "@glideapps/glide-data-grid";
+import { measureTextCached } from "./textMeasureCache";
 
 // Simple image cache
 const imageCache = new Map();
@@ -142,7 +143,7 @@ export function createUserProfileCellRenderer() {
             const avatarWidth = 28 + 8; // diameter + spacing
 
             ctx.font = `${theme.baseFontStyle} ${theme.fontFamily}`;
-            const nameWidth = name ? ctx.measureText(name).width : 0;
+            const nameWidth = name ? measureTextCached(name, ctx).width : 0;
 
             return theme.cellHorizontalPadding * 2 + avatarWidth + nameWidth;
         },
@@ -0,0 +1,91 @@
+/**
+ * Shared text measurement cache for the custom cell renderers.
+ *
+ * ctx.measureText is one of the most expensive calls while scrolling, and the
+ * renderers measure the same labels (tags, links, buttons, tooltips) on every
+ * draw. Measurements are cached by (font, text) in one bounded map used by all
+ * renderers; the oldest entries are evicted first when it is full.
+ *
+ * Same signature as Glide's measureTextCached, so it is a drop-in replacement.
+ * Hit statistics are available through getTextMeasureStats(), also exposed
+ * as window.dashGlideGrid.getTextMeasureStats() (and resetTextMeasureStats()).
+ */
+
+// Maximum number of cached measurements
+const MAX_ENTRIES = 10000;
+
+const cache = new Map();
+let hits = 0;
+let misses = 0;
+let evictions = 0;
+
+/**
+ * Clear all cached measurements (e.g. after web fonts load)
+ */
+export function clearTextMeasureCache() {
+    cache.clear();
+}
+
+// Metrics change once web fonts finish loading
+if (typeof document !== "undefined" && document.fonts?.addEventListener) {
+    document.fonts.addEventListener("loadingdone", clearTextMeasureCache);
+}
+
+/**
+ * Measure text with the context's current font (or `font`), cached
+ *
+ * @param {string} text - Text to measure
+ * @param {CanvasRenderingContext2D} ctx - Canvas context
+ * @param {string} [font] - Font to key the measurement by (defaults to ctx.font)
+ * @returns {TextMetrics} - Metrics (shared; don't modify)
+ */
+export function measureTextCached(text, ctx, font) {
+    const key = `${font ?? ctx.font}\n${text}`;
+    const cached = cache.get(key);
+    if (cached !== undefined) {
+        hits++;
+        return cached;
+    }
+
+    misses++;
+    const metrics = ctx.measureText(text);
+    if (cache.size >= MAX_ENTRIES) {
+        // Maps iterate in insertion order, so the first key is the oldest
+        cache.delete(cache.keys().next().value);
+        evictions++;
+    }
+    cache.set(key, metrics);
+    return metrics;
+}
+
+/**
+ * Cache statistics since the last reset
+ *
+ * @returns {object} - {hits, misses, evictions, size, maxSize, hitRate (0-1)}
+ */
+export function getTextMeasureStats() {
+    const total = hits + misses;
+    return {
+        hits,
+        misses,
+        evictions,
+        size: cache.size,
+        maxSize: MAX_ENTRIES,
+        hitRate: total > 0 ? hits / total : 0
+    };
+}
+
+/**
+ * Reset the hit/miss counters (the cached measurements are kept)
+ */
+export function resetTextMeasureStats() {
+    hits = 0;
+    misses = 0;
+    evictions = 0;
+}
+
+if (typeof window !== "undefined") {
+    window.dashGlideGrid = window.dashGlideGrid || {};
+    window.dashGlideGrid.getTextMeasureStats = getTextMeasureStats;
+    window.dashGlideGrid.resetTextMeasureStats = resetTextMeasureStats;
+}
@@ -23,6 +23,7 @@ GlideGrid.defaultProps = {
     rangeSelect: 'rect',
     showSearch: false,
     searchValue: '',
+    searchIndex: false,
     columnResize: true,
     rowMarkers: 'none',
     rowMarkerStartIndex: 1,
@@ -53,7 +54,10 @@ GlideGrid.defaultProps = {
     sortable: false,
     sortColumns: [],
     sortingOrder: ['asc', 'desc', null],
+    sortMode: 'client',
     columnFilters: {},
+    filterMode: 'client',
+    computeWorker: false,
     hoverRow: false,
     cellActivationBehavior: 'second-click',
     editOnType: true,
@@ -64,6 +68,7 @@ GlideGrid.defaultProps = {
     columnSelectionMode: 'auto',
     enableUndoRedo: false,
     maxUndoSteps: 50,
+    maxUndoBytes: null,
     canUndo: false,
     canRedo: false,
     editorScrollBehavior: 'default',
@@ -73,6 +78,11 @@ GlideGrid.defaultProps = {
     allowDelete: true,
     hiddenRows: [],
     hiddenRowsConfig: {},
+    hiddenRowsMode: 'collapse',
+    dataSyncMode: 'full',
+    rowModel: 'client',
+    blockSize: 100,
+    maxCachedBlocks: 50,
 };
 
 GlideGrid.propTypes = {
@@ -139,6 +149,37 @@ GlideGrid.propTypes = {
          */
         valueFormatter: PropTypes.shape({
             function: PropTypes.string.isRequired
+        }),
+        /**
+         * Declarative display format, compiled once into a cached Intl formatter.
+         * Faster than a valueFormatter function, which runs for every cell paint.
+         * A valueFormatter on the same column takes precedence.
+         *
+         * **Usage**: `format={"type": "currency", "currency": "EUR", "locale": "de-DE", "decimals": 2}`
+         *
+         * - `type`: "number" (default), "percent" (1 = 100%), "currency",
+         *   "date", "datetime" or "time" (for ISO date strings or timestamps in ms)
+         * - `decimals`: Fixed number of fraction digits
+         * - `locale`: BCP 47 locale, e.g. "en-US" (default: browser locale)
+         * - `currency`: ISO 4217 code for "currency" (default: "USD")
+         * - `thousandsSeparator`: Set to false to disable digit grouping
+         * - `dateStyle` / `timeStyle`: "full", "long", "medium" or "short"
+         * - `timeZone`: IANA time zone, e.g. "UTC"
+         * - `prefix` / `suffix`: Text added around the formatted value
+         * - `options`: Extra Intl.NumberFormat / Intl.DateTimeFormat options
+         */
+        format: PropTypes.shape({
+            type: PropTypes.oneOf(['number', 'percent', 'currency', 'date', 'datetime', 'time']),
+            decimals: PropTypes.number,
+            locale: PropTypes.string,
+            currency: PropTypes.string,
+            thousandsSeparator: PropTypes.bool,
+            dateStyle: PropTypes.oneOf(['full', 'long', 'medium', 'short']),
+            timeStyle: PropTypes.oneOf(['full', 'long', 'medium', 'short']),
+            timeZone: PropTypes.string,
+            prefix: PropTypes.string,
+            suffix: PropTypes.string,
+            options: PropTypes.object
         })
     })).isRequired,
 
@@ -221,14 +262,147 @@ GlideGrid.propTypes = {
      *   "copyData": "python, react"
      * }
      * ```
+     *
+     * Either `data` or `dataColumns` must be provided.
      */
-    data: PropTypes.arrayOf(PropTypes.object).isRequired,
+    data: PropTypes.arrayOf(PropTypes.object),
+
+    /**
+     * Row data in columnar format: a dict of column id -> list of values, one
+     * entry per row. An alternative to `data` that avoids repeating every column
+     * key in every row, which makes large payloads smaller and faster to parse.
+     * Takes precedence over `data` when both are set. Cell values follow the
+     * same rules as in `data` (simple values or cell objects).
+     *
+     * Edits made in the grid are sent back as `dataColumns` (or as `dataPatch`
+     * when dataSyncMode="patch").
+     *
+     * **Example**:
+     * ```python
+     * dataColumns = {
+     *     'name': ['Laptop', 'Mouse'],
+     *     'price': [1299.99, 29.99],
+     * }
+     * # Or from pandas, without to_dict('records'):
+     * GlideGrid.from_dataframe(df, id='grid')
+     * ```
+     *
+     * **Binary numeric columns**: a numeric column can instead be an object
+     * `{"dtype": "float64", "data": "<base64>"}` holding the raw little-endian
+     * bytes of a NumPy array. The grid wraps them in a typed array without parsing
+     * each value. Supported dtypes: float64, float32, int32, int16, int8, uint32,
+     * uint16, uint8. NaN in float columns is shown as an empty cell.
+     * Use `GlideGrid.from_dataframe(df, binary=True)` or
+     * `dash_glide_grid.encode_typed_column(array)` to build them, and
+     * `dash_glide_grid.decode_columns(dataColumns)` to read edited data back.
+     */
+    dataColumns: PropTypes.objectOf(PropTypes.oneOfType([
+        PropTypes.array,
+        PropTypes.shape({
+            dtype: PropTypes.oneOf(['float64', 'float32', 'int32', 'int16', 'int8', 'uint32', 'uint16', 'uint8']),
+            data: PropTypes.string
+        })
+    ])),
+
+    /**
+     * Rows to append to the end of the grid, for live feeds. Each new value is
+     * appended in place, so only the new rows go over the wire (instead of
+     * resending the whole `data`). Accepts a list of row dicts or a columnar
+     * dict like `dataColumns`. Appended rows are not sent back through `data`.
+     *
+     * If the user is scrolled to the last row, the grid stays pinned to the tail.
+     * Add "append" to `showCellFlash` to flash new rows. Leave `rows` unset so
+     * the row count follows the data.
+     */
+    appendRows: PropTypes.oneOfType([
+        PropTypes.arrayOf(PropTypes.object),
+        PropTypes.objectOf(PropTypes.array)
+    ]),
+
+    /**
+     * Maximum number of rows kept when rows are appended with `appendRows`.
+     * The oldest rows are dropped first, like a ring buffer. Dropping rows
+     * clears the undo history, since data row indices shift.
+     */
+    maxRows: PropTypes.number,
+
+    /**
+     * Sparse cell updates for high-frequency feeds (e.g. price ticks).
+     * The values are written straight into the grid's local data and only
+     * the listed cells are repainted. There is no full data copy and no React
+     * re-render, so Python callbacks can drive tick-level updates cheaply.
+     *
+     * - `row`: data row index (unaffected by sorting/filtering)
+     * - `col`: column index or column id
+     * - `value`: new cell value
+     *
+     * Updates are not sent back through `data`, and the current sort/filter
+     * order is not recomputed for them.
+     * Add "update" to `showCellFlash` to flash the updated cells.
+     *
+     * Format: {"updates": [{"row": 0, "col": "price", "value": 101.5}], "timestamp": 1234567890}
+     */
+    cellUpdates: PropTypes.shape({
+        updates: PropTypes.arrayOf(PropTypes.shape({
+            row: PropTypes.number.isRequired,
+            col: PropTypes.oneOfType([PropTypes.number, PropTypes.string]).isRequired,
+            value: PropTypes.any
+        })),
+        timestamp: PropTypes.number
+    }),
 
     /**
      * Number of rows to display. If not provided, inferred from data.length.
      */
     rows: PropTypes.number,
 
+    /**
+     * How edits made in the grid are synced back to Dash.
+     * - "full" (default): Every edit, paste, fill, delete and undo/redo sends the
+     *   entire `data` array back to Dash.
+     * - "patch": Only the changed cells are sent, via the `dataPatch` output prop.
+     *   The grid applies edits locally and `data` is NOT updated in Dash, so the
+     *   server holds the authoritative copy. Use `dash_glide_grid.data_patch_to_dash_patch`
+     *   or `dash_glide_grid.apply_data_patch` to apply the edits on the server.
+     *   Recommended for large datasets where resending `data` per keystroke is costly.
+     * Default: "full"
+     */
+    dataSyncMode: PropTypes.oneOf(['full', 'patch']),
+
+    /**
+     * Cell edits made in the grid when dataSyncMode="patch" (read-only output prop).
+     * Each edit uses the data row index (unaffected by sorting/filtering) and the column id.
+     * `source` is the operation that produced the edits: "edit", "paste", "fill",
+     * "delete", "undo", "redo" or "contextMenu".
+     * Format: {"edits": [{"row": 0, "col": 1, "columnId": "price", "oldValue": 10, "value": 12}],
+     *          "source": "edit", "timestamp": 1234567890}
+     */
+    dataPatch: PropTypes.shape({
+        edits: PropTypes.arrayOf(PropTypes.shape({
+            row: PropTypes.number,
+            col: PropTypes.number,
+            columnId: PropTypes.string,
+            oldValue: PropTypes.any,
+            value: PropTypes.any
+        })),
+        source: PropTypes.string,
+        timestamp: PropTypes.number
+    }),
+
+    /**
+     * Revision number of `data`. Used to tell fresh data from stale echoes without
+     * deep-comparing the whole dataset.
+     * - The grid increments it every time it sends `data` back to Dash (edits, paste,
+     *   fill, delete, undo/redo), so it is also an output prop.
+     * - Incoming `data` whose `dataRevision` is lower than the newest revision the
+     *   grid has already applied is ignored as a stale echo.
+     * - When pushing new data from a callback (including `dash.Patch` updates), also
+     *   return `dataRevision` incremented from its current value so it is never
+     *   treated as stale.
+     * Until a revision is known, incoming data is always applied unless it is the grid's own echo.
+     */
+    dataRevision: PropTypes.number,
+
     // ========== DISPLAY & LAYOUT PROPS ==========
 
     /**
@@ -263,6 +437,25 @@ GlideGrid.propTypes = {
         })
     ]),
 
+    /**
+     * Per-row heights in pixels, indexed by data row (heights follow rows when
+     * sorting or filtering). Takes precedence over a `rowHeight` function.
+     * - A list of numbers, one per data row
+     * - A binary column ({"dtype": "float64", "data": "<base64>"}, see `dash_glide_grid.encode_typed_column`)
+     * - A string: the id of a data column holding each row's height
+     * Rows without a valid height use `rowHeight` (or 34).
+     * Heights are resolved once per data/row order change into a lookup table,
+     * which keeps scrolling smooth with variable heights on large grids.
+     */
+    rowHeights: PropTypes.oneOfType([
+        PropTypes.arrayOf(PropTypes.number),
+        PropTypes.shape({
+            dtype: PropTypes.string,
+            data: PropTypes.string
+        }),
+        PropTypes.string
+    ]),
+
     /**
      * Height of the header row in pixels. Default: 36
      */
@@ -410,8 +603,28 @@ GlideGrid.propTypes = {
      *
      * Useful for tree view collapse/expand functionality where child rows
      * need to hide/show while maintaining their identity and selection state.
+     *
+     * Entries can also be inclusive ranges, so large sections take one entry:
+     * [3, [10, 500000]] hides row 3 and rows 10 through 500000.
+     * See `hiddenRowsMode` for removing hidden rows from the display entirely.
      */
-    hiddenRows: PropTypes.arrayOf(PropTypes.number),
+    hiddenRows: PropTypes.arrayOf(PropTypes.oneOfType([
+        PropTypes.number,
+        PropTypes.arrayOf(PropTypes.number)
+    ])),
+
+    /**
+     * How hidden rows are hidden.
+     * - "collapse" (default): hidden rows stay in the grid with height 0, as
+     *   described for `hiddenRows`. Indices are display rows.
+     * - "exclude": hidden rows are left out of the display order, like filtered
+     *   rows. Indices are data rows. Cost scales with the visible rows only, so
+     *   hiding most of a large grid (e.g. collapsed tree sections) stays fast.
+     *   Row numbers then follow the visible rows, and `hiddenRowsConfig` doesn't
+     *   apply since hidden rows can't be reached.
+     * Has no effect with `rowModel="server"`.
+     */
+    hiddenRowsMode: PropTypes.oneOf(['collapse', 'exclude']),
 
     /**
      * Configuration object controlling how hidden rows affect grid operations.
@@ -454,6 +667,49 @@ GlideGrid.propTypes = {
      */
     searchValue: PropTypes.string,
 
+    /**
+     * Search with an index instead of Glide's cell-by-cell search. Each column's
+     * distinct display texts get a trigram index, built on the first search and
+     * kept up to date on edits, so searching large grids takes milliseconds.
+     * Matches are case-insensitive substrings of the display value (or of the
+     * `format` output for formatted columns); `valueFormatter` output is not
+     * searched. Enables `searchResults` and `searchNavigate`. Default: false
+     */
+    searchIndex: PropTypes.bool,
+
+    /**
+     * Results of the current search (output, requires `searchIndex`).
+     * - `query`: The search text
+     * - `count`: Number of matching cells
+     * - `matches`: First 1000 matches as {row, col, displayRow}, in display order.
+     *   `row` is the data row index.
+     * - `truncated`: True if there are more matches than listed
+     * - `current`: Index of the match navigated to, or -1
+     */
+    searchResults: PropTypes.shape({
+        query: PropTypes.string,
+        count: PropTypes.number,
+        matches: PropTypes.arrayOf(PropTypes.shape({
+            row: PropTypes.number,
+            col: PropTypes.number,
+            displayRow: PropTypes.number
+        })),
+        truncated: PropTypes.bool,
+        current: PropTypes.number
+    }),
+
+    /**
+     * Jump to the next or previous search match (requires `searchIndex`).
+     * The grid scrolls to the match, selects it and updates `searchResults.current`.
+     * Include a timestamp so repeated jumps in the same direction trigger.
+     *
+     * Example: {"direction": "next", "timestamp": 1234567890}
+     */
+    searchNavigate: PropTypes.shape({
+        direction: PropTypes.oneOf(['next', 'prev']),
+        timestamp: PropTypes.number
+    }),
+
     /**
      * Allow column resizing by dragging column edges. Default: true
      */
@@ -926,6 +1182,65 @@ GlideGrid.propTypes = {
         ty: PropTypes.number
     }),
 
+    // ========== SERVER ROW MODEL ==========
+
+    /**
+     * Where rows come from.
+     * - "client" (default): All rows are passed in `data` / `dataColumns`.
+     * - "server": Only the total row count is known up front (`rows`). The grid
+     *   requests blocks of rows around the viewport via `rowBlockRequest` and shows
+     *   loading cells until `rowBlocks` answers. Sorting and filtering are left to
+     *   the server (the request includes the current `sortColumns` and `columnFilters`),
+     *   and edits are always sent as `dataPatch`.
+     * Use `dash_glide_grid.RowBlockProvider` to serve blocks from a DataFrame.
+     * Default: "client"
+     */
+    rowModel: PropTypes.oneOf(['client', 'server']),
+
+    /**
+     * Number of rows per block when rowModel="server". Default: 100
+     */
+    blockSize: PropTypes.number,
+
+    /**
+     * Maximum number of blocks kept in memory when rowModel="server".
+     * The least recently visible blocks are dropped first. Default: 50
+     */
+    maxCachedBlocks: PropTypes.number,
+
+    /**
+     * Request for a range of rows when rowModel="server" (read-only output prop).
+     * `endRow` is exclusive. `generation` changes whenever the block cache is reset
+     * (sort/filter/row count change) and should be echoed back in `rowBlocks`.
+     * Format: {"startRow": 0, "endRow": 200, "blockSize": 100, "sortColumns": [...],
+     *          "columnFilters": {...}, "generation": 0, "timestamp": 1234567890}
+     */
+    rowBlockRequest: PropTypes.shape({
+        startRow: PropTypes.number,
+        endRow: PropTypes.number,
+        blockSize: PropTypes.number,
+        sortColumns: PropTypes.array,
+        columnFilters: PropTypes.object,
+        generation: PropTypes.number,
+        timestamp: PropTypes.number
+    }),
+
+    /**
+     * Rows sent by the server in answer to `rowBlockRequest` (rowModel="server").
+     * Provide the rows either as records (`data`) or columnar (`dataColumns`).
+     * `totalRows` optionally updates the total row count. Responses whose
+     * `generation` doesn't match the grid's current generation are ignored.
+     * Format: {"startRow": 0, "data": [...], "totalRows": 20000000, "generation": 0, "timestamp": 1234567890}
+     */
+    rowBlocks: PropTypes.shape({
+        startRow: PropTypes.number,
+        data: PropTypes.arrayOf(PropTypes.object),
+        dataColumns: PropTypes.object,
+        totalRows: PropTypes.number,
+        generation: PropTypes.number,
+        timestamp: PropTypes.number
+    }),
+
     // ========== ROW/COLUMN REORDERING ==========
 
     /**
@@ -1062,12 +1377,15 @@ GlideGrid.propTypes = {
      * - true: Flash on all operations (edit, paste, undo, redo)
      * - false: No flash (default)
      * - Array of strings: Flash only on specified operations.
-     *   Valid values: "edit", "paste", "undo", "redo", "copy"
+     *   Valid values: "edit", "paste", "undo", "redo", "copy", "append", "update"
+     *   ("update" flashes cells changed through `cellUpdates`)
      *   Example: ["paste", "undo", "redo", "copy"] to flash on paste, undo/redo, and copy but not regular edits
+     * Flashes don't re-render the grid: flashed cells are repainted together once per
+     * animation frame and forgotten when the animation ends.
      */
     showCellFlash: PropTypes.oneOfType([
         PropTypes.bool,
-        PropTypes.arrayOf(PropTypes.oneOf(["edit", "paste", "undo", "redo", "copy"]))
+        PropTypes.arrayOf(PropTypes.oneOf(["edit", "paste", "undo", "redo", "copy", "append", "update"]))
     ]),
 
     /**
@@ -1102,6 +1420,22 @@ GlideGrid.propTypes = {
      */
     keybindings: PropTypes.object,
 
+    /**
+     * Rate limits for high-frequency output props, in milliseconds per prop.
+     * The first event in a window is sent immediately and the latest one is
+     * always delivered when the window ends, so the final state is never lost.
+     * Set a prop to false to stop sending it entirely (e.g. when no callback
+     * listens to it). Props not listed are sent on every event.
+     *
+     * Supported props: mouseMove, itemHovered, visibleRegion, columnWidths
+     *
+     * Example: {"mouseMove": 50, "visibleRegion": 100, "itemHovered": false}
+     */
+    eventRateLimits: PropTypes.objectOf(PropTypes.oneOfType([
+        PropTypes.number,
+        PropTypes.bool
+    ])),
+
     /**
      * Makes the grid draggable for external drag-and-drop operations.
      * - true: Entire grid is draggable
@@ -1268,12 +1602,55 @@ GlideGrid.propTypes = {
      * - `Theme object`: Override theme properties for this row (e.g., bgCell, textDark)
      * - `undefined`: Use default theme
      *
-     * **Available parameters**: `row` (row index), `rowData` (dict of cell values keyed by column id), `data` (full grid data)
+     * **Available parameters**: `row` (display row index), `dataRow` (data row index, unaffected by sorting/filtering), `rowData` (dict of cell values keyed by column id), `data` (full grid data)
+     *
+     * For conditions on cell values, `styleRules` is faster: it doesn't run a function per row on every draw.
      */
     getRowThemeOverride: PropTypes.shape({
         function: PropTypes.string.isRequired
     }),
 
+    /**
+     * Declarative conditional styling. Each rule tests the value in `column`
+     * and applies a theme override to the whole row (`scope: "row"`, default)
+     * or only to that cell (`scope: "cell"`). When several rules match, the
+     * last one wins. Rules are evaluated once per row when the data changes.
+     * Painting only looks up the result, so no functions run while scrolling.
+     *
+     * - `column`: Column id whose value is tested
+     * - `operator`: "==", "!=", ">", ">=", "<", "<=", "between" (value is [low, high]),
+     *   "in", "notIn" (value is a list; items compare like "==", so 1 matches "1"),
+     *   "contains", "startsWith", "endsWith" (case-insensitive), "isBlank", "notBlank"
+     * - `value`: Value to compare against
+     * - `theme`: Name of a theme in `styleThemes`, or an inline theme override object
+     * - `scope`: "row" or "cell"
+     *
+     * Example:
+     * ```
+     * styleRules=[
+     *     {"column": "status", "operator": "==", "value": "error", "theme": "danger"},
+     *     {"column": "change", "operator": "<", "value": 0, "theme": "negative", "scope": "cell"},
+     * ]
+     * styleThemes={"danger": {"bgCell": "#fde8e8"}, "negative": {"textDark": "#c0392b"}}
+     * ```
+     */
+    styleRules: PropTypes.arrayOf(PropTypes.shape({
+        column: PropTypes.string.isRequired,
+        operator: PropTypes.oneOf([
+            '==', '!=', '>', '>=', '<', '<=', 'between', 'in', 'notIn',
+            'contains', 'startsWith', 'endsWith', 'isBlank', 'notBlank'
+        ]),
+        value: PropTypes.any,
+        theme: PropTypes.oneOfType([PropTypes.string, PropTypes.object]).isRequired,
+        scope: PropTypes.oneOf(['row', 'cell'])
+    })),
+
+    /**
+     * Named theme overrides referenced by `styleRules`.
+     * Example: {"danger": {"bgCell": "#fde8e8", "textDark": "#9b1c1c"}}
+     */
+    styleThemes: PropTypes.objectOf(PropTypes.object),
+
     /**
      * Custom cell rendering using JavaScript Canvas API.
      * Allows complete control over how cells are drawn.
@@ -1351,6 +1728,16 @@ GlideGrid.propTypes = {
      */
     sortingOrder: PropTypes.arrayOf(PropTypes.oneOf(['asc', 'desc', null])),
 
+    /**
+     * Where sorting happens.
+     * - "client" (default): the grid sorts its rows in the browser
+     * - "server": clicking a header only updates `sortColumns`. The grid keeps
+     *   its current order until the server sends a new `rowOrder`
+     *   (see `dash_glide_grid.compute_row_order`).
+     * `sortable` must still be true for header clicks to sort.
+     */
+    sortMode: PropTypes.oneOf(['client', 'server']),
+
     // ========== COLUMN FILTER PROPS ==========
 
     /**
@@ -1364,6 +1751,44 @@ GlideGrid.propTypes = {
      */
     columnFilters: PropTypes.objectOf(PropTypes.arrayOf(PropTypes.any)),
 
+    /**
+     * Where column filters are applied.
+     * - "client" (default): the grid filters its rows in the browser
+     * - "server": the filter menu only updates `columnFilters`. The server
+     *   answers with a `rowOrder` that leaves out the filtered rows.
+     */
+    filterMode: PropTypes.oneOf(['client', 'server']),
+
+    /**
+     * Sort and filter in a background Web Worker instead of on the main thread.
+     * The worker keeps a copy of the sorted/filtered columns (only the parts that
+     * changed are sent to it) and returns the row order when it is done; until
+     * then the grid keeps showing the previous order, so scrolling and input
+     * stay responsive on large datasets. Superseded sort or filter changes are
+     * skipped. Falls back to main-thread sorting when workers are unavailable.
+     * Has no effect with `rowModel="server"`. Default: false
+     */
+    computeWorker: PropTypes.bool,
+
+    /**
+     * Display order of rows computed by the server, used when `sortMode` or
+     * `filterMode` is "server". Each entry is a data row index. Rows that are
+     * left out are hidden. Sorting or filtering that is still done on the
+     * client is applied on top of this order.
+     *
+     * Can be a list of ints or a binary int32 column
+     * ({"dtype": "int32", "data": "<base64>"}), as returned by
+     * `dash_glide_grid.compute_row_order(..., binary=True)`.
+     * Set to None to show the rows in data order.
+     */
+    rowOrder: PropTypes.oneOfType([
+        PropTypes.arrayOf(PropTypes.number),
+        PropTypes.shape({
+            dtype: PropTypes.oneOf(['int32', 'uint32']),
+            data: PropTypes.string
+        })
+    ]),
+
     /**
      * Configuration for the header filter menu.
      *
@@ -1514,6 +1939,15 @@ GlideGrid.propTypes = {
      */
     maxUndoSteps: PropTypes.number,
 
+    /**
+     * Memory budget for the undo history, in bytes (approximate).
+     * Edit batches are stored as row ranges with one array of old and new
+     * values per column, and the oldest batches are discarded once the history
+     * exceeds this size (a single batch larger than the budget is not kept).
+     * Applies together with maxUndoSteps. Default: null (no byte limit)
+     */
+    maxUndoBytes: PropTypes.number,
+
     /**
      * Trigger undo or redo programmatically from Dash.
      * Set this prop to trigger an undo or redo action.
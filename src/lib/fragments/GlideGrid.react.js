@@ -18,6 +18,21 @@ import { createSparklineCellRenderer } from '../cells/SparklineCellRenderer';
 import { createTreeViewCellRenderer } from '../cells/TreeViewCellRenderer';
 import 'react-responsive-carousel/lib/styles/carousel.min.css';
 import { executeFunction, isFunctionRef } from '../utils/functionParser';
+import { createDataStore, createRecordStore, createBlockStore } from '../utils/dataStore';
+import { isEncodedColumn, decodeColumn } from '../utils/typedColumns';
+import { createPropThrottle } from '../utils/eventThrottle';
+import { createCellCache } from '../utils/cellCache';
+import { getFormatter } from '../utils/formatters';
+import { createStyleIndex } from '../utils/styleRules';
+import { sortRows, invalidateSortCaches } from '../utils/sortEngine';
+import { getCellDisplayValue, extractSortValue } from '../utils/cellValues';
+import { canUseComputeWorker, createComputeWorker } from '../utils/computeWorker';
+import { searchCells } from '../utils/searchIndex';
+import { createRowHeightTable } from '../utils/rowHeights';
+import { createRowSet, rowsNotIn } from '../utils/rowRanges';
+import { encodeBatch, decodeBatch, trimHistory } from '../utils/undoHistory';
+import { createFlashTracker } from '../utils/flashTracker';
+import { filterRows, carryFilterIndexes, updateFilterIndexes, getColumnValueCounts } from '../utils/filterEngine';
 import HeaderMenu from './HeaderMenu.react';
 import ContextMenu from './ContextMenu.react';
 
@@ -50,6 +65,18 @@ const staticRenderers = [
     createSparklineCellRenderer(),
 ];
 
+// Re-request a server row block if no answer arrived within this many ms
+const BLOCK_REQUEST_TIMEOUT = 10000;
+
+// Maximum number of match positions reported in the searchResults prop
+const MAX_REPORTED_SEARCH_MATCHES = 1000;
+
+// Maximum number of built cells kept by the getCellContent cache
+const MAX_CACHED_CELLS = 50000;
+
+// Length of Glide's lastUpdated flash animation (ms); flash timestamps are dropped after it
+const FLASH_DURATION = 500;
+
 /**
  * Helper function to auto-detect cell type from simple JavaScript values
  */
@@ -311,10 +338,12 @@ const GlideGrid = (props) => {
         id,
         columns,
         data,
+        dataColumns,
         rows,
         height,
         width,
         rowHeight,
+        rowHeights,
         headerHeight,
         freezeColumns,
         freezeTrailingRows,
@@ -379,7 +408,10 @@ const GlideGrid = (props) => {
         sortable,
         sortColumns,
         sortingOrder,
+        sortMode,
         columnFilters,
+        filterMode,
+        rowOrder,
         headerMenuConfig,
         contextMenuConfig,
         selectionColumnMin,
@@ -396,6 +428,7 @@ const GlideGrid = (props) => {
         columnSelectionMode,
         enableUndoRedo,
         maxUndoSteps,
+        maxUndoBytes,
         undoRedoAction,
         editorScrollBehavior,
         contextMenuScrollBehavior,
@@ -405,9 +438,32 @@ const GlideGrid = (props) => {
         allowDelete,
         hiddenRows,
         hiddenRowsConfig,
+        hiddenRowsMode,
+        dataSyncMode,
+        dataRevision,
+        rowModel,
+        blockSize,
+        maxCachedBlocks,
+        rowBlocks,
+        eventRateLimits,
+        appendRows,
+        maxRows,
+        cellUpdates,
+        styleRules,
+        styleThemes,
+        computeWorker,
+        searchIndex,
+        searchNavigate,
         setProps
     } = props;
 
+    // Server row model: only `rows` is known up front, blocks of rows arrive via `rowBlocks`
+    const isServerRowModel = rowModel === 'server';
+
+    // Server sort/filter: the grid emits sortColumns/columnFilters, the server answers with rowOrder
+    const isServerSort = sortMode === 'server';
+    const isServerFilter = filterMode === 'server';
+
     // Internal state for grid selection (for visual feedback and editing)
     const [gridSelection, setGridSelection] = useState({
         columns: CompactSelection.empty(),
@@ -415,7 +471,10 @@ const GlideGrid = (props) => {
     });
 
     // Local state for optimistic updates (so edits appear immediately)
-    const [localData, setLocalData] = useState(data);
+    // Holds a data store wrapping either `data` (records) or `dataColumns` (columnar)
+    const [localData, setLocalData] = useState(() => (
+        isServerRowModel ? createBlockStore(rows, blockSize) : createDataStore(data, dataColumns)
+    ));
     const [localColumns, setLocalColumns] = useState(columns);
     const [localSearchValue, setLocalSearchValue] = useState(searchValue || '');
 
@@ -455,10 +514,18 @@ const GlideGrid = (props) => {
     // State for row hover effect
     const [hoveredRow, setHoveredRow] = useState(null);
 
-    // Create Set for O(1) hidden row lookups
+    // hiddenRowsMode="exclude" removes hidden rows from the display order, like filtering
+    // (the server owns the row order in the server row model, so rows are collapsed there)
+    const isExcludeHidden = hiddenRowsMode === 'exclude' && !isServerRowModel;
+
+    // Hidden rows as merged ranges (entries can be rows or [start, end] ranges)
+    const hiddenRowRanges = useMemo(() => createRowSet(hiddenRows), [hiddenRows]);
+
+    // Rows collapsed to zero height; empty in exclude mode, where hidden rows are never displayed
     const hiddenRowsSet = useMemo(() => {
-        return new Set(hiddenRows || []);
-    }, [hiddenRows]);
+        return isExcludeHidden ? createRowSet([]) : hiddenRowRanges;
+    }, [isExcludeHidden, hiddenRowRanges]);
+    const excludedRows = isExcludeHidden && hiddenRowRanges.size > 0 ? hiddenRowRanges : null;
 
     // Extract hidden rows config options (all default to true - skip hidden rows)
     const {
@@ -470,7 +537,7 @@ const GlideGrid = (props) => {
     } = hiddenRowsConfig || {};
 
     // Ref to track current data (to avoid stale closures in rapid callbacks)
-    const localDataRef = useRef(data);
+    const localDataRef = useRef(localData);
 
     // Ref to track current columns (to avoid stale closures in rapid callbacks)
     const localColumnsRef = useRef(columns);
@@ -478,6 +545,9 @@ const GlideGrid = (props) => {
     // Ref to track the last data we sent to Dash (to prevent overwriting our own updates)
     const lastSentData = useRef(null);
 
+    // Ref to track the newest data revision applied locally (from Dash or from our own edits)
+    const appliedRevisionRef = useRef(typeof dataRevision === 'number' ? dataRevision : 0);
+
     // Ref to track the last search value we sent to Dash
     const lastSentSearchValue = useRef(null);
 
@@ -516,8 +586,21 @@ const GlideGrid = (props) => {
 
     // ========== LAST UPDATED STATE ==========
     // Track lastUpdated timestamps for cells (for flash effect on edit/undo/redo)
-    // Map of "row,col" -> timestamp (performance.now())
-    const [lastUpdatedCells, setLastUpdatedCells] = useState({});
+    // Kept outside React (data row, col -> performance.now()), so flashing doesn't re-render;
+    // flashed cells are repainted once per animation frame and expire after FLASH_DURATION
+    const flashTrackerRef = useRef(null);
+    const repaintFlashedCellsRef = useRef(null);
+    if (!flashTrackerRef.current) {
+        flashTrackerRef.current = createFlashTracker(
+            FLASH_DURATION,
+            (cells) => repaintFlashedCellsRef.current && repaintFlashedCellsRef.current(cells)
+        );
+    }
+    const flashTracker = flashTrackerRef.current;
+
+    useEffect(() => {
+        return () => flashTracker.dispose();
+    }, [flashTracker]);
 
     // Helper to check if flash should be triggered for a specific operation
     const shouldFlash = useCallback((operation) => {
@@ -532,7 +615,6 @@ const GlideGrid = (props) => {
         if (!gridSelection.current) return;
 
         const now = performance.now();
-        const updatedCells = {};
 
         // Handle range selection
         if (gridSelection.current.range) {
@@ -542,7 +624,7 @@ const GlideGrid = (props) => {
                     // Get actual row index if sorted
                     const actualRow = sortedIndices ? sortedIndices[row] : row;
                     if (actualRow !== undefined && actualRow < (localData?.length || 0)) {
-                        updatedCells[`${actualRow},${col}`] = now;
+                        flashTracker.add(actualRow, col, now);
                     }
                 }
             }
@@ -552,14 +634,10 @@ const GlideGrid = (props) => {
             const [col, row] = gridSelection.current.cell;
             const actualRow = sortedIndices ? sortedIndices[row] : row;
             if (actualRow !== undefined && actualRow < (localData?.length || 0)) {
-                updatedCells[`${actualRow},${col}`] = now;
+                flashTracker.add(actualRow, col, now);
             }
         }
-
-        if (Object.keys(updatedCells).length > 0) {
-            setLastUpdatedCells(prev => ({ ...prev, ...updatedCells }));
-        }
-    }, [gridSelection, sortedIndices, localData]);
+    }, [gridSelection, sortedIndices, localData, flashTracker]);
 
     // ========== UNDO/REDO STATE ==========
     // Undo/redo history stacks
@@ -618,15 +696,37 @@ const GlideGrid = (props) => {
 
     // Sync local data with props when props change from outside (but not from our own updates)
     useEffect(() => {
-        // If the incoming data is the same as what we just sent, ignore it
+        // In the server row model rows only arrive through rowBlocks
+        if (isServerRowModel) return;
+
+        // Dash hands back the exact array we sent, so our own echo is an identity match
         // Clear lastSentData after matching to prevent stale comparisons blocking future updates
-        if (lastSentData.current && JSON.stringify(data) === JSON.stringify(lastSentData.current)) {
+        const incomingData = dataColumns || data;
+        if (lastSentData.current && incomingData === lastSentData.current) {
             lastSentData.current = null;
             return;
         }
 
-        setLocalData(data);
-    }, [data]);
+        // Data tagged with an older revision than we have already applied is a stale echo
+        if (typeof dataRevision === 'number') {
+            if (dataRevision < appliedRevisionRef.current) return;
+            appliedRevisionRef.current = dataRevision;
+        }
+
+        // Clear undo/redo history when data changes externally while our own edit is in flight
+        if (lastSentData.current) {
+            lastSentData.current = null;
+            setUndoStack([]);
+            setRedoStack([]);
+            currentBatchRef.current = [];
+            if (batchTimeoutRef.current) {
+                clearTimeout(batchTimeoutRef.current);
+                batchTimeoutRef.current = null;
+            }
+        }
+
+        setLocalData(createDataStore(data, dataColumns));
+    }, [data, dataColumns, isServerRowModel]);
 
     // Sync local columns with props when columns change from outside
     useEffect(() => {
@@ -643,6 +743,185 @@ const GlideGrid = (props) => {
         setLocalFilters(columnFilters || {});
     }, [columnFilters]);
 
+    // ========== EVENT THROTTLING ==========
+
+    // High-frequency output props (mouseMove, visibleRegion, ...) are sent through a
+    // per-prop throttle configured by eventRateLimits
+    const setPropsRef = useRef(setProps);
+    setPropsRef.current = setProps;
+    const eventRateLimitsRef = useRef(eventRateLimits);
+    eventRateLimitsRef.current = eventRateLimits;
+    const propThrottleRef = useRef(null);
+    if (!propThrottleRef.current) {
+        propThrottleRef.current = createPropThrottle(() => setPropsRef.current);
+    }
+
+    useEffect(() => () => propThrottleRef.current.cancel(), []);
+
+    const emitEvent = useCallback((propName, value) => {
+        const limits = eventRateLimitsRef.current;
+        propThrottleRef.current.emit(propName, value, limits ? limits[propName] : undefined);
+    }, []);
+
+    // ========== SERVER ROW MODEL ==========
+
+    const pendingBlocksRef = useRef(new Map());     // Block index -> time it was requested
+    const blockAccessRef = useRef(new Map());       // Block index -> time it was last in view (for LRU eviction)
+    const blockGenerationRef = useRef(0);           // Bumped whenever the block cache is reset
+    const lastVisibleRowsRef = useRef({ start: 0, end: 0 });
+    const lastRowBlocksRef = useRef(null);
+
+    // Request the blocks covering [startRow, endRow) plus one block either side
+    // Blocks already loaded or recently requested are skipped
+    const requestRowBlocks = useCallback((startRow, endRow) => {
+        const store = localDataRef.current;
+        if (!setProps || !store || store.kind !== 'blocks' || store.length === 0) return;
+
+        const size = store.blockSize;
+        const now = Date.now();
+        const firstBlock = Math.max(0, Math.floor(startRow / size) - 1);
+        const lastBlock = Math.min(Math.ceil(store.length / size) - 1, Math.floor(endRow / size) + 1);
+
+        let missingStart = null;
+        let missingEnd = null;
+        for (let block = firstBlock; block <= lastBlock; block++) {
+            blockAccessRef.current.set(block, now);
+            if (store.isBlockLoaded(block)) continue;
+            const requestedAt = pendingBlocksRef.current.get(block);
+            if (requestedAt && now - requestedAt < BLOCK_REQUEST_TIMEOUT) continue;
+            if (missingStart === null) missingStart = block;
+            missingEnd = block;
+        }
+        if (missingStart === null) return;
+
+        for (let block = missingStart; block <= missingEnd; block++) {
+            pendingBlocksRef.current.set(block, now);
+        }
+
+        setProps({
+            rowBlockRequest: {
+                startRow: missingStart * size,
+                endRow: Math.min((missingEnd + 1) * size, store.length),
+                blockSize: size,
+                sortColumns: localSortColumns,
+                columnFilters: localFilters,
+                generation: blockGenerationRef.current,
+                timestamp: now
+            }
+        });
+    }, [setProps, localSortColumns, localFilters]);
+
+    // Reset the block cache when the row count, sort or filters change (row indices no longer match)
+    useEffect(() => {
+        if (!isServerRowModel) return;
+
+        blockGenerationRef.current += 1;
+        pendingBlocksRef.current.clear();
+        blockAccessRef.current.clear();
+
+        const emptyStore = createBlockStore(rows, blockSize);
+        localDataRef.current = emptyStore;
+        setLocalData(emptyStore);
+
+        const { start, end } = lastVisibleRowsRef.current;
+        requestRowBlocks(start, end);
+    }, [isServerRowModel, rows, blockSize, localSortColumns, localFilters]);
+
+    // Merge blocks sent by the server into the block store
+    useEffect(() => {
+        if (!isServerRowModel || !rowBlocks || rowBlocks === lastRowBlocksRef.current) return;
+        lastRowBlocksRef.current = rowBlocks;
+
+        // Ignore answers to requests made before the last cache reset
+        if (typeof rowBlocks.generation === 'number' && rowBlocks.generation !== blockGenerationRef.current) return;
+
+        let store = localDataRef.current;
+        if (!store || store.kind !== 'blocks') return;
+
+        const startRow = rowBlocks.startRow || 0;
+        const segmentStore = createDataStore(rowBlocks.data, rowBlocks.dataColumns);
+        store = store.withSegment(startRow, segmentStore, rowBlocks.totalRows);
+
+        const now = Date.now();
+        const size = store.blockSize;
+        for (let block = Math.floor(startRow / size); block * size < startRow + segmentStore.length; block++) {
+            pendingBlocksRef.current.delete(block);
+            if (!blockAccessRef.current.has(block)) {
+                blockAccessRef.current.set(block, now);
+            }
+        }
+
+        // Evict the least recently visible blocks beyond the cache limit
+        const loadedBlocks = store.loadedBlocks();
+        const maxBlocks = maxCachedBlocks || 50;
+        if (loadedBlocks.length > maxBlocks) {
+            const lastAccess = (block) => blockAccessRef.current.get(block) || 0;
+            loadedBlocks.sort((a, b) => lastAccess(a) - lastAccess(b));
+            const evicted = loadedBlocks.slice(0, loadedBlocks.length - maxBlocks);
+            evicted.forEach(block => blockAccessRef.current.delete(block));
+            store = store.withoutBlocks(evicted);
+        }
+
+        localDataRef.current = store;
+        setLocalData(store);
+    }, [rowBlocks, isServerRowModel, maxCachedBlocks]);
+
+    // ========== EDIT COMMIT ==========
+
+    // Built cells by (data row, column), see getCellContent
+    const cellCacheRef = useRef(null);
+    if (!cellCacheRef.current) {
+        cellCacheRef.current = createCellCache(MAX_CACHED_CELLS);
+    }
+
+    // Apply a list of cell edits to local data and sync them to Dash.
+    // Each edit is {row, col, columnId, oldValue, newValue} where row is the data row index.
+    // Only the touched rows (or columns, for columnar data) are copied.
+    // In 'full' mode the whole dataset is sent back as `data` (or `dataColumns`).
+    // In 'patch' mode only the edits are sent, as `dataPatch`.
+    const commitDataEdits = useCallback((edits, source, eventProps = {}) => {
+        // The server row model has no full dataset to send, so it always syncs patches
+        const isPatchMode = dataSyncMode === 'patch' || localDataRef.current.kind === 'blocks';
+        const newData = localDataRef.current.withEdits(edits);
+
+        // Keep cached cells and filter indexes for everything the edits didn't touch
+        cellCacheRef.current.applyEdits(edits, newData);
+        carryFilterIndexes(localDataRef.current, newData, edits, getCellDisplayValue);
+
+        // Update local state immediately (optimistic update)
+        setLocalData(newData);
+
+        // CRITICAL: Update the ref immediately so the next edit sees the updated data
+        localDataRef.current = newData;
+
+        if (!setProps) return newData;
+
+        if (isPatchMode) {
+            setProps({
+                dataPatch: {
+                    edits: edits.map(edit => ({
+                        row: edit.row,
+                        col: edit.col,
+                        columnId: edit.columnId,
+                        oldValue: edit.oldValue,
+                        value: edit.newValue
+                    })),
+                    source,
+                    timestamp: Date.now()
+                },
+                ...eventProps
+            });
+        } else {
+            // Store this data so we can ignore it when it comes back from Dash
+            const dataProp = newData.kind === 'columns' ? 'dataColumns' : 'data';
+            lastSentData.current = newData.source;
+            appliedRevisionRef.current += 1;
+            setProps({ [dataProp]: newData.source, dataRevision: appliedRevisionRef.current, ...eventProps });
+        }
+
+        return newData;
+    }, [dataSyncMode, setProps]);
+
     // ========== UNDO/REDO FUNCTIONS ==========
 
     // Helper to add an edit to the current batch
@@ -660,45 +939,30 @@ const GlideGrid = (props) => {
         // Set new timeout to finalize batch
         batchTimeoutRef.current = setTimeout(() => {
             if (currentBatchRef.current.length > 0) {
-                const batch = [...currentBatchRef.current];
+                // Range-encode the batch so large pastes/fills don't keep one object per cell
+                const batch = encodeBatch(currentBatchRef.current);
                 currentBatchRef.current = [];
 
-                // Limit undo stack size
+                // Limit undo stack size (steps and bytes, oldest dropped first)
                 const maxSteps = maxUndoSteps || 50;
-                setUndoStack(prev => {
-                    const newStack = [...prev, batch];
-                    if (newStack.length > maxSteps) {
-                        return newStack.slice(-maxSteps);
-                    }
-                    return newStack;
-                });
+                setUndoStack(prev => trimHistory([...prev, batch], maxSteps, maxUndoBytes));
 
                 // Clear redo stack when new edit is made
                 setRedoStack([]);
             }
         }, 100);  // 100ms batch window
-    }, [enableUndoRedo, maxUndoSteps]);
+    }, [enableUndoRedo, maxUndoSteps, maxUndoBytes]);
 
     // Perform undo operation
     const performUndo = useCallback(() => {
         if (!enableUndoRedo || undoStack.length === 0) return;
 
         const batch = undoStack[undoStack.length - 1];
-        const currentData = localDataRef.current;
-        const newData = currentData.map(r => ({ ...r }));
 
-        // Apply edits in reverse order, restoring old values
+        // Restore old values
         isApplyingUndoRedoRef.current = true;
 
-        for (let i = batch.length - 1; i >= 0; i--) {
-            const edit = batch[i];
-            newData[edit.row] = { ...newData[edit.row], [edit.columnId]: edit.oldValue };
-        }
-
-        // Update local state
-        setLocalData(newData);
-        localDataRef.current = newData;
-        lastSentData.current = newData;
+        const edits = decodeBatch(batch, 'undo');
 
         // Move batch to redo stack
         setUndoStack(prev => prev.slice(0, -1));
@@ -707,53 +971,39 @@ const GlideGrid = (props) => {
         // Set lastUpdated timestamps for flash effect on all affected cells
         if (shouldFlash('undo')) {
             const now = performance.now();
-            const updatedCells = {};
-            for (const edit of batch) {
-                updatedCells[`${edit.row},${edit.col}`] = now;
+            for (const edit of edits) {
+                flashTracker.add(edit.row, edit.col, now);
             }
-            setLastUpdatedCells(prev => ({ ...prev, ...updatedCells }));
         }
 
-        // Sync with Dash
-        if (setProps) {
-            setProps({
-                data: newData,
-                undoRedoPerformed: {
-                    action: 'undo',
-                    timestamp: Date.now()
-                }
-            });
-        }
+        // Update local state and sync with Dash
+        commitDataEdits(edits, 'undo', {
+            undoRedoPerformed: {
+                action: 'undo',
+                timestamp: Date.now()
+            }
+        });
 
         // Refresh grid display
         if (gridRef.current) {
             gridRef.current.updateCells(
-                batch.map(edit => ({ cell: [edit.col, edit.row] }))
+                edits.map(edit => ({ cell: [edit.col, edit.row] }))
             );
         }
 
         isApplyingUndoRedoRef.current = false;
-    }, [enableUndoRedo, undoStack, setProps]);
+    }, [enableUndoRedo, undoStack, commitDataEdits]);
 
     // Perform redo operation
     const performRedo = useCallback(() => {
         if (!enableUndoRedo || redoStack.length === 0) return;
 
         const batch = redoStack[redoStack.length - 1];
-        const currentData = localDataRef.current;
-        const newData = currentData.map(r => ({ ...r }));
 
-        // Apply edits in forward order, applying new values
+        // Apply new values
         isApplyingUndoRedoRef.current = true;
 
-        for (const edit of batch) {
-            newData[edit.row] = { ...newData[edit.row], [edit.columnId]: edit.newValue };
-        }
-
-        // Update local state
-        setLocalData(newData);
-        localDataRef.current = newData;
-        lastSentData.current = newData;
+        const edits = decodeBatch(batch, 'redo');
 
         // Move batch to undo stack
         setRedoStack(prev => prev.slice(0, -1));
@@ -762,33 +1012,28 @@ const GlideGrid = (props) => {
         // Set lastUpdated timestamps for flash effect on all affected cells
         if (shouldFlash('redo')) {
             const now = performance.now();
-            const updatedCells = {};
-            for (const edit of batch) {
-                updatedCells[`${edit.row},${edit.col}`] = now;
+            for (const edit of edits) {
+                flashTracker.add(edit.row, edit.col, now);
             }
-            setLastUpdatedCells(prev => ({ ...prev, ...updatedCells }));
         }
 
-        // Sync with Dash
-        if (setProps) {
-            setProps({
-                data: newData,
-                undoRedoPerformed: {
-                    action: 'redo',
-                    timestamp: Date.now()
-                }
-            });
-        }
+        // Update local state and sync with Dash
+        commitDataEdits(edits, 'redo', {
+            undoRedoPerformed: {
+                action: 'redo',
+                timestamp: Date.now()
+            }
+        });
 
         // Refresh grid display
         if (gridRef.current) {
             gridRef.current.updateCells(
-                batch.map(edit => ({ cell: [edit.col, edit.row] }))
+                edits.map(edit => ({ cell: [edit.col, edit.row] }))
             );
         }
 
         isApplyingUndoRedoRef.current = false;
-    }, [enableUndoRedo, redoStack, setProps]);
+    }, [enableUndoRedo, redoStack, commitDataEdits]);
 
     // Sync canUndo/canRedo to Dash
     useEffect(() => {
@@ -851,455 +1096,215 @@ const GlideGrid = (props) => {
         gridRef.current.remeasureColumns(selection);
     }, [remeasureColumns, localColumns]);
 
-    // Clear undo/redo history when data changes externally
-    useEffect(() => {
-        // Only clear if we're not the ones who changed the data
-        if (lastSentData.current && JSON.stringify(data) !== JSON.stringify(lastSentData.current)) {
-            setUndoStack([]);
-            setRedoStack([]);
-            currentBatchRef.current = [];
-            if (batchTimeoutRef.current) {
-                clearTimeout(batchTimeoutRef.current);
-                batchTimeoutRef.current = null;
-            }
-        }
-    }, [data]);
-
-    // Helper to get display value from a cell for filtering
-    const getCellDisplayValue = useCallback((cellValue) => {
-        // Handle null/undefined/empty
-        if (cellValue === null || cellValue === undefined) {
-            return '(Blank)';
-        }
-        if (cellValue === '') {
-            return '(Blank)';
-        }
-
-        // Handle primitives directly
-        if (typeof cellValue !== 'object') {
-            return cellValue;
-        }
-
-        // Handle cell objects with kind property
-        const kind = cellValue.kind;
-
-        if (!kind) {
-            // Legacy object without kind
-            const data = cellValue.data;
-            if (data === null || data === undefined || data === '') {
-                return '(Blank)';
-            }
-            if (typeof data !== 'object') {
-                return data;
-            }
-            return JSON.stringify(data);
-        }
-
-        // Handle custom cell types
-        switch (kind) {
-            case 'dropdown-cell': {
-                const value = cellValue.data?.value;
-                if (!value) return '(Blank)';
-                // Try to find matching option with label
-                const options = cellValue.data?.options || cellValue.data?.allowedValues || [];
-                const matchedOption = options.find(opt =>
-                    (typeof opt === 'object' ? opt.value : opt) === value
-                );
-                if (matchedOption && typeof matchedOption === 'object' && matchedOption.label) {
-                    return matchedOption.label;
-                }
-                return value;
-            }
-
-            case 'multi-select-cell': {
-                const values = cellValue.data?.values || [];
-                if (values.length === 0) return '(Blank)';
-                // Try to resolve labels
-                const options = cellValue.data?.options || [];
-                const labels = values.map(v => {
-                    const opt = options.find(o =>
-                        (typeof o === 'object' ? o.value : o) === v
-                    );
-                    return (opt && typeof opt === 'object' && opt.label) ? opt.label : v;
-                });
-                return labels.join(', ');
-            }
-
-            case 'button-cell':
-                return cellValue.title || 'Button';
-
-            case 'tags-cell': {
-                const tags = cellValue.tags || [];
-                if (tags.length === 0) return '(Blank)';
-                return tags.join(', ');
-            }
-
-            case 'user-profile-cell':
-                return cellValue.name || '(Blank)';
-
-            case 'spinner-cell':
-                return '(Loading)';
-
-            case 'star-cell': {
-                const rating = cellValue.rating || 0;
-                const maxStars = cellValue.maxStars || 5;
-                return `${rating}/${maxStars}`;
-            }
-
-            case 'date-picker-cell': {
-                if (cellValue.displayDate) return cellValue.displayDate;
-                if (!cellValue.date) return '(Blank)';
-                try {
-                    const d = new Date(cellValue.date);
-                    if (!isNaN(d.getTime())) {
-                        return d.toLocaleDateString();
-                    }
-                } catch {
-                    // Fall through
-                }
-                return cellValue.date;
-            }
-
-            case 'range-cell': {
-                if (cellValue.label !== undefined && cellValue.label !== null) {
-                    return String(cellValue.label);
-                }
-                return cellValue.value ?? 0;
-            }
-
-            case 'links-cell': {
-                const links = cellValue.links || [];
-                if (links.length === 0) return '(Blank)';
-                const titles = links.map(l => l.title || l.href || 'Link');
-                return titles.join(', ');
-            }
-
-            case 'sparkline-cell': {
-                const values = cellValue.values || [];
-                if (values.length === 0) return '(Blank)';
-                const sum = values.reduce((a, b) => a + (b || 0), 0);
-                const avg = sum / values.length;
-                return `Sparkline (avg: ${avg.toFixed(1)})`;
-            }
-
-            case 'tree-view-cell':
-                return cellValue.text || '(Blank)';
-
-            // Built-in cell types
-            case 'markdown':
-                return cellValue.data || '(Blank)';
-
-            case 'uri':
-                // Use displayData if available, otherwise the URL
-                return cellValue.displayData || cellValue.data || '(Blank)';
-
-            case 'image': {
-                // Image data is an array of URLs
-                const images = cellValue.data || [];
-                if (images.length === 0) return '(Blank)';
-                return `${images.length} image${images.length > 1 ? 's' : ''}`;
-            }
-
-            case 'bubble': {
-                // Bubble data is an array of strings
-                const bubbles = cellValue.data || [];
-                if (bubbles.length === 0) return '(Blank)';
-                return bubbles.join(', ');
-            }
+    // Unique values and their counts for the column whose filter menu is open
+    // Cached per column and data store by the filter engine, so re-renders don't rescan the column
+    const filterMenuValues = useMemo(() => {
+        const colIndex = filterMenuState.columnIndex;
+        if (colIndex === null || !localData || !localColumns) return { values: [], counts: [] };
+        // Get column id to access dict key
+        const columnDef = localColumns[colIndex];
+        const columnId = columnDef?.id || columnDef?.title;
+        return getColumnValueCounts(localData, columnId, getCellDisplayValue);
+    }, [filterMenuState.columnIndex, localData, localColumns]);
+
+    // Row order computed by the server (sortMode/filterMode="server")
+    const serverRowOrder = useMemo(() => {
+        if (!rowOrder || (!isServerSort && !isServerFilter)) return null;
+        return isEncodedColumn(rowOrder) ? decodeColumn(rowOrder) : rowOrder;
+    }, [rowOrder, isServerSort, isServerFilter]);
+
+    // Filters and sort columns to apply on the client, by column id
+    // null when the server owns sorting and filtering (server row model)
+    const viewRequest = useMemo(() => {
+        if (!localData || isServerRowModel) return null;
+
+        // Start with the server's row order if there is one, otherwise all indices
+        // Excluded hidden rows are left out up front (null means all rows)
+        let baseRows = null;
+        if (serverRowOrder) {
+            baseRows = Array.from(serverRowOrder).filter(idx => (
+                idx >= 0 && idx < localData.length && !(excludedRows && excludedRows.has(idx))
+            ));
+        } else if (excludedRows) {
+            baseRows = rowsNotIn(excludedRows, localData.length);
+        }
+
+        // Filters are skipped when the server filters
+        const filters = isServerFilter ? [] : Object.entries(localFilters).map(([colIndexStr, selectedValues]) => {
+            // Get column id to access dict key
+            const columnDef = localColumns?.[parseInt(colIndexStr, 10)];
+            return { columnId: columnDef?.id || columnDef?.title, selectedValues };
+        });
 
-            case 'drilldown': {
-                // Drilldown data is an array of objects with text property
-                const items = cellValue.data || [];
-                if (items.length === 0) return '(Blank)';
-                return items.map(item => item.text || '').filter(Boolean).join(', ');
-            }
+        // Sorting only if sortable and we have sort columns, skipped when the server sorts
+        const sortColumnsToApply = isServerSort || !sortable ? [] : (localSortColumns || []);
+        const sort = sortColumnsToApply.map(({ columnIndex, direction }) => {
+            // Get column id to access dict key
+            const columnDef = localColumns?.[columnIndex];
+            return { columnId: columnDef?.id || columnDef?.title, direction };
+        });
 
-            case 'loading':
-                return '(Loading)';
+        return { baseRows, filters, sort };
+    }, [localData, localColumns, localFilters, sortable, localSortColumns, isServerRowModel, serverRowOrder, isServerSort, isServerFilter, excludedRows]);
 
-            case 'rowid':
-                return cellValue.data || '(Blank)';
+    // ========== COMPUTE WORKER ==========
 
-            case 'protected':
-                return '(Protected)';
+    // computeWorker: sort/filter off the main thread (see computeWorker.js)
+    const [workerFailed, setWorkerFailed] = useState(false);
+    const [workerResult, setWorkerResult] = useState(null);
+    const computeWorkerRef = useRef(null);
+    const isWorkerCompute = !!computeWorker && !workerFailed && !isServerRowModel && canUseComputeWorker();
 
-            default: {
-                // Unknown cell type - try data property
-                const innerData = cellValue.data;
-                if (innerData === null || innerData === undefined || innerData === '') {
-                    return '(Blank)';
-                }
-                if (typeof innerData !== 'object') {
-                    return innerData;
-                }
-                return JSON.stringify(innerData);
-            }
+    useEffect(() => {
+        if (!isWorkerCompute) return undefined;
+        let client;
+        try {
+            client = createComputeWorker(() => setWorkerFailed(true));
+        } catch (e) {
+            // e.g. a Content-Security-Policy without worker-src blob:
+            console.warn('[GlideGrid] computeWorker unavailable, sorting and filtering on the main thread:', e);
+            setWorkerFailed(true);
+            return undefined;
         }
-    }, []);
+        computeWorkerRef.current = client;
+        return () => {
+            client.terminate();
+            computeWorkerRef.current = null;
+        };
+    }, [isWorkerCompute]);
 
-    // Helper to extract a sortable value from any cell type
-    const extractSortValue = useCallback((cellValue) => {
-        // Handle null/undefined
-        if (cellValue === null || cellValue === undefined) {
-            return { value: null, type: 'string' };
-        }
+    // Ask the worker for a new order; the previous order stays on screen meanwhile
+    useEffect(() => {
+        const client = computeWorkerRef.current;
+        if (!isWorkerCompute || !client || !viewRequest) return undefined;
 
-        // Handle primitives directly
-        if (typeof cellValue !== 'object') {
-            if (typeof cellValue === 'number') {
-                return { value: cellValue, type: 'number' };
-            }
-            if (typeof cellValue === 'boolean') {
-                return { value: cellValue ? 1 : 0, type: 'number' };
-            }
-            return { value: String(cellValue), type: 'string' };
+        const { baseRows, filters, sort } = viewRequest;
+        if (!baseRows && filters.length === 0 && sort.length === 0) {
+            setWorkerResult(null);
+            return undefined;
         }
 
-        // Handle cell objects with kind property
-        const kind = cellValue.kind;
+        let cancelled = false;
+        client.compute(localData, viewRequest).then(order => {
+            // null: superseded by a newer request
+            if (cancelled || !order) return;
+            setWorkerResult({ store: localData, indices: Array.from(order) });
+        });
+        return () => {
+            cancelled = true;
+        };
+    }, [isWorkerCompute, viewRequest, localData]);
 
-        if (!kind) {
-            // Legacy object without kind - try to extract meaningful value
-            if (cellValue.data !== undefined) {
-                return extractSortValue(cellValue.data);
-            }
-            // Fallback to JSON stringification
-            try {
-                return { value: JSON.stringify(cellValue), type: 'string' };
-            } catch {
-                return { value: '', type: 'string' };
-            }
+    // Last order from the worker, minus rows that no longer exist
+    const workerDisplayIndices = useMemo(() => {
+        if (!workerResult) return null;
+        if (!localData || workerResult.store === localData || localData.length >= workerResult.store.length) {
+            return workerResult.indices;
         }
+        return workerResult.indices.filter(idx => idx < localData.length);
+    }, [workerResult, localData]);
 
-        // Handle custom cell types
-        switch (kind) {
-            case 'dropdown-cell':
-                return { value: cellValue.data?.value || '', type: 'string' };
-
-            case 'multi-select-cell': {
-                const values = cellValue.data?.values || [];
-                return { value: [...values].sort().join(', '), type: 'string' };
-            }
-
-            case 'button-cell':
-                // Buttons are not meaningfully sortable
-                return { value: null, type: 'unsortable' };
-
-            case 'tags-cell': {
-                const tags = cellValue.tags || [];
-                return { value: [...tags].sort().join(', '), type: 'string' };
-            }
-
-            case 'user-profile-cell':
-                return { value: cellValue.name || '', type: 'string' };
-
-            case 'spinner-cell':
-                // Spinners are not sortable (loading state)
-                return { value: null, type: 'unsortable' };
-
-            case 'star-cell':
-                return { value: cellValue.rating || 0, type: 'number' };
-
-            case 'date-picker-cell':
-                // ISO date strings sort correctly with localeCompare
-                return { value: cellValue.date || '', type: 'date' };
-
-            case 'range-cell':
-                return { value: cellValue.value ?? 0, type: 'number' };
-
-            case 'links-cell': {
-                const links = cellValue.links || [];
-                if (links.length === 0) return { value: '', type: 'string' };
-                return { value: links[0]?.title || links[0]?.href || '', type: 'string' };
-            }
+    // Compute display indices - combines filtering and sorting
+    // Maps display row index to original data row index
+    const mainThreadDisplayIndices = useMemo(() => {
+        if (!viewRequest || isWorkerCompute) return null;
+        const { baseRows, filters, sort } = viewRequest;
 
-            case 'sparkline-cell': {
-                const sparkValues = cellValue.values || [];
-                if (sparkValues.length === 0) return { value: 0, type: 'number' };
-                const sum = sparkValues.reduce((acc, v) => acc + (v || 0), 0);
-                const avg = sum / sparkValues.length;
-                return { value: avg, type: 'number' };
-            }
+        // Return null if no filtering/sorting applied (identity mapping)
+        if (!baseRows && filters.length === 0 && sort.length === 0) return null;
 
-            case 'tree-view-cell':
-                return { value: cellValue.text || '', type: 'string' };
+        let indices = baseRows || Array.from({ length: localData.length }, (_, i) => i);
 
-            // Built-in cell types
-            case 'markdown':
-                return { value: cellValue.data || '', type: 'string' };
+        // Step 1: Apply filters
+        // Uses a per-column value index built once per data store (see filterEngine)
+        if (filters.length > 0) {
+            indices = filterRows(localData, filters, getCellDisplayValue, baseRows);
+        }
 
-            case 'uri':
-                // Sort by displayData if available, otherwise URL
-                return { value: cellValue.displayData || cellValue.data || '', type: 'string' };
+        // Step 2: Apply sorting
+        // Sort keys are extracted once per column and the permutation is cached (see sortEngine)
+        if (sort.length > 0) {
+            const allRows = !baseRows && filters.length === 0;
+            indices = sortRows(localData, sort, allRows ? null : indices, extractSortValue);
+        }
 
-            case 'image': {
-                // Sort by number of images
-                const images = cellValue.data || [];
-                return { value: images.length, type: 'number' };
-            }
+        return indices;
+    }, [viewRequest, isWorkerCompute, localData]);
 
-            case 'bubble': {
-                // Sort by joined bubble values
-                const bubbles = cellValue.data || [];
-                return { value: [...bubbles].sort().join(', '), type: 'string' };
-            }
+    const displayIndices = isWorkerCompute ? workerDisplayIndices : mainThreadDisplayIndices;
 
-            case 'drilldown': {
-                // Sort by first item's text
-                const items = cellValue.data || [];
-                if (items.length === 0) return { value: '', type: 'string' };
-                return { value: items[0]?.text || '', type: 'string' };
-            }
+    // Alias for backwards compatibility - displayIndices now handles both filtering and sorting
+    const sortedIndices = displayIndices;
 
-            case 'loading':
-                // Loading cells are not meaningfully sortable
-                return { value: null, type: 'unsortable' };
+    // ========== INDEXED SEARCH ==========
 
-            case 'rowid':
-                return { value: cellValue.data || '', type: 'string' };
+    // searchIndex: search a per-column trigram index instead of Glide's cell-by-cell search
+    const isIndexedSearch = !!searchIndex && !isServerRowModel;
+    const searchNavIndexRef = useRef(-1);
 
-            case 'protected':
-                // Protected cells are not meaningfully sortable
-                return { value: null, type: 'unsortable' };
+    // Matching cells as [col, displayRow], passed to Glide for highlighting and next/previous
+    const indexedSearchResults = useMemo(() => {
+        if (!isIndexedSearch) return undefined;
+        return searchCells(localData, localColumns, localSearchValue, displayIndices, getCellDisplayValue, hiddenRowsSet);
+    }, [isIndexedSearch, localData, localColumns, localSearchValue, displayIndices, hiddenRowsSet]);
 
-            default: {
-                // Unknown custom cell - try to extract data property
-                if (cellValue.data !== undefined) {
-                    return extractSortValue(cellValue.data);
-                }
-                try {
-                    return { value: JSON.stringify(cellValue), type: 'string' };
-                } catch {
-                    return { value: '', type: 'string' };
-                }
+    // Report the match count and (the first) match positions as data rows
+    const reportSearchResults = useCallback((results, current) => {
+        if (!setProps) return;
+        const matches = results.slice(0, MAX_REPORTED_SEARCH_MATCHES).map(([col, displayRow]) => ({
+            row: displayIndices ? displayIndices[displayRow] : displayRow,
+            col,
+            displayRow
+        }));
+        setProps({
+            searchResults: {
+                query: localSearchValue,
+                count: results.length,
+                matches,
+                truncated: results.length > MAX_REPORTED_SEARCH_MATCHES,
+                current
             }
-        }
-    }, []);
-
-    // Compute unique values for a column (for filter menu)
-    const getUniqueColumnValues = useCallback((colIndex) => {
-        if (!localData || !localColumns) return [];
-        // Get column id to access dict key
-        const columnDef = localColumns[colIndex];
-        const columnId = columnDef?.id || columnDef?.title;
+        });
+    }, [setProps, displayIndices, localSearchValue]);
 
-        const valueSet = new Set();
-        localData.forEach(row => {
-            if (row) {
-                const val = getCellDisplayValue(row[columnId]);
-                valueSet.add(val);
+    useEffect(() => {
+        if (!indexedSearchResults) return;
+        searchNavIndexRef.current = -1;
+        reportSearchResults(indexedSearchResults, -1);
+    }, [indexedSearchResults]);
+
+    // Glide's search box arrows move through the results
+    const handleSearchResultsChanged = useCallback((results, navIndex) => {
+        if (!indexedSearchResults || navIndex === searchNavIndexRef.current) return;
+        searchNavIndexRef.current = navIndex;
+        reportSearchResults(indexedSearchResults, navIndex);
+    }, [indexedSearchResults, reportSearchResults]);
+
+    // Jump to the next/previous match from Dash (searchNavigate prop)
+    useEffect(() => {
+        if (!searchNavigate || !indexedSearchResults || indexedSearchResults.length === 0) return;
+
+        const count = indexedSearchResults.length;
+        const step = searchNavigate.direction === 'prev' ? -1 : 1;
+        const previous = searchNavIndexRef.current;
+        const current = previous < 0
+            ? (step > 0 ? 0 : count - 1)
+            : (previous + step + count) % count;
+        searchNavIndexRef.current = current;
+
+        const [col, row] = indexedSearchResults[current];
+        gridRef.current?.scrollTo(col, row, 'both', 0, 0, { hAlign: 'center', vAlign: 'center' });
+        setGridSelection({
+            columns: CompactSelection.empty(),
+            rows: CompactSelection.empty(),
+            current: {
+                cell: [col, row],
+                range: { x: col, y: row, width: 1, height: 1 },
+                rangeStack: []
             }
         });
-        // Sort with (Blank) first
-        return Array.from(valueSet).sort((a, b) => {
-            if (a === '(Blank)') return -1;
-            if (b === '(Blank)') return 1;
-            return String(a).localeCompare(String(b));
-        });
-    }, [localData, localColumns, getCellDisplayValue]);
-
-    // Compute display indices - combines filtering and sorting
-    // Maps display row index to original data row index
-    const displayIndices = useMemo(() => {
-        if (!localData) return null;
-
-        // Start with all indices
-        let indices = localData.map((_, i) => i);
-
-        // Step 1: Apply filters
-        const filterEntries = Object.entries(localFilters);
-        if (filterEntries.length > 0) {
-            indices = indices.filter(idx => {
-                const rowData = localData[idx];
-                if (!rowData) return false;
-
-                // Check all active filters
-                for (const [colIndexStr, selectedValues] of filterEntries) {
-                    const colIndex = parseInt(colIndexStr, 10);
-                    // Get column id to access dict key
-                    const columnDef = localColumns?.[colIndex];
-                    const columnId = columnDef?.id || columnDef?.title;
-
-                    const cellValue = getCellDisplayValue(rowData[columnId]);
-
-                    // If selectedValues is null or empty array, filter out everything
-                    if (!selectedValues || selectedValues.length === 0) {
-                        return false;
-                    }
-
-                    // Check if this cell's value is in the selected values
-                    if (!selectedValues.includes(cellValue)) {
-                        return false;
-                    }
-                }
-                return true;
-            });
-        }
-
-        // Step 2: Apply sorting (only if sortable and we have sort columns)
-        if (sortable && localSortColumns && localSortColumns.length > 0) {
-            indices.sort((a, b) => {
-                for (const sortCol of localSortColumns) {
-                    const { columnIndex, direction } = sortCol;
-                    // Get column id to access dict key
-                    const columnDef = localColumns?.[columnIndex];
-                    const columnId = columnDef?.id || columnDef?.title;
-
-                    // Extract sortable values using our helper
-                    const extractedA = extractSortValue(localData[a]?.[columnId]);
-                    const extractedB = extractSortValue(localData[b]?.[columnId]);
-
-                    const valA = extractedA.value;
-                    const valB = extractedB.value;
-                    const typeA = extractedA.type;
-                    const typeB = extractedB.type;
-
-                    // Skip unsortable cells (treat as equal)
-                    if (typeA === 'unsortable' && typeB === 'unsortable') continue;
-                    if (typeA === 'unsortable') return direction === 'asc' ? 1 : -1;
-                    if (typeB === 'unsortable') return direction === 'asc' ? -1 : 1;
-
-                    // Handle null/undefined (nulls sort to end)
-                    if (valA == null && valB == null) continue;
-                    if (valA == null) return direction === 'asc' ? 1 : -1;
-                    if (valB == null) return direction === 'asc' ? -1 : 1;
-
-                    // Compare based on extracted type
-                    let comparison = 0;
-
-                    if (typeA === 'number' && typeB === 'number') {
-                        // Numeric comparison
-                        comparison = valA - valB;
-                    } else if (typeA === 'date' && typeB === 'date') {
-                        // Date comparison (ISO strings compare correctly with localeCompare)
-                        comparison = String(valA).localeCompare(String(valB));
-                    } else {
-                        // String comparison (case-insensitive)
-                        const strA = String(valA).toLowerCase();
-                        const strB = String(valB).toLowerCase();
-                        comparison = strA.localeCompare(strB);
-                    }
-
-                    if (comparison !== 0) {
-                        return direction === 'asc' ? comparison : -comparison;
-                    }
-                }
-                return 0;
-            });
-        }
-
-        // Return null if no filtering/sorting applied (identity mapping)
-        if (indices.length === localData.length &&
-            filterEntries.length === 0 &&
-            (!sortable || !localSortColumns || localSortColumns.length === 0)) {
-            return null;
-        }
-
-        return indices;
-    }, [localData, localColumns, localFilters, sortable, localSortColumns, getCellDisplayValue, extractSortValue]);
-
-    // Alias for backwards compatibility - displayIndices now handles both filtering and sorting
-    const sortedIndices = displayIndices;
+        reportSearchResults(indexedSearchResults, current);
+    }, [searchNavigate]);
 
     // Button cell click handler - fires buttonClicked prop to Dash
     const buttonClickHandler = useCallback((info) => {
@@ -1808,10 +1813,139 @@ const GlideGrid = (props) => {
 
     // Calculate number of rows (use filtered count if filtering is active)
     const numRows = useMemo(() => {
+        if (isServerRowModel) return localData.length;
         if (rows) return rows;
         if (displayIndices) return displayIndices.length;
         return localData ? localData.length : 0;
-    }, [rows, displayIndices, localData]);
+    }, [rows, displayIndices, localData, isServerRowModel]);
+
+    // ========== STYLE RULES ==========
+
+    // Declarative styleRules, evaluated lazily once per row per data store
+    const styleIndex = useMemo(() => {
+        if (!styleRules || styleRules.length === 0) return null;
+        return createStyleIndex(localData, localColumns, styleRules, styleThemes);
+    }, [localData, localColumns, styleRules, styleThemes]);
+
+    // ========== STREAMING APPEND ==========
+
+    const numRowsRef = useRef(numRows);
+    numRowsRef.current = numRows;
+    const pinToTailRef = useRef(false);
+
+    // Append streamed rows in place (the full data is never resent)
+    // With maxRows the oldest rows are dropped, like a ring buffer
+    useEffect(() => {
+        if (!appendRows || isServerRowModel) return;
+
+        const appended = Array.isArray(appendRows)
+            ? createDataStore(appendRows, null)
+            : createDataStore(null, appendRows);
+        if (appended.length === 0) return;
+
+        // Stay pinned to the tail if the user was already looking at the last row
+        const { end } = lastVisibleRowsRef.current;
+        pinToTailRef.current = end >= numRowsRef.current - 1;
+
+        const prevData = localDataRef.current;
+        const newData = prevData.withAppended(appended, maxRows);
+        const dropped = prevData.length + appended.length - newData.length;
+        localDataRef.current = newData;
+        setLocalData(newData);
+
+        // Dropping rows shifts every data row index, so undo history no longer lines up
+        if (dropped > 0) {
+            setUndoStack([]);
+            setRedoStack([]);
+            currentBatchRef.current = [];
+        }
+
+        // Flashes follow their rows when rows are dropped from the top
+        flashTracker.shiftRows(dropped);
+        if (shouldFlash('append')) {
+            const firstNewRow = newData.length - Math.min(appended.length, newData.length);
+            const numCols = localColumns ? localColumns.length : 0;
+            const now = performance.now();
+            for (let row = firstNewRow; row < newData.length; row++) {
+                for (let col = 0; col < numCols; col++) {
+                    flashTracker.add(row, col, now);
+                }
+            }
+        }
+    }, [appendRows]);
+
+    // Scroll to the new last row once appended rows are rendered
+    useEffect(() => {
+        if (!pinToTailRef.current || !gridRef.current || numRows === 0) return;
+        pinToTailRef.current = false;
+        gridRef.current.scrollTo(0, numRows - 1, 'vertical', 0, 0, { vAlign: 'end' });
+    }, [numRows]);
+
+    // ========== SPARSE CELL UPDATES ==========
+
+    // Data row -> display row (-1 if filtered out), built only when cell updates need it
+    const displayRowLookupRef = useRef({ indices: undefined, lookup: null });
+    const getDisplayRow = useCallback((dataRow) => {
+        if (!displayIndices) return dataRow;
+        const cache = displayRowLookupRef.current;
+        if (cache.indices !== displayIndices) {
+            const lookup = new Int32Array(localDataRef.current.length).fill(-1);
+            displayIndices.forEach((row, displayRow) => {
+                if (row < lookup.length) lookup[row] = displayRow;
+            });
+            displayRowLookupRef.current = { indices: displayIndices, lookup };
+        }
+        const { lookup } = displayRowLookupRef.current;
+        return dataRow < lookup.length ? lookup[dataRow] : -1;
+    }, [displayIndices]);
+
+    // Write cellUpdates straight into the store and repaint only those cells
+    // No new store is created, so React does not re-render and sorting/filtering is not recomputed
+    useEffect(() => {
+        if (!cellUpdates || !cellUpdates.updates || cellUpdates.updates.length === 0) return;
+
+        const edits = [];
+        const damage = [];
+        const restyledRows = new Set();
+        const flash = shouldFlash('update');
+        const now = performance.now();
+        for (const update of cellUpdates.updates) {
+            const col = typeof update.col === 'number'
+                ? update.col
+                : (localColumns || []).findIndex(c => (c.id || c.title) === update.col);
+            const columnDef = localColumns?.[col];
+            if (!columnDef) continue;
+
+            edits.push({ row: update.row, columnId: columnDef.id || columnDef.title, newValue: update.value });
+            if (flash) flashTracker.add(update.row, col, now);
+            const displayRow = getDisplayRow(update.row);
+            if (displayRow >= 0) {
+                damage.push({ cell: [col, displayRow] });
+                restyledRows.add(displayRow);
+            }
+        }
+
+        localDataRef.current.applyInPlace(edits);
+        cellCacheRef.current.invalidate(edits);
+        invalidateSortCaches(localDataRef.current, edits);
+        computeWorkerRef.current?.invalidate(localDataRef.current, edits);
+        updateFilterIndexes(localDataRef.current, edits, getCellDisplayValue);
+
+        // Row style rules may change with the new values, so repaint the whole rows
+        if (styleIndex) {
+            styleIndex.invalidateRows(edits.map(edit => edit.row));
+            const numCols = localColumns ? localColumns.length : 0;
+            for (const displayRow of restyledRows) {
+                for (let col = 0; col < numCols; col++) {
+                    damage.push({ cell: [col, displayRow] });
+                }
+            }
+        }
+
+        if (gridRef.current && damage.length > 0) {
+            gridRef.current.updateCells(damage);
+        }
+    }, [cellUpdates]);
 
     // getCellContent callback - transforms data to Glide cell format
     const getCellContent = useCallback((cell) => {
@@ -1830,8 +1964,15 @@ const GlideGrid = (props) => {
             };
         }
 
-        const rowData = localData[actualRow];
-        if (!rowData) {
+        // Server row model: rows that haven't arrived yet render as loading cells
+        if (localData.kind === 'blocks' && !localData.isLoaded(actualRow)) {
+            return {
+                kind: GridCellKind.Loading,
+                allowOverlay: false
+            };
+        }
+
+        if (!localData.hasRow(actualRow)) {
             return {
                 kind: GridCellKind.Text,
                 data: '',
@@ -1840,48 +1981,79 @@ const GlideGrid = (props) => {
             };
         }
 
-        // Get column id to access dict key
-        const columnDef = localColumns && localColumns[col];
-        const columnId = columnDef?.id || columnDef?.title;
-        const cellValue = rowData[columnId];
+        // Reuse the built cell unless this cell was edited or the data changed wholesale
+        const cellCache = cellCacheRef.current;
+        cellCache.sync(localData, localColumns, sortedIndices);
+        let cellResult = cellCache.get(actualRow, col);
 
-        // Get the cell object
-        let cellResult;
-        if (cellValue && typeof cellValue === 'object' && cellValue.kind) {
-            cellResult = transformCellObject(cellValue);
-        } else {
-            cellResult = autoDetectCellType(cellValue);
-        }
+        if (cellResult === undefined) {
+            // Get column id to access dict key
+            const columnDef = localColumns && localColumns[col];
+            const columnId = columnDef?.id || columnDef?.title;
+            const cellValue = localData.get(actualRow, columnId);
 
-        // Apply valueFormatter if defined for this column
-        if (columnDef && isFunctionRef(columnDef.valueFormatter)) {
-            try {
-                const formattedValue = executeFunction(
-                    columnDef.valueFormatter.function,
-                    { value: cellResult.data, cell: cellResult, row, col }
-                );
+            // Get the cell object
+            if (cellValue && typeof cellValue === 'object' && cellValue.kind) {
+                cellResult = transformCellObject(cellValue);
+            } else {
+                cellResult = autoDetectCellType(cellValue);
+            }
+
+            // Apply the declarative column format (compiled once per spec)
+            const formatter = columnDef && getFormatter(columnDef.format);
+            if (formatter && (cellResult.kind === GridCellKind.Number || cellResult.kind === GridCellKind.Text)) {
+                const formattedValue = formatter(cellResult.data);
                 if (formattedValue !== undefined) {
                     cellResult = {
                         ...cellResult,
-                        displayData: String(formattedValue)
+                        displayData: formattedValue
                     };
                 }
-            } catch (e) {
-                console.warn('[GlideGrid] valueFormatter error:', e);
             }
+
+            // Apply valueFormatter if defined for this column (takes precedence over format)
+            if (columnDef && isFunctionRef(columnDef.valueFormatter)) {
+                try {
+                    const formattedValue = executeFunction(
+                        columnDef.valueFormatter.function,
+                        { value: cellResult.data, cell: cellResult, row, col }
+                    );
+                    if (formattedValue !== undefined) {
+                        cellResult = {
+                            ...cellResult,
+                            displayData: String(formattedValue)
+                        };
+                    }
+                } catch (e) {
+                    console.warn('[GlideGrid] valueFormatter error:', e);
+                }
+            }
+
+            cellCache.set(actualRow, col, cellResult);
         }
 
         // Apply lastUpdated timestamp if this cell was recently edited
-        const cellKey = `${actualRow},${col}`;
-        if (lastUpdatedCells[cellKey]) {
+        // (layered on a copy so the cached cell stays untouched)
+        const lastUpdated = flashTracker.get(actualRow, col);
+        if (lastUpdated) {
+            cellResult = {
+                ...cellResult,
+                lastUpdated
+            };
+        }
+
+        // Apply cell-scoped styleRules
+        const ruleTheme = styleIndex ? styleIndex.cellTheme(actualRow, col) : undefined;
+        if (ruleTheme) {
             cellResult = {
                 ...cellResult,
-                lastUpdated: lastUpdatedCells[cellKey]
+                themeOverride: { ...cellResult.themeOverride, ...ruleTheme }
             };
         }
 
         // If row is hidden, strip properties that would cause visible rendering
         if (hiddenRowsSet.has(actualRow)) {
+            cellResult = { ...cellResult };
             delete cellResult.themeOverride;  // Prevents custom colors overriding transparency
             delete cellResult.lastUpdated;    // Prevents flash effect on hidden cells
 
@@ -1907,7 +2079,22 @@ const GlideGrid = (props) => {
         }
 
         return cellResult;
-    }, [localData, localColumns, sortedIndices, lastUpdatedCells, hiddenRowsSet]);
+    }, [localData, localColumns, sortedIndices, hiddenRowsSet, styleIndex, flashTracker]);
+
+    // Repaint the cells flashed during the last frame (called by the flash tracker)
+    repaintFlashedCellsRef.current = (cells) => {
+        if (!gridRef.current) return;
+        const damage = [];
+        for (const [row, col] of cells) {
+            const displayRow = getDisplayRow(row);
+            if (displayRow >= 0) {
+                damage.push({ cell: [col, displayRow] });
+            }
+        }
+        if (damage.length > 0) {
+            gridRef.current.updateCells(damage);
+        }
+    };
 
     // Internal fill pattern logic (reusable for both drag-fill and double-click fill)
     const handleFillPatternInternal = useCallback((patternSource, fillDestination) => {
@@ -1922,8 +2109,7 @@ const GlideGrid = (props) => {
             return;
         }
 
-        // Create a deep copy of the data (array of objects)
-        const newData = currentData.map(r => ({...r}));
+        const edits = [];
 
         // Get source pattern dimensions
         const sourceWidth = patternSource.width;
@@ -1936,7 +2122,7 @@ const GlideGrid = (props) => {
 
             // Translate display row to actual data row if sorting is active
             const actualDestRow = sortedIndices ? sortedIndices[destRow] : destRow;
-            if (actualDestRow >= newData.length) break;
+            if (actualDestRow >= currentData.length) break;
 
             for (let destCol = fillDestination.x; destCol < fillDestination.x + fillDestination.width; destCol++) {
                 if (destCol >= currentColumns.length) break;
@@ -1957,38 +2143,30 @@ const GlideGrid = (props) => {
                 const sourceColumnId = sourceColumnDef?.id || sourceColumnDef?.title;
 
                 // Get old value before overwriting
-                const oldValue = newData[actualDestRow][destColumnId];
+                const oldValue = currentData.get(actualDestRow, destColumnId);
 
                 // Copy the value from source to destination
-                const sourceValue = newData[actualSourceRow][sourceColumnId];
-                newData[actualDestRow] = { ...newData[actualDestRow], [destColumnId]: sourceValue };
+                const sourceValue = currentData.get(actualSourceRow, sourceColumnId);
 
-                // Track edit for undo/redo
-                addEditToBatch({
+                const edit = {
                     col: destCol,
                     row: actualDestRow,
                     columnId: destColumnId,
                     oldValue: oldValue,
                     newValue: sourceValue
-                });
+                };
+                edits.push(edit);
+
+                // Track edit for undo/redo
+                addEditToBatch(edit);
             }
         }
 
-        // Update local state immediately (optimistic update)
-        setLocalData(newData);
-
-        // CRITICAL: Update the ref immediately so next edit sees the updated data
-        localDataRef.current = newData;
-
-        // Store this data so we can ignore it when it comes back from Dash
-        lastSentData.current = newData;
-
         // Translate row for the event
         const actualFillRow = sortedIndices ? sortedIndices[fillDestination.y] : fillDestination.y;
 
-        // Sync with Dash
-        setProps({
-            data: newData,
+        // Update local state and sync with Dash
+        commitDataEdits(edits, 'fill', {
             cellEdited: {
                 col: fillDestination.x,
                 row: actualFillRow,
@@ -1996,7 +2174,7 @@ const GlideGrid = (props) => {
                 timestamp: Date.now()
             }
         });
-    }, [setProps, readonly, sortedIndices, addEditToBatch, hiddenRowsSet, skipOnFill]);
+    }, [setProps, readonly, sortedIndices, addEditToBatch, commitDataEdits, hiddenRowsSet, skipOnFill]);
 
     // Handle fill pattern from drag (Excel-like fill handle drag)
     const handleFillPattern = useCallback((event) => {
@@ -2153,7 +2331,7 @@ const GlideGrid = (props) => {
             const actualRow = sortedIndices ? sortedIndices[row] : row;
             if (actualRow >= currentData.length) break;
 
-            const value = currentData[actualRow]?.[leftColId];
+            const value = currentData.get(actualRow, leftColId);
 
             if (isCellEmpty(value)) {
                 // First empty cell found - fill ends at row before this
@@ -2186,7 +2364,7 @@ const GlideGrid = (props) => {
 
             // Check each fill column in this row
             for (const colId of fillColIds) {
-                const value = currentData[actualRow]?.[colId];
+                const value = currentData.get(actualRow, colId);
 
                 if (!isCellEmpty(value)) {
                     // Found data in a fill column - stop before this row
@@ -2392,11 +2570,8 @@ const GlideGrid = (props) => {
         const columnDef = currentColumns[col];
         const columnId = columnDef?.id || columnDef?.title;
 
-        // Create a deep copy of the data (array of objects)
-        const newData = currentData.map(r => ({...r}));
-
         // Get the old value to determine format (use actualRow for data access)
-        const oldValue = newData[actualRow][columnId];
+        const oldValue = currentData.get(actualRow, columnId);
 
         // Preserve format (object vs simple value)
         let newCellValue;
@@ -2444,35 +2619,24 @@ const GlideGrid = (props) => {
             newCellValue = newValue.data ?? '';
         }
 
-        newData[actualRow] = { ...newData[actualRow], [columnId]: newCellValue };
-
-        // Track edit for undo/redo
-        addEditToBatch({
+        const edit = {
             col: col,
             row: actualRow,
             columnId: columnId,
             oldValue: oldValue,
             newValue: newCellValue
-        });
-
-        // Update local state immediately (optimistic update)
-        setLocalData(newData);
-
-        // CRITICAL: Update the ref immediately so next edit sees the updated data
-        localDataRef.current = newData;
+        };
 
-        // Store this data so we can ignore it when it comes back from Dash
-        lastSentData.current = newData;
+        // Track edit for undo/redo
+        addEditToBatch(edit);
 
         // Set lastUpdated timestamp for flash effect
         if (shouldFlash('edit')) {
-            const cellKey = `${actualRow},${col}`;
-            setLastUpdatedCells(prev => ({ ...prev, [cellKey]: performance.now() }));
+            flashTracker.add(actualRow, col, performance.now());
         }
 
-        // Sync with Dash (report actualRow so it matches data array indices)
-        setProps({
-            data: newData,
+        // Update local state and sync with Dash (report actualRow so it matches data array indices)
+        commitDataEdits([edit], 'edit', {
             cellEdited: {
                 col: col,
                 row: actualRow,
@@ -2482,7 +2646,7 @@ const GlideGrid = (props) => {
         });
 
         return true;
-    }, [setProps, readonly, sortedIndices, addEditToBatch]);
+    }, [setProps, readonly, sortedIndices, addEditToBatch, commitDataEdits]);
 
     // Coerce a pasted string value to match the target cell's type
     // Used by both handlePaste and context menu paste actions
@@ -2665,8 +2829,7 @@ const GlideGrid = (props) => {
             return false;
         }
 
-        // Create a deep copy of the data (array of objects)
-        const newData = currentData.map(r => ({...r}));
+        const edits = [];
 
         // Build list of visible target rows if skipping hidden rows
         let targetRows = [];
@@ -2692,11 +2855,11 @@ const GlideGrid = (props) => {
         // Apply pasted data to visible target rows only
         for (let i = 0; i < targetRows.length; i++) {
             const displayRow = targetRows[i];
-            if (displayRow >= newData.length) break;
+            if (displayRow >= currentData.length) break;
 
             // Translate display row to actual data row if sorting is active
             const actualPasteRow = sortedIndices ? sortedIndices[displayRow] : displayRow;
-            if (actualPasteRow >= newData.length) break;
+            if (actualPasteRow >= currentData.length) break;
 
             for (let j = 0; j < values[i].length; j++) {
                 const pasteCol = targetCol + j;
@@ -2707,55 +2870,44 @@ const GlideGrid = (props) => {
                 const columnId = columnDef?.id || columnDef?.title;
 
                 const pastedValue = values[i][j];
-                const oldValue = newData[actualPasteRow][columnId];
+                const oldValue = currentData.get(actualPasteRow, columnId);
                 const newCellValue = coercePastedValue(pastedValue, oldValue);
 
-                newData[actualPasteRow] = { ...newData[actualPasteRow], [columnId]: newCellValue };
-
-                // Track edit for undo/redo
-                addEditToBatch({
+                const edit = {
                     col: pasteCol,
                     row: actualPasteRow,
                     columnId: columnId,
                     oldValue: oldValue,
                     newValue: newCellValue
-                });
+                };
+                edits.push(edit);
+
+                // Track edit for undo/redo
+                addEditToBatch(edit);
             }
         }
 
         // Set lastUpdated timestamps for flash effect on all pasted cells
         if (shouldFlash('paste')) {
             const now = performance.now();
-            const updatedCells = {};
             for (let i = 0; i < targetRows.length; i++) {
                 const displayRow = targetRows[i];
-                if (displayRow >= newData.length) break;
+                if (displayRow >= currentData.length) break;
                 const actualPasteRow = sortedIndices ? sortedIndices[displayRow] : displayRow;
-                if (actualPasteRow >= newData.length) break;
+                if (actualPasteRow >= currentData.length) break;
                 for (let j = 0; j < values[i].length; j++) {
                     const pasteCol = targetCol + j;
                     if (pasteCol >= currentColumns.length) break;
-                    updatedCells[`${actualPasteRow},${pasteCol}`] = now;
+                    flashTracker.add(actualPasteRow, pasteCol, now);
                 }
             }
-            setLastUpdatedCells(prev => ({ ...prev, ...updatedCells }));
         }
 
-        // Update local state immediately (optimistic update)
-        setLocalData(newData);
-
-        // CRITICAL: Update the ref immediately so next paste sees the updated data
-        localDataRef.current = newData;
-
-        // Store this data so we can ignore it when it comes back from Dash
-        lastSentData.current = newData;
-
         // Translate targetRow for the event
         const actualTargetRow = sortedIndices ? sortedIndices[targetRow] : targetRow;
 
-        // Sync with Dash
-        setProps({
-            data: newData,
+        // Update local state and sync with Dash
+        commitDataEdits(edits, 'paste', {
             cellEdited: {
                 col: targetCol,
                 row: actualTargetRow,
@@ -2766,7 +2918,7 @@ const GlideGrid = (props) => {
 
         // Return false to prevent grid from also trying to paste (we handled it)
         return false;
-    }, [setProps, readonly, sortedIndices, addEditToBatch, skipOnPaste, hiddenRowsSet]);
+    }, [setProps, readonly, sortedIndices, addEditToBatch, commitDataEdits, skipOnPaste, hiddenRowsSet]);
 
     // Handle selection changes
     const handleSelectionChanged = useCallback((selection) => {
@@ -3255,13 +3407,11 @@ const GlideGrid = (props) => {
 
             // Send new widths to Dash
             const newWidths = newColumns.map(col => col.width || 150);
-            setProps({
-                columnWidths: newWidths
-            });
+            emitEvent('columnWidths', newWidths);
 
             return newColumns;
         });
-    }, [setProps]);
+    }, [setProps, emitEvent]);
 
     // Handle search close
     const handleSearchClose = useCallback(() => {
@@ -3416,13 +3566,15 @@ const GlideGrid = (props) => {
 
     // Sync visibleRowIndices to Dash when displayIndices changes
     useEffect(() => {
+        // Row indices are meaningless (and huge) when the server owns the rows
+        if (isServerRowModel) return;
         if (setProps) {
-            const indices = displayIndices || (localData ? localData.map((_, i) => i) : []);
+            const indices = displayIndices || (localData ? Array.from({ length: localData.length }, (_, i) => i) : []);
             setProps({
                 visibleRowIndices: indices
             });
         }
-    }, [displayIndices, localData, setProps]);
+    }, [displayIndices, localData, setProps, isServerRowModel]);
 
     // Handle filter change from HeaderMenu
     const handleFilterChange = useCallback((columnIndex, selectedValues) => {
@@ -3462,7 +3614,7 @@ const GlideGrid = (props) => {
             executeFunction(item.onClick.function, {
                 col: columnIndex,
                 columns: localColumns,
-                data: localData
+                data: localData.toRecords()
             });
         }
 
@@ -3503,10 +3655,7 @@ const GlideGrid = (props) => {
                 // Trigger flash for the copied cell
                 if (shouldFlash('copy')) {
                     const actualRow = sortedIndices ? sortedIndices[row] : row;
-                    setLastUpdatedCells(prev => ({
-                        ...prev,
-                        [`${actualRow},${col}`]: performance.now()
-                    }));
+                    flashTracker.add(actualRow, col, performance.now());
                 }
             }
         } else if (action === 'copySelection') {
@@ -3534,14 +3683,12 @@ const GlideGrid = (props) => {
                 // Trigger flash for all copied cells
                 if (shouldFlash('copy')) {
                     const now = performance.now();
-                    const updatedCells = {};
                     for (let r = startRow; r <= endRow; r++) {
                         const actualRow = sortedIndices ? sortedIndices[r] : r;
                         for (let c = startCol; c <= endCol; c++) {
-                            updatedCells[`${actualRow},${c}`] = now;
+                            flashTracker.add(actualRow, c, now);
                         }
                     }
-                    setLastUpdatedCells(prev => ({ ...prev, ...updatedCells }));
                 }
             } else if (col !== null && row !== null) {
                 // No range selection, copy single cell
@@ -3551,10 +3698,7 @@ const GlideGrid = (props) => {
                 // Trigger flash for the copied cell
                 if (shouldFlash('copy')) {
                     const actualRow = sortedIndices ? sortedIndices[row] : row;
-                    setLastUpdatedCells(prev => ({
-                        ...prev,
-                        [`${actualRow},${col}`]: performance.now()
-                    }));
+                    flashTracker.add(actualRow, col, performance.now());
                 }
             }
         } else if (action === 'pasteAtClickedCell') {
@@ -3565,15 +3709,14 @@ const GlideGrid = (props) => {
 
                     // Parse TSV/CSV content
                     const lines = text.split('\n').filter(line => line.length > 0);
-                    const newData = [...localData];
+                    const currentData = localDataRef.current;
                     const edits = [];
 
                     lines.forEach((line, lineIdx) => {
                         const targetRow = row + lineIdx;
-                        if (targetRow >= newData.length) return;
+                        if (targetRow >= currentData.length) return;
 
                         const values = line.split('\t');
-                        const newRowData = { ...newData[targetRow] };
 
                         values.forEach((val, valIdx) => {
                             const targetCol = col + valIdx;
@@ -3582,28 +3725,21 @@ const GlideGrid = (props) => {
                             const columnDef = localColumns[targetCol];
                             const columnId = columnDef?.id;
                             if (columnId && !columnDef.readonly) {
-                                const oldValue = newRowData[columnId];
+                                const oldValue = currentData.get(targetRow, columnId);
                                 const newValue = coercePastedValue(val, oldValue);
-                                newRowData[columnId] = newValue;
-                                edits.push({ col: targetCol, row: targetRow, value: newValue });
+                                edits.push({ col: targetCol, row: targetRow, columnId, oldValue, newValue });
                             }
                         });
-
-                        newData[targetRow] = newRowData;
                     });
 
                     if (edits.length > 0) {
-                        setLocalData(newData);
-                        if (setProps) {
-                            setProps({
-                                data: newData,
-                                cellsEdited: {
-                                    edits,
-                                    count: edits.length,
-                                    timestamp: Date.now()
-                                }
-                            });
-                        }
+                        commitDataEdits(edits, 'contextMenu', {
+                            cellsEdited: {
+                                edits: edits.map(e => ({ col: e.col, row: e.row, value: e.newValue })),
+                                count: edits.length,
+                                timestamp: Date.now()
+                            }
+                        });
                     }
                 }).catch(err => {
                     console.error('Failed to paste:', err);
@@ -3621,15 +3757,14 @@ const GlideGrid = (props) => {
 
                     // Parse TSV/CSV content
                     const lines = text.split('\n').filter(line => line.length > 0);
-                    const newData = [...localData];
+                    const currentData = localDataRef.current;
                     const edits = [];
 
                     lines.forEach((line, lineIdx) => {
                         const targetRow = startRow + lineIdx;
-                        if (targetRow >= newData.length) return;
+                        if (targetRow >= currentData.length) return;
 
                         const values = line.split('\t');
-                        const newRowData = { ...newData[targetRow] };
 
                         values.forEach((val, valIdx) => {
                             const targetCol = startCol + valIdx;
@@ -3638,28 +3773,21 @@ const GlideGrid = (props) => {
                             const columnDef = localColumns[targetCol];
                             const columnId = columnDef?.id;
                             if (columnId && !columnDef.readonly) {
-                                const oldValue = newRowData[columnId];
+                                const oldValue = currentData.get(targetRow, columnId);
                                 const newValue = coercePastedValue(val, oldValue);
-                                newRowData[columnId] = newValue;
-                                edits.push({ col: targetCol, row: targetRow, value: newValue });
+                                edits.push({ col: targetCol, row: targetRow, columnId, oldValue, newValue });
                             }
                         });
-
-                        newData[targetRow] = newRowData;
                     });
 
                     if (edits.length > 0) {
-                        setLocalData(newData);
-                        if (setProps) {
-                            setProps({
-                                data: newData,
-                                cellsEdited: {
-                                    edits,
-                                    count: edits.length,
-                                    timestamp: Date.now()
-                                }
-                            });
-                        }
+                        commitDataEdits(edits, 'contextMenu', {
+                            cellsEdited: {
+                                edits: edits.map(e => ({ col: e.col, row: e.row, value: e.newValue })),
+                                count: edits.length,
+                                timestamp: Date.now()
+                            }
+                        });
                     }
                 }).catch(err => {
                     console.error('Failed to paste selection:', err);
@@ -3670,15 +3798,14 @@ const GlideGrid = (props) => {
                     if (!text) return;
 
                     const lines = text.split('\n').filter(line => line.length > 0);
-                    const newData = [...localData];
+                    const currentData = localDataRef.current;
                     const edits = [];
 
                     lines.forEach((line, lineIdx) => {
                         const targetRow = row + lineIdx;
-                        if (targetRow >= newData.length) return;
+                        if (targetRow >= currentData.length) return;
 
                         const values = line.split('\t');
-                        const newRowData = { ...newData[targetRow] };
 
                         values.forEach((val, valIdx) => {
                             const targetCol = col + valIdx;
@@ -3687,28 +3814,21 @@ const GlideGrid = (props) => {
                             const columnDef = localColumns[targetCol];
                             const columnId = columnDef?.id;
                             if (columnId && !columnDef.readonly) {
-                                const oldValue = newRowData[columnId];
+                                const oldValue = currentData.get(targetRow, columnId);
                                 const newValue = coercePastedValue(val, oldValue);
-                                newRowData[columnId] = newValue;
-                                edits.push({ col: targetCol, row: targetRow, value: newValue });
+                                edits.push({ col: targetCol, row: targetRow, columnId, oldValue, newValue });
                             }
                         });
-
-                        newData[targetRow] = newRowData;
                     });
 
                     if (edits.length > 0) {
-                        setLocalData(newData);
-                        if (setProps) {
-                            setProps({
-                                data: newData,
-                                cellsEdited: {
-                                    edits,
-                                    count: edits.length,
-                                    timestamp: Date.now()
-                                }
-                            });
-                        }
+                        commitDataEdits(edits, 'contextMenu', {
+                            cellsEdited: {
+                                edits: edits.map(e => ({ col: e.col, row: e.row, value: e.newValue })),
+                                count: edits.length,
+                                timestamp: Date.now()
+                            }
+                        });
                     }
                 }).catch(err => {
                     console.error('Failed to paste:', err);
@@ -3720,120 +3840,114 @@ const GlideGrid = (props) => {
                 const columnDef = localColumns[col];
                 const columnId = columnDef?.id;
                 if (columnId && !columnDef.readonly) {
-                    const oldValue = localData[row]?.[columnId];
+                    const oldValue = localDataRef.current.get(row, columnId);
                     const newValue = getClearedValue(col, row, oldValue);
-                    const newData = [...localData];
-                    newData[row] = { ...newData[row], [columnId]: newValue };
-                    setLocalData(newData);
-                    if (setProps) {
-                        setProps({
-                            data: newData,
-                            cellsEdited: {
-                                edits: [{ col, row, value: newValue }],
-                                count: 1,
-                                timestamp: Date.now()
-                            }
-                        });
-                    }
+                    commitDataEdits([{ col, row, columnId, oldValue, newValue }], 'contextMenu', {
+                        cellsEdited: {
+                            edits: [{ col, row, value: newValue }],
+                            count: 1,
+                            timestamp: Date.now()
+                        }
+                    });
                 }
             }
         } else if (action === 'clearSelection') {
             // Clear all cells in the current selection
             if (localData && localColumns && gridSelection.current?.range) {
                 const range = gridSelection.current.range;
-                const newData = [...localData];
+                const currentData = localDataRef.current;
                 const edits = [];
 
                 for (let r = range.y; r < range.y + range.height; r++) {
-                    if (r >= newData.length) continue;
-                    const newRowData = { ...newData[r] };
+                    if (r >= currentData.length) continue;
 
                     for (let c = range.x; c < range.x + range.width; c++) {
                         if (c >= localColumns.length) continue;
                         const columnDef = localColumns[c];
                         const columnId = columnDef?.id;
                         if (columnId && !columnDef.readonly) {
-                            const oldValue = newRowData[columnId];
+                            const oldValue = currentData.get(r, columnId);
                             const newValue = getClearedValue(c, r, oldValue);
-                            newRowData[columnId] = newValue;
-                            edits.push({ col: c, row: r, value: newValue });
+                            edits.push({ col: c, row: r, columnId, oldValue, newValue });
                         }
                     }
-                    newData[r] = newRowData;
                 }
 
                 if (edits.length > 0) {
-                    setLocalData(newData);
-                    if (setProps) {
-                        setProps({
-                            data: newData,
-                            cellsEdited: {
-                                edits,
-                                count: edits.length,
-                                timestamp: Date.now()
-                            }
-                        });
-                    }
+                    commitDataEdits(edits, 'contextMenu', {
+                        cellsEdited: {
+                            edits: edits.map(e => ({ col: e.col, row: e.row, value: e.newValue })),
+                            count: edits.length,
+                            timestamp: Date.now()
+                        }
+                    });
                 }
             } else if (col !== null && row !== null && localData && localColumns) {
                 // No range selection, fall back to clear single clicked cell
                 const columnDef = localColumns[col];
                 const columnId = columnDef?.id;
                 if (columnId && !columnDef.readonly) {
-                    const oldValue = localData[row]?.[columnId];
+                    const oldValue = localDataRef.current.get(row, columnId);
                     const newValue = getClearedValue(col, row, oldValue);
-                    const newData = [...localData];
-                    newData[row] = { ...newData[row], [columnId]: newValue };
-                    setLocalData(newData);
-                    if (setProps) {
-                        setProps({
-                            data: newData,
-                            cellsEdited: {
-                                edits: [{ col, row, value: newValue }],
-                                count: 1,
-                                timestamp: Date.now()
-                            }
-                        });
-                    }
+                    commitDataEdits([{ col, row, columnId, oldValue, newValue }], 'contextMenu', {
+                        cellsEdited: {
+                            edits: [{ col, row, value: newValue }],
+                            count: 1,
+                            timestamp: Date.now()
+                        }
+                    });
                 }
             }
         } else if (isFunctionRef(action)) {
             // Handle clientside function action
             const columnDef = localColumns?.[col];
             const columnId = columnDef?.id;
-            const rowData = localData?.[row];
+            const rowData = localData?.getRow(row);
             const cellData = rowData?.[columnId];
 
             // Build utility functions
             const utils = {
                 setData: (newData) => {
-                    setLocalData(newData);
+                    const wasColumnar = localDataRef.current.kind === 'columns';
+                    const newStore = createRecordStore(newData);
+                    setLocalData(newStore);
+                    localDataRef.current = newStore;
                     if (setProps) {
-                        setProps({ data: newData });
+                        lastSentData.current = newData;
+                        appliedRevisionRef.current += 1;
+                        setProps({
+                            data: newData,
+                            dataRevision: appliedRevisionRef.current,
+                            // Records replace columnar data, so clear it or it would be re-applied
+                            ...(wasColumnar ? { dataColumns: null } : {})
+                        });
                     }
                 },
                 setCells: (edits) => {
-                    const newData = [...localData];
+                    const currentData = localDataRef.current;
+                    const dataEdits = [];
                     edits.forEach(edit => {
                         const colIdx = typeof edit.col === 'number'
                             ? edit.col
                             : localColumns.findIndex(c => c.id === edit.columnId);
                         const colId = localColumns[colIdx]?.id;
-                        if (colId && edit.row >= 0 && edit.row < newData.length) {
-                            newData[edit.row] = { ...newData[edit.row], [colId]: edit.value };
+                        if (colId && edit.row >= 0 && edit.row < currentData.length) {
+                            dataEdits.push({
+                                col: colIdx,
+                                row: edit.row,
+                                columnId: colId,
+                                oldValue: currentData.get(edit.row, colId),
+                                newValue: edit.value
+                            });
+                        }
+                    });
+                    commitDataEdits(dataEdits, 'contextMenu', {
+                        cellsEdited: {
+                            edits: edits.map(e => ({ col: e.col, row: e.row, value: e.value })),
+                            count: edits.length,
+                            timestamp: Date.now()
                         }
                     });
-                    setLocalData(newData);
-                    if (setProps) {
-                        setProps({
-                            data: newData,
-                            cellsEdited: {
-                                edits: edits.map(e => ({ col: e.col, row: e.row, value: e.value })),
-                                count: edits.length,
-                                timestamp: Date.now()
-                            }
-                        });
-                    }
                 },
                 getClipboard: () => navigator.clipboard.readText(),
                 setClipboard: (text) => navigator.clipboard.writeText(text)
@@ -3850,7 +3964,7 @@ const GlideGrid = (props) => {
                     cell: gridSelection.current?.cell || null
                 },
                 columns: localColumns,
-                data: localData,
+                data: localData.toRecords(),
                 utils
             };
 
@@ -3898,7 +4012,7 @@ const GlideGrid = (props) => {
             });
         }
         handleContextMenuClose();
-    }, [setProps, contextMenuState, handleContextMenuClose, localData, localColumns, gridSelection, getClearedValue]);
+    }, [setProps, contextMenuState, handleContextMenuClose, localData, localColumns, gridSelection, getClearedValue, commitDataEdits]);
 
     // Handle header menu click (dropdown arrow on columns with hasMenu or filterable)
     const handleHeaderMenuClick = useCallback((col, screenPosition) => {
@@ -4031,18 +4145,16 @@ const GlideGrid = (props) => {
         }
 
         if (setProps) {
-            setProps({
-                itemHovered: {
-                    col: args.location ? args.location[0] : undefined,
-                    row: args.location ? args.location[1] : undefined,
-                    kind: args.kind,
-                    // Note: isFillHandle here may be stale - use mouseMove.isFillHandle for accurate tracking
-                    isFillHandle: args.kind === 'cell' && args.isFillHandle === true,
-                    timestamp: Date.now()
-                }
+            emitEvent('itemHovered', {
+                col: args.location ? args.location[0] : undefined,
+                row: args.location ? args.location[1] : undefined,
+                kind: args.kind,
+                // Note: isFillHandle here may be stale - use mouseMove.isFillHandle for accurate tracking
+                isFillHandle: args.kind === 'cell' && args.isFillHandle === true,
+                timestamp: Date.now()
             });
         }
-    }, [setProps, isEditorOpen]);
+    }, [setProps, isEditorOpen, emitEvent]);
 
     // Handle mouse move events (raw mouse movement, fires on every move)
     // Skip when editor is open to prevent re-renders that interfere with text input
@@ -4056,19 +4168,17 @@ const GlideGrid = (props) => {
         }
 
         if (setProps && !isEditorOpen) {
-            setProps({
-                mouseMove: {
-                    col: args.location ? args.location[0] : undefined,
-                    row: args.location ? args.location[1] : undefined,
-                    kind: args.kind,
-                    isFillHandle: newHoveringFillHandle,
-                    localEventX: args.localEventX,
-                    localEventY: args.localEventY,
-                    timestamp: Date.now()
-                }
+            emitEvent('mouseMove', {
+                col: args.location ? args.location[0] : undefined,
+                row: args.location ? args.location[1] : undefined,
+                kind: args.kind,
+                isFillHandle: newHoveringFillHandle,
+                localEventX: args.localEventX,
+                localEventY: args.localEventY,
+                timestamp: Date.now()
             });
         }
-    }, [setProps, isEditorOpen]);
+    }, [setProps, isEditorOpen, emitEvent]);
 
     // Handle batch cell edits (paste/fill operations affecting multiple cells)
     const handleCellsEdited = useCallback((edits) => {
@@ -4153,8 +4263,8 @@ const GlideGrid = (props) => {
             return false;
         }
 
-        const newData = currentData.map(r => ({...r}));
         const edits = [];
+        const dataEdits = [];
 
         // Process range selection
         if (selection.current?.range) {
@@ -4165,16 +4275,16 @@ const GlideGrid = (props) => {
 
                 // Translate display row to data row if sorting is active
                 const dataRow = sortedIndices ? sortedIndices[displayRow] : displayRow;
-                if (dataRow >= newData.length) continue;
+                if (dataRow >= currentData.length) continue;
 
                 for (let col = range.x; col < range.x + range.width; col++) {
                     if (col >= currentColumns.length) continue;
                     const columnDef = currentColumns[col];
                     const columnId = columnDef?.id;
                     if (columnId && !columnDef.readonly) {
-                        const oldValue = newData[dataRow][columnId];
+                        const oldValue = currentData.get(dataRow, columnId);
                         const newValue = getClearedValue(col, displayRow, oldValue);
-                        newData[dataRow][columnId] = newValue;
+                        dataEdits.push({ col, row: dataRow, columnId, oldValue, newValue });
                         edits.push({ col, row: displayRow, value: newValue });
                     }
                 }
@@ -4182,9 +4292,7 @@ const GlideGrid = (props) => {
         }
 
         if (edits.length > 0) {
-            setLocalData(newData);
-            setProps({
-                data: newData,
+            commitDataEdits(dataEdits, 'delete', {
                 cellsEdited: {
                     edits,
                     count: edits.length,
@@ -4196,7 +4304,7 @@ const GlideGrid = (props) => {
         // Return false to prevent Glide from doing its own clearing
         // We've already handled all the cell clearing ourselves
         return false;
-    }, [setProps, allowDelete, readonly, getClearedValue, sortedIndices, hiddenRowsSet, skipOnDelete]);
+    }, [setProps, allowDelete, readonly, getClearedValue, commitDataEdits, sortedIndices, hiddenRowsSet, skipOnDelete]);
 
     // Handle visible region changes
     const handleVisibleRegionChanged = useCallback((range, tx, ty, extras) => {
@@ -4225,19 +4333,24 @@ const GlideGrid = (props) => {
             handleContextMenuClose();
         }
 
+        lastVisibleRowsRef.current = { start: range.y, end: range.y + range.height };
+
+        // Server row model: fetch the blocks around the new viewport
+        if (isServerRowModel) {
+            requestRowBlocks(range.y, range.y + range.height);
+        }
+
         if (setProps) {
-            setProps({
-                visibleRegion: {
-                    x: range.x,
-                    y: range.y,
-                    width: range.width,
-                    height: range.height,
-                    tx: tx,
-                    ty: ty
-                }
+            emitEvent('visibleRegion', {
+                x: range.x,
+                y: range.y,
+                width: range.width,
+                height: range.height,
+                tx: tx,
+                ty: ty
             });
         }
-    }, [setProps, editorScrollBehavior, isEditorOpen, contextMenuScrollBehavior, contextMenuState.isOpen, handleContextMenuClose]);
+    }, [setProps, editorScrollBehavior, isEditorOpen, contextMenuScrollBehavior, contextMenuState.isOpen, handleContextMenuClose, isServerRowModel, requestRowBlocks, emitEvent]);
 
     // ========== PHASE 3: ROW/COLUMN REORDERING ==========
 
@@ -4266,12 +4379,7 @@ const GlideGrid = (props) => {
     // Handle row moved (drag reorder)
     const handleRowMoved = useCallback((startIndex, endIndex) => {
         // Optimistic update: reorder local data immediately to prevent jitter
-        setLocalData(prevData => {
-            const newData = [...prevData];
-            const [moved] = newData.splice(startIndex, 1);
-            newData.splice(endIndex, 0, moved);
-            return newData;
-        });
+        setLocalData(prevData => prevData.moveRow(startIndex, endIndex));
 
         // Notify Dash
         if (setProps) {
@@ -4453,12 +4561,21 @@ const GlideGrid = (props) => {
             };
         }
 
+        // Translate display row to data row if sorting/filtering is active
+        const dataRow = sortedIndices ? sortedIndices[rowIndex] : rowIndex;
+
+        // Apply row-scoped styleRules (array lookup, no user functions)
+        const ruleTheme = styleIndex ? styleIndex.rowTheme(dataRow) : undefined;
+        if (ruleTheme) {
+            themeOverride = { ...themeOverride, ...ruleTheme };
+        }
+
         // Apply user-defined row theme override (if provided)
         if (getRowThemeOverride && isFunctionRef(getRowThemeOverride)) {
-            const rowData = data && data[rowIndex] ? data[rowIndex] : null;
+            const rowData = localData.getRow(dataRow);
             const userOverride = executeFunction(
                 getRowThemeOverride.function,
-                { row: rowIndex, rowData, data }
+                { row: rowIndex, dataRow, rowData, data: localData.toRecords() }
             );
 
             if (userOverride && typeof userOverride === 'object') {
@@ -4468,7 +4585,7 @@ const GlideGrid = (props) => {
         }
 
         return themeOverride;
-    }, [getRowThemeOverride, data, hoverRow, hoveredRow, theme?.bgRowHovered, theme?.bgCell, blendToOpaque, hiddenRowsSet]);
+    }, [getRowThemeOverride, localData, hoverRow, hoveredRow, theme?.bgRowHovered, theme?.bgCell, blendToOpaque, hiddenRowsSet, sortedIndices, styleIndex]);
 
     // Create drawCell callback for custom cell rendering
     // Allows complete control over cell drawing via Canvas API
@@ -4507,8 +4624,8 @@ const GlideGrid = (props) => {
 
             // Execute user's custom drawCell if provided
             if (drawCell && isFunctionRef(drawCell)) {
-                // Get row data for context
-                const rowData = data && data[row] ? data[row] : null;
+                // Get row data for context (translate display row to data row)
+                const rowData = localData.getRow(sortedIndices ? sortedIndices[row] : row);
                 // Get column id to access dict key
                 const columnDef = columns?.[col];
                 const columnId = columnDef?.id || columnDef?.title;
@@ -4542,7 +4659,7 @@ const GlideGrid = (props) => {
                 drawContent();
             }
         };
-    }, [drawCell, drawFocusRing, gridSelection, data, columns]);
+    }, [drawCell, drawFocusRing, gridSelection, localData, columns, sortedIndices]);
 
     // Create custom drawHeader callback for header rendering
     // Allows complete control over header drawing via Canvas API
@@ -4578,43 +4695,52 @@ const GlideGrid = (props) => {
 
     // Process rowHeight - can be a number or an object with a function
     // Function format: rowHeight={"function": "getRowHeight(rowIndex)"}
-    const processedRowHeight = useMemo(() => {
-        // If we have hidden rows, always return a function that checks hiddenRowsSet
-        if (hiddenRowsSet.size > 0) {
-            return (rowIndex) => {
-                // Hidden rows get height 0
-                if (hiddenRowsSet.has(rowIndex)) {
-                    return 0;
-                }
-                // Otherwise use configured height
-                if (typeof rowHeight === 'number') {
-                    return rowHeight;
+    // Variable heights (rowHeights, a rowHeight function or hidden rows) are resolved once
+    // into a height table, so Glide's per-row lookups are array reads
+    const defaultRowHeight = typeof rowHeight === 'number' ? rowHeight : 34;
+    const hasRowHeightFunction = !!rowHeight && isFunctionRef(rowHeight);
+
+    // Per data row heights: a list, a binary column, or the id of a data column holding the heights
+    const rowHeightsColumn = typeof rowHeights === 'string' ? rowHeights : null;
+    const rowHeightsList = useMemo(() => {
+        if (!rowHeights || rowHeightsColumn) return null;
+        return isEncodedColumn(rowHeights) ? decodeColumn(rowHeights) : rowHeights;
+    }, [rowHeights, rowHeightsColumn]);
+
+    // Only sources that are per data row depend on the data and the row order
+    const isPerDataRowHeight = !!rowHeightsList || !!rowHeightsColumn;
+    const rowHeightData = rowHeightsColumn ? localData : null;
+    const rowHeightOrder = isPerDataRowHeight ? displayIndices : null;
+
+    const rowHeightTable = useMemo(() => {
+        if (!isPerDataRowHeight && !hasRowHeightFunction && hiddenRowsSet.size === 0) return null;
+
+        const heightOf = (rowIndex) => {
+            // Hidden rows get height 0
+            if (hiddenRowsSet.has(rowIndex)) return 0;
+
+            let height;
+            if (isPerDataRowHeight) {
+                const dataRow = rowHeightOrder ? rowHeightOrder[rowIndex] : rowIndex;
+                if (rowHeightsList) {
+                    height = rowHeightsList[dataRow];
+                } else if (rowHeightData && rowHeightData.hasRow(dataRow)) {
+                    height = rowHeightData.get(dataRow, rowHeightsColumn);
                 }
-                if (rowHeight && isFunctionRef(rowHeight)) {
-                    const result = executeFunction(
-                        rowHeight.function,
-                        { rowIndex }
-                    );
-                    return typeof result === 'number' ? result : 34;
-                }
-                return 34;
-            };
-        }
-        // No hidden rows - use original logic
-        if (typeof rowHeight === 'number') {
-            return rowHeight;
-        }
-        if (rowHeight && isFunctionRef(rowHeight)) {
-            return (rowIndex) => {
-                const result = executeFunction(
-                    rowHeight.function,
-                    { rowIndex }
-                );
-                return typeof result === 'number' ? result : 34; // Default fallback
-            };
-        }
-        return 34; // Default row height
-    }, [rowHeight, hiddenRowsSet]);
+            } else if (hasRowHeightFunction) {
+                height = executeFunction(rowHeight.function, { rowIndex });
+                if (typeof height !== 'number') return 34;
+            }
+            return typeof height === 'number' && height >= 0 ? height : defaultRowHeight;
+        };
+
+        // A rowHeight function only runs for the rows Glide lays out
+        const lazy = !isPerDataRowHeight && hasRowHeightFunction;
+        return createRowHeightTable(numRows, heightOf, defaultRowHeight, lazy);
+    }, [isPerDataRowHeight, hasRowHeightFunction, hiddenRowsSet, rowHeightOrder, rowHeightsList, rowHeightData,
+        rowHeightsColumn, rowHeight, defaultRowHeight, numRows]);
+
+    const processedRowHeight = rowHeightTable ? rowHeightTable.heightAt : defaultRowHeight;
 
     // Note: Row hover effect is handled via getRowThemeOverride (no dashed border)
 
@@ -4990,14 +5116,21 @@ const GlideGrid = (props) => {
         // Filter rows: remove hidden rows from the CompactSelection
         let filteredRows = gridSelection.rows;
         if (filteredRows && filteredRows.length > 0) {
-            // Build a new CompactSelection excluding hidden rows
-            let newRows = CompactSelection.empty();
-            for (const row of filteredRows) {
-                if (!hiddenRowsSet.has(row)) {
-                    newRows = newRows.add(row);
+            if (hiddenRowsSet.starts.length < filteredRows.length) {
+                // Fewer hidden ranges than selected rows: cut each range out of the selection
+                for (let i = 0; i < hiddenRowsSet.starts.length; i++) {
+                    filteredRows = filteredRows.remove([hiddenRowsSet.starts[i], hiddenRowsSet.ends[i] + 1]);
+                }
+            } else {
+                // Build a new CompactSelection excluding hidden rows
+                let newRows = CompactSelection.empty();
+                for (const row of filteredRows) {
+                    if (!hiddenRowsSet.has(row)) {
+                        newRows = newRows.add(row);
+                    }
                 }
+                filteredRows = newRows;
             }
-            filteredRows = newRows;
         }
 
         // Filter current cell selection only if focused cell is on a hidden row
@@ -5133,6 +5266,8 @@ const GlideGrid = (props) => {
                 getCellsForSelection={enableCopyPaste ? (skipOnCopy && hiddenRowsSet.size > 0 ? getCellsForSelectionFiltered : true) : undefined}
                 showSearch={showSearch}
                 searchValue={localSearchValue}
+                searchResults={indexedSearchResults}
+                onSearchResultsChanged={isIndexedSearch ? handleSearchResultsChanged : undefined}
                 onSearchClose={handleSearchClose}
                 onSearchValueChange={handleSearchValueChange}
                 onHeaderClicked={handleHeaderClicked}
@@ -5182,7 +5317,8 @@ const GlideGrid = (props) => {
                 position={filterMenuState.position}
                 columnIndex={filterMenuState.columnIndex}
                 columnTitle={filterMenuState.columnIndex !== null && localColumns?.[filterMenuState.columnIndex]?.title}
-                uniqueValues={filterMenuState.columnIndex !== null ? getUniqueColumnValues(filterMenuState.columnIndex) : []}
+                uniqueValues={filterMenuValues.values}
+                valueCounts={filterMenuValues.counts}
                 selectedValues={filterMenuState.columnIndex !== null ? localFilters[filterMenuState.columnIndex] || null : null}
                 onFilterChange={handleFilterChange}
                 theme={theme}
@@ -5218,6 +5354,7 @@ GlideGrid.defaultProps = {
     rangeSelect: 'rect',
     showSearch: false,
     searchValue: '',
+    searchIndex: false,
     columnResize: true,
     rowMarkers: 'none',
     rowMarkerStartIndex: 1,
@@ -5251,7 +5388,10 @@ GlideGrid.defaultProps = {
     sortable: false,
     sortColumns: [],
     sortingOrder: ['asc', 'desc', null],
+    sortMode: 'client',
     columnFilters: {},
+    filterMode: 'client',
+    computeWorker: false,
     hoverRow: false,
     cellActivationBehavior: 'second-click',
     editOnType: true,
@@ -5262,12 +5402,18 @@ GlideGrid.defaultProps = {
     columnSelectionMode: 'auto',
     enableUndoRedo: false,
     maxUndoSteps: 50,
+    maxUndoBytes: null,
     canUndo: false,
     canRedo: false,
     showCellFlash: false,
     allowDelete: true,
     hiddenRows: [],
     hiddenRowsConfig: {},
+    hiddenRowsMode: 'collapse',
+    dataSyncMode: 'full',
+    rowModel: 'client',
+    blockSize: 100,
+    maxCachedBlocks: 50,
 };
 
 GlideGrid.propTypes = {
@@ -5334,6 +5480,37 @@ GlideGrid.propTypes = {
          */
         valueFormatter: PropTypes.shape({
             function: PropTypes.string.isRequired
+        }),
+        /**
+         * Declarative display format, compiled once into a cached Intl formatter.
+         * Faster than a valueFormatter function, which runs for every cell paint.
+         * A valueFormatter on the same column takes precedence.
+         *
+         * **Usage**: `format={"type": "currency", "currency": "EUR", "locale": "de-DE", "decimals": 2}`
+         *
+         * - `type`: "number" (default), "percent" (1 = 100%), "currency",
+         *   "date", "datetime" or "time" (for ISO date strings or timestamps in ms)
+         * - `decimals`: Fixed number of fraction digits
+         * - `locale`: BCP 47 locale, e.g. "en-US" (default: browser locale)
+         * - `currency`: ISO 4217 code for "currency" (default: "USD")
+         * - `thousandsSeparator`: Set to false to disable digit grouping
+         * - `dateStyle` / `timeStyle`: "full", "long", "medium" or "short"
+         * - `timeZone`: IANA time zone, e.g. "UTC"
+         * - `prefix` / `suffix`: Text added around the formatted value
+         * - `options`: Extra Intl.NumberFormat / Intl.DateTimeFormat options
+         */
+        format: PropTypes.shape({
+            type: PropTypes.oneOf(['number', 'percent', 'currency', 'date', 'datetime', 'time']),
+            decimals: PropTypes.number,
+            locale: PropTypes.string,
+            currency: PropTypes.string,
+            thousandsSeparator: PropTypes.bool,
+            dateStyle: PropTypes.oneOf(['full', 'long', 'medium', 'short']),
+            timeStyle: PropTypes.oneOf(['full', 'long', 'medium', 'short']),
+            timeZone: PropTypes.string,
+            prefix: PropTypes.string,
+            suffix: PropTypes.string,
+            options: PropTypes.object
         })
     })).isRequired,
 
@@ -5398,14 +5575,147 @@ GlideGrid.propTypes = {
      *   "copyData": "python, react"
      * }
      * ```
+     *
+     * Either `data` or `dataColumns` must be provided.
+     */
+    data: PropTypes.arrayOf(PropTypes.object),
+
+    /**
+     * Row data in columnar format: a dict of column id -> list of values, one
+     * entry per row. An alternative to `data` that avoids repeating every column
+     * key in every row, which makes large payloads smaller and faster to parse.
+     * Takes precedence over `data` when both are set. Cell values follow the
+     * same rules as in `data` (simple values or cell objects).
+     *
+     * Edits made in the grid are sent back as `dataColumns` (or as `dataPatch`
+     * when dataSyncMode="patch").
+     *
+     * **Example**:
+     * ```python
+     * dataColumns = {
+     *     'name': ['Laptop', 'Mouse'],
+     *     'price': [1299.99, 29.99],
+     * }
+     * # Or from pandas, without to_dict('records'):
+     * GlideGrid.from_dataframe(df, id='grid')
+     * ```
+     *
+     * **Binary numeric columns**: a numeric column can instead be an object
+     * `{"dtype": "float64", "data": "<base64>"}` holding the raw little-endian
+     * bytes of a NumPy array. The grid wraps them in a typed array without parsing
+     * each value. Supported dtypes: float64, float32, int32, int16, int8, uint32,
+     * uint16, uint8. NaN in float columns is shown as an empty cell.
+     * Use `GlideGrid.from_dataframe(df, binary=True)` or
+     * `dash_glide_grid.encode_typed_column(array)` to build them, and
+     * `dash_glide_grid.decode_columns(dataColumns)` to read edited data back.
+     */
+    dataColumns: PropTypes.objectOf(PropTypes.oneOfType([
+        PropTypes.array,
+        PropTypes.shape({
+            dtype: PropTypes.oneOf(['float64', 'float32', 'int32', 'int16', 'int8', 'uint32', 'uint16', 'uint8']),
+            data: PropTypes.string
+        })
+    ])),
+
+    /**
+     * Rows to append to the end of the grid, for live feeds. Each new value is
+     * appended in place, so only the new rows go over the wire (instead of
+     * resending the whole `data`). Accepts a list of row dicts or a columnar
+     * dict like `dataColumns`. Appended rows are not sent back through `data`.
+     *
+     * If the user is scrolled to the last row, the grid stays pinned to the tail.
+     * Add "append" to `showCellFlash` to flash new rows. Leave `rows` unset so
+     * the row count follows the data.
+     */
+    appendRows: PropTypes.oneOfType([
+        PropTypes.arrayOf(PropTypes.object),
+        PropTypes.objectOf(PropTypes.array)
+    ]),
+
+    /**
+     * Maximum number of rows kept when rows are appended with `appendRows`.
+     * The oldest rows are dropped first, like a ring buffer. Dropping rows
+     * clears the undo history, since data row indices shift.
+     */
+    maxRows: PropTypes.number,
+
+    /**
+     * Sparse cell updates for high-frequency feeds (e.g. price ticks).
+     * The values are written straight into the grid's local data and only
+     * the listed cells are repainted. There is no full data copy and no React
+     * re-render, so Python callbacks can drive tick-level updates cheaply.
+     *
+     * - `row`: data row index (unaffected by sorting/filtering)
+     * - `col`: column index or column id
+     * - `value`: new cell value
+     *
+     * Updates are not sent back through `data`, and the current sort/filter
+     * order is not recomputed for them.
+     * Add "update" to `showCellFlash` to flash the updated cells.
+     *
+     * Format: {"updates": [{"row": 0, "col": "price", "value": 101.5}], "timestamp": 1234567890}
      */
-    data: PropTypes.arrayOf(PropTypes.object).isRequired,
+    cellUpdates: PropTypes.shape({
+        updates: PropTypes.arrayOf(PropTypes.shape({
+            row: PropTypes.number.isRequired,
+            col: PropTypes.oneOfType([PropTypes.number, PropTypes.string]).isRequired,
+            value: PropTypes.any
+        })),
+        timestamp: PropTypes.number
+    }),
 
     /**
      * Number of rows to display. If not provided, inferred from data.length.
      */
     rows: PropTypes.number,
 
+    /**
+     * How edits made in the grid are synced back to Dash.
+     * - "full" (default): Every edit, paste, fill, delete and undo/redo sends the
+     *   entire `data` array back to Dash.
+     * - "patch": Only the changed cells are sent, via the `dataPatch` output prop.
+     *   The grid applies edits locally and `data` is NOT updated in Dash, so the
+     *   server holds the authoritative copy. Use `dash_glide_grid.data_patch_to_dash_patch`
+     *   or `dash_glide_grid.apply_data_patch` to apply the edits on the server.
+     *   Recommended for large datasets where resending `data` per keystroke is costly.
+     * Default: "full"
+     */
+    dataSyncMode: PropTypes.oneOf(['full', 'patch']),
+
+    /**
+     * Cell edits made in the grid when dataSyncMode="patch" (read-only output prop).
+     * Each edit uses the data row index (unaffected by sorting/filtering) and the column id.
+     * `source` is the operation that produced the edits: "edit", "paste", "fill",
+     * "delete", "undo", "redo" or "contextMenu".
+     * Format: {"edits": [{"row": 0, "col": 1, "columnId": "price", "oldValue": 10, "value": 12}],
+     *          "source": "edit", "timestamp": 1234567890}
+     */
+    dataPatch: PropTypes.shape({
+        edits: PropTypes.arrayOf(PropTypes.shape({
+            row: PropTypes.number,
+            col: PropTypes.number,
+            columnId: PropTypes.string,
+            oldValue: PropTypes.any,
+            value: PropTypes.any
+        })),
+        source: PropTypes.string,
+        timestamp: PropTypes.number
+    }),
+
+    /**
+     * Revision number of `data`. Used to tell fresh data from stale echoes without
+     * deep-comparing the whole dataset.
+     * - The grid increments it every time it sends `data` back to Dash (edits, paste,
+     *   fill, delete, undo/redo), so it is also an output prop.
+     * - Incoming `data` whose `dataRevision` is lower than the newest revision the
+     *   grid has already applied is ignored as a stale echo.
+     * - When pushing new data from a callback (including `dash.Patch` updates), also
+     *   return `dataRevision` incremented from its current value so it is never
+     *   treated as stale.
+     * Until a revision is known, incoming data is always applied unless it is the grid's own echo.
+     */
+    dataRevision: PropTypes.number,
+
     // ========== DISPLAY & LAYOUT PROPS ==========
 
     /**
@@ -5440,6 +5750,25 @@ GlideGrid.propTypes = {
         })
     ]),
 
+    /**
+     * Per-row heights in pixels, indexed by data row (heights follow rows when
+     * sorting or filtering). Takes precedence over a `rowHeight` function.
+     * - A list of numbers, one per data row
+     * - A binary column ({"dtype": "float64", "data": "<base64>"}, see `dash_glide_grid.encode_typed_column`)
+     * - A string: the id of a data column holding each row's height
+     * Rows without a valid height use `rowHeight` (or 34).
+     * Heights are resolved once per data/row order change into a lookup table,
+     * which keeps scrolling smooth with variable heights on large grids.
+     */
+    rowHeights: PropTypes.oneOfType([
+        PropTypes.arrayOf(PropTypes.number),
+        PropTypes.shape({
+            dtype: PropTypes.string,
+            data: PropTypes.string
+        }),
+        PropTypes.string
+    ]),
+
     /**
      * Height of the header row in pixels. Default: 36
      */
@@ -5574,8 +5903,28 @@ GlideGrid.propTypes = {
      *
      * Useful for tree view collapse/expand functionality where child rows
      * need to hide/show while maintaining their identity and selection state.
+     *
+     * Entries can also be inclusive ranges, so large sections take one entry:
+     * [3, [10, 500000]] hides row 3 and rows 10 through 500000.
+     * See `hiddenRowsMode` for removing hidden rows from the display entirely.
+     */
+    hiddenRows: PropTypes.arrayOf(PropTypes.oneOfType([
+        PropTypes.number,
+        PropTypes.arrayOf(PropTypes.number)
+    ])),
+
+    /**
+     * How hidden rows are hidden.
+     * - "collapse" (default): hidden rows stay in the grid with height 0, as
+     *   described for `hiddenRows`. Indices are display rows.
+     * - "exclude": hidden rows are left out of the display order, like filtered
+     *   rows. Indices are data rows. Cost scales with the visible rows only, so
+     *   hiding most of a large grid (e.g. collapsed tree sections) stays fast.
+     *   Row numbers then follow the visible rows, and `hiddenRowsConfig` doesn't
+     *   apply since hidden rows can't be reached.
+     * Has no effect with `rowModel="server"`.
      */
-    hiddenRows: PropTypes.arrayOf(PropTypes.number),
+    hiddenRowsMode: PropTypes.oneOf(['collapse', 'exclude']),
 
     /**
      * Configuration object controlling how hidden rows affect grid operations.
@@ -5618,6 +5967,49 @@ GlideGrid.propTypes = {
      */
     searchValue: PropTypes.string,
 
+    /**
+     * Search with an index instead of Glide's cell-by-cell search. Each column's
+     * distinct display texts get a trigram index, built on the first search and
+     * kept up to date on edits, so searching large grids takes milliseconds.
+     * Matches are case-insensitive substrings of the display value (or of the
+     * `format` output for formatted columns); `valueFormatter` output is not
+     * searched. Enables `searchResults` and `searchNavigate`. Default: false
+     */
+    searchIndex: PropTypes.bool,
+
+    /**
+     * Results of the current search (output, requires `searchIndex`).
+     * - `query`: The search text
+     * - `count`: Number of matching cells
+     * - `matches`: First 1000 matches as {row, col, displayRow}, in display order.
+     *   `row` is the data row index.
+     * - `truncated`: True if there are more matches than listed
+     * - `current`: Index of the match navigated to, or -1
+     */
+    searchResults: PropTypes.shape({
+        query: PropTypes.string,
+        count: PropTypes.number,
+        matches: PropTypes.arrayOf(PropTypes.shape({
+            row: PropTypes.number,
+            col: PropTypes.number,
+            displayRow: PropTypes.number
+        })),
+        truncated: PropTypes.bool,
+        current: PropTypes.number
+    }),
+
+    /**
+     * Jump to the next or previous search match (requires `searchIndex`).
+     * The grid scrolls to the match, selects it and updates `searchResults.current`.
+     * Include a timestamp so repeated jumps in the same direction trigger.
+     *
+     * Example: {"direction": "next", "timestamp": 1234567890}
+     */
+    searchNavigate: PropTypes.shape({
+        direction: PropTypes.oneOf(['next', 'prev']),
+        timestamp: PropTypes.number
+    }),
+
     /**
      * Allow column resizing by dragging column edges. Default: true
      */
@@ -6049,6 +6441,65 @@ GlideGrid.propTypes = {
         ty: PropTypes.number
     }),
 
+    // ========== SERVER ROW MODEL ==========
+
+    /**
+     * Where rows come from.
+     * - "client" (default): All rows are passed in `data` / `dataColumns`.
+     * - "server": Only the total row count is known up front (`rows`). The grid
+     *   requests blocks of rows around the viewport via `rowBlockRequest` and shows
+     *   loading cells until `rowBlocks` answers. Sorting and filtering are left to
+     *   the server (the request includes the current `sortColumns` and `columnFilters`),
+     *   and edits are always sent as `dataPatch`.
+     * Use `dash_glide_grid.RowBlockProvider` to serve blocks from a DataFrame.
+     * Default: "client"
+     */
+    rowModel: PropTypes.oneOf(['client', 'server']),
+
+    /**
+     * Number of rows per block when rowModel="server". Default: 100
+     */
+    blockSize: PropTypes.number,
+
+    /**
+     * Maximum number of blocks kept in memory when rowModel="server".
+     * The least recently visible blocks are dropped first. Default: 50
+     */
+    maxCachedBlocks: PropTypes.number,
+
+    /**
+     * Request for a range of rows when rowModel="server" (read-only output prop).
+     * `endRow` is exclusive. `generation` changes whenever the block cache is reset
+     * (sort/filter/row count change) and should be echoed back in `rowBlocks`.
+     * Format: {"startRow": 0, "endRow": 200, "blockSize": 100, "sortColumns": [...],
+     *          "columnFilters": {...}, "generation": 0, "timestamp": 1234567890}
+     */
+    rowBlockRequest: PropTypes.shape({
+        startRow: PropTypes.number,
+        endRow: PropTypes.number,
+        blockSize: PropTypes.number,
+        sortColumns: PropTypes.array,
+        columnFilters: PropTypes.object,
+        generation: PropTypes.number,
+        timestamp: PropTypes.number
+    }),
+
+    /**
+     * Rows sent by the server in answer to `rowBlockRequest` (rowModel="server").
+     * Provide the rows either as records (`data`) or columnar (`dataColumns`).
+     * `totalRows` optionally updates the total row count. Responses whose
+     * `generation` doesn't match the grid's current generation are ignored.
+     * Format: {"startRow": 0, "data": [...], "totalRows": 20000000, "generation": 0, "timestamp": 1234567890}
+     */
+    rowBlocks: PropTypes.shape({
+        startRow: PropTypes.number,
+        data: PropTypes.arrayOf(PropTypes.object),
+        dataColumns: PropTypes.object,
+        totalRows: PropTypes.number,
+        generation: PropTypes.number,
+        timestamp: PropTypes.number
+    }),
+
     // ========== ROW/COLUMN REORDERING ==========
 
     /**
@@ -6159,12 +6610,15 @@ GlideGrid.propTypes = {
      * - true: Flash on all operations (edit, paste, undo, redo)
      * - false: No flash (default)
      * - Array of strings: Flash only on specified operations.
-     *   Valid values: "edit", "paste", "undo", "redo"
+     *   Valid values: "edit", "paste", "undo", "redo", "append", "update"
+     *   ("update" flashes cells changed through `cellUpdates`)
      *   Example: ["paste", "undo", "redo"] to flash on paste and undo/redo but not regular edits
+     * Flashes don't re-render the grid: flashed cells are repainted together once per
+     * animation frame and forgotten when the animation ends.
      */
     showCellFlash: PropTypes.oneOfType([
         PropTypes.bool,
-        PropTypes.arrayOf(PropTypes.oneOf(["edit", "paste", "undo", "redo"]))
+        PropTypes.arrayOf(PropTypes.oneOf(["edit", "paste", "undo", "redo", "append", "update"]))
     ]),
 
     /**
@@ -6193,6 +6647,15 @@ GlideGrid.propTypes = {
      */
     maxUndoSteps: PropTypes.number,
 
+    /**
+     * Memory budget for the undo history, in bytes (approximate).
+     * Edit batches are stored as row ranges with one array of old and new
+     * values per column, and the oldest batches are discarded once the history
+     * exceeds this size (a single batch larger than the budget is not kept).
+     * Applies together with maxUndoSteps. Default: null (no byte limit)
+     */
+    maxUndoBytes: PropTypes.number,
+
     /**
      * Trigger undo or redo programmatically from Dash.
      * Set this prop to trigger an undo or redo action.
@@ -6233,6 +6696,22 @@ GlideGrid.propTypes = {
      */
     keybindings: PropTypes.object,
 
+    /**
+     * Rate limits for high-frequency output props, in milliseconds per prop.
+     * The first event in a window is sent immediately and the latest one is
+     * always delivered when the window ends, so the final state is never lost.
+     * Set a prop to false to stop sending it entirely (e.g. when no callback
+     * listens to it). Props not listed are sent on every event.
+     *
+     * Supported props: mouseMove, itemHovered, visibleRegion, columnWidths
+     *
+     * Example: {"mouseMove": 50, "visibleRegion": 100, "itemHovered": false}
+     */
+    eventRateLimits: PropTypes.objectOf(PropTypes.oneOfType([
+        PropTypes.number,
+        PropTypes.bool
+    ])),
+
     /**
      * Makes the grid draggable for external drag-and-drop.
      */
@@ -6369,12 +6848,55 @@ GlideGrid.propTypes = {
      * - `Theme object`: Override theme properties for this row (e.g., bgCell, textDark)
      * - `undefined`: Use default theme
      *
-     * **Available parameters**: `row` (row index), `rowData` (dict of cell values keyed by column id), `data` (full grid data)
+     * **Available parameters**: `row` (display row index), `dataRow` (data row index, unaffected by sorting/filtering), `rowData` (dict of cell values keyed by column id), `data` (full grid data)
+     *
+     * For conditions on cell values, `styleRules` is faster: it doesn't run a function per row on every draw.
      */
     getRowThemeOverride: PropTypes.shape({
         function: PropTypes.string.isRequired
     }),
 
+    /**
+     * Declarative conditional styling. Each rule tests the value in `column`
+     * and applies a theme override to the whole row (`scope: "row"`, default)
+     * or only to that cell (`scope: "cell"`). When several rules match, the
+     * last one wins. Rules are evaluated once per row when the data changes.
+     * Painting only looks up the result, so no functions run while scrolling.
+     *
+     * - `column`: Column id whose value is tested
+     * - `operator`: "==", "!=", ">", ">=", "<", "<=", "between" (value is [low, high]),
+     *   "in", "notIn" (value is a list; items compare like "==", so 1 matches "1"),
+     *   "contains", "startsWith", "endsWith" (case-insensitive), "isBlank", "notBlank"
+     * - `value`: Value to compare against
+     * - `theme`: Name of a theme in `styleThemes`, or an inline theme override object
+     * - `scope`: "row" or "cell"
+     *
+     * Example:
+     * ```
+     * styleRules=[
+     *     {"column": "status", "operator": "==", "value": "error", "theme": "danger"},
+     *     {"column": "change", "operator": "<", "value": 0, "theme": "negative", "scope": "cell"},
+     * ]
+     * styleThemes={"danger": {"bgCell": "#fde8e8"}, "negative": {"textDark": "#c0392b"}}
+     * ```
+     */
+    styleRules: PropTypes.arrayOf(PropTypes.shape({
+        column: PropTypes.string.isRequired,
+        operator: PropTypes.oneOf([
+            '==', '!=', '>', '>=', '<', '<=', 'between', 'in', 'notIn',
+            'contains', 'startsWith', 'endsWith', 'isBlank', 'notBlank'
+        ]),
+        value: PropTypes.any,
+        theme: PropTypes.oneOfType([PropTypes.string, PropTypes.object]).isRequired,
+        scope: PropTypes.oneOf(['row', 'cell'])
+    })),
+
+    /**
+     * Named theme overrides referenced by `styleRules`.
+     * Example: {"danger": {"bgCell": "#fde8e8", "textDark": "#9b1c1c"}}
+     */
+    styleThemes: PropTypes.objectOf(PropTypes.object),
+
     /**
      * Custom cell rendering using JavaScript Canvas API.
      * Allows complete control over how cells are drawn.
@@ -6482,6 +7004,16 @@ GlideGrid.propTypes = {
      */
     sortingOrder: PropTypes.arrayOf(PropTypes.oneOf(['asc', 'desc', null])),
 
+    /**
+     * Where sorting happens.
+     * - "client" (default): the grid sorts its rows in the browser
+     * - "server": clicking a header only updates `sortColumns`. The grid keeps
+     *   its current order until the server sends a new `rowOrder`
+     *   (see `dash_glide_grid.compute_row_order`).
+     * `sortable` must still be true for header clicks to sort.
+     */
+    sortMode: PropTypes.oneOf(['client', 'server']),
+
     // ========== COLUMN FILTER PROPS ==========
 
     /**
@@ -6495,6 +7027,44 @@ GlideGrid.propTypes = {
      */
     columnFilters: PropTypes.objectOf(PropTypes.arrayOf(PropTypes.any)),
 
+    /**
+     * Where column filters are applied.
+     * - "client" (default): the grid filters its rows in the browser
+     * - "server": the filter menu only updates `columnFilters`. The server
+     *   answers with a `rowOrder` that leaves out the filtered rows.
+     */
+    filterMode: PropTypes.oneOf(['client', 'server']),
+
+    /**
+     * Sort and filter in a background Web Worker instead of on the main thread.
+     * The worker keeps a copy of the sorted/filtered columns (only the parts that
+     * changed are sent to it) and returns the row order when it is done; until
+     * then the grid keeps showing the previous order, so scrolling and input
+     * stay responsive on large datasets. Superseded sort or filter changes are
+     * skipped. Falls back to main-thread sorting when workers are unavailable.
+     * Has no effect with `rowModel="server"`. Default: false
+     */
+    computeWorker: PropTypes.bool,
+
+    /**
+     * Display order of rows computed by the server, used when `sortMode` or
+     * `filterMode` is "server". Each entry is a data row index. Rows that are
+     * left out are hidden. Sorting or filtering that is still done on the
+     * client is applied on top of this order.
+     *
+     * Can be a list of ints or a binary int32 column
+     * ({"dtype": "int32", "data": "<base64>"}), as returned by
+     * `dash_glide_grid.compute_row_order(..., binary=True)`.
+     * Set to None to show the rows in data order.
+     */
+    rowOrder: PropTypes.oneOfType([
+        PropTypes.arrayOf(PropTypes.number),
+        PropTypes.shape({
+            dtype: PropTypes.oneOf(['int32', 'uint32']),
+            data: PropTypes.string
+        })
+    ]),
+
     /**
      * Configuration for the header filter menu.
      *
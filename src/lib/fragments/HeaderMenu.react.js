@@ -2,6 +2,11 @@ import React, { useState, useMemo, useEffect, useRef, useCallback } from 'react'
 import { createPortal } from 'react-dom';
 import PropTypes from 'prop-types';
 
+// Filter list virtualization: only the rows in view (plus a margin) are rendered
+const FILTER_ITEM_HEIGHT = 28;
+const FILTER_LIST_HEIGHT = 250;
+const FILTER_LIST_OVERSCAN = 8;
+
 /**
  * HeaderMenu - A filter menu component for column headers
  * Renders as a portal positioned near the column header
@@ -13,6 +18,7 @@ const HeaderMenu = ({
     columnIndex,
     columnTitle,
     uniqueValues,
+    valueCounts,
     selectedValues,
     onFilterChange,
     theme,
@@ -25,6 +31,8 @@ const HeaderMenu = ({
     const [filterSearch, setFilterSearch] = useState('');
     const menuRef = useRef(null);
     const searchInputRef = useRef(null);
+    const filterListRef = useRef(null);
+    const [listScrollTop, setListScrollTop] = useState(0);
 
     // Track scroll offset to reposition menu when page scrolls
     const [scrollOffset, setScrollOffset] = useState({ x: 0, y: 0 });
@@ -175,9 +183,14 @@ const HeaderMenu = ({
                 flex: 1,
                 overflowY: 'auto',
                 padding: '4px 0',
-                maxHeight: '250px'
+                maxHeight: `${FILTER_LIST_HEIGHT}px`
             },
             filterItem: {
+                position: 'absolute',
+                left: 0,
+                right: 0,
+                height: `${FILTER_ITEM_HEIGHT}px`,
+                boxSizing: 'border-box',
                 padding: '6px 12px',
                 cursor: 'pointer',
                 display: 'flex',
@@ -188,6 +201,13 @@ const HeaderMenu = ({
             filterItemHover: {
                 backgroundColor: t.bgHeaderHovered || '#f0f0f0'
             },
+            valueCount: {
+                marginLeft: 'auto',
+                paddingLeft: '8px',
+                color: t.textLight || '#999',
+                fontSize: '11px',
+                flexShrink: 0
+            },
             checkbox: {
                 width: '16px',
                 height: '16px',
@@ -245,7 +265,7 @@ const HeaderMenu = ({
         const fixedHeight = 115;
         // Filter list: 8px padding + 28px per item, capped at 250px (maxHeight in CSS)
         // Use uniqueValues (not filteredValues) since search filtering happens after menu opens
-        const filterListHeight = Math.min(8 + (uniqueValues?.length || 0) * 28, 250);
+        const filterListHeight = Math.min(8 + (uniqueValues?.length || 0) * FILTER_ITEM_HEIGHT, FILTER_LIST_HEIGHT);
         // Custom items: 9px divider + 36px per item
         const customItemsHeight = customItems && customItems.length > 0
             ? 9 + customItems.length * 36
@@ -285,16 +305,36 @@ const HeaderMenu = ({
         };
     }, [position, styles.container, scrollOffset, zIndex, customItems, selectedValues, uniqueValues]);
 
-    // Filter unique values based on search
-    const filteredValues = useMemo(() => {
+    // Lowercased labels, computed once per value list rather than on every keystroke
+    const searchableValues = useMemo(
+        () => uniqueValues.map(val => String(val).toLowerCase()),
+        [uniqueValues]
+    );
+
+    // Filter unique values based on search (indices into uniqueValues)
+    const filteredIndices = useMemo(() => {
         if (!filterSearch.trim()) {
-            return uniqueValues;
+            return uniqueValues.map((_, i) => i);
         }
         const searchLower = filterSearch.toLowerCase();
-        return uniqueValues.filter(val =>
-            String(val).toLowerCase().includes(searchLower)
-        );
-    }, [uniqueValues, filterSearch]);
+        const matches = [];
+        for (let i = 0; i < searchableValues.length; i++) {
+            if (searchableValues[i].includes(searchLower)) matches.push(i);
+        }
+        return matches;
+    }, [uniqueValues, searchableValues, filterSearch]);
+
+    // Jump back to the top when the list changes
+    useEffect(() => {
+        setListScrollTop(0);
+        if (filterListRef.current) filterListRef.current.scrollTop = 0;
+    }, [filteredIndices]);
+
+    // Selected values as a Set, so checking each rendered row is O(1)
+    const selectedSet = useMemo(
+        () => (selectedValues === null ? null : new Set(selectedValues)),
+        [selectedValues]
+    );
 
     // Compute selection state
     const allSelected = selectedValues === null ||
@@ -324,7 +364,7 @@ const HeaderMenu = ({
         if (selectedValues === null) {
             // All were selected, now deselect this one
             newSelection = uniqueValues.filter(v => v !== value);
-        } else if (selectedValues.includes(value)) {
+        } else if (selectedSet.has(value)) {
             // Remove from selection
             newSelection = selectedValues.filter(v => v !== value);
         } else {
@@ -338,7 +378,7 @@ const HeaderMenu = ({
         } else {
             onFilterChange(columnIndex, newSelection);
         }
-    }, [selectedValues, uniqueValues, columnIndex, onFilterChange]);
+    }, [selectedValues, selectedSet, uniqueValues, columnIndex, onFilterChange]);
 
     // Handle clear filter
     const handleClearFilter = useCallback(() => {
@@ -348,15 +388,22 @@ const HeaderMenu = ({
 
     // Check if a value is selected
     const isValueSelected = useCallback((value) => {
-        if (selectedValues === null) return true;
-        return selectedValues.includes(value);
-    }, [selectedValues]);
+        if (selectedSet === null) return true;
+        return selectedSet.has(value);
+    }, [selectedSet]);
 
     // Track hovered item for styling
     const [hoveredIndex, setHoveredIndex] = useState(-1);
 
     if (!isOpen) return null;
 
+    // Window of filter rows to render
+    const firstVisible = Math.max(0, Math.floor(listScrollTop / FILTER_ITEM_HEIGHT) - FILTER_LIST_OVERSCAN);
+    const lastVisible = Math.min(
+        filteredIndices.length,
+        Math.ceil((listScrollTop + FILTER_LIST_HEIGHT) / FILTER_ITEM_HEIGHT) + FILTER_LIST_OVERSCAN
+    );
+
     // Backdrop style - invisible overlay to catch clicks outside the menu
     const backdropStyle = {
         position: 'fixed',
@@ -414,17 +461,26 @@ const HeaderMenu = ({
             </div>
 
             {/* Filter List */}
-            <div style={styles.filterList}>
-                {filteredValues.length === 0 ? (
+            <div
+                ref={filterListRef}
+                style={styles.filterList}
+                onScroll={(e) => setListScrollTop(e.currentTarget.scrollTop)}
+            >
+                {filteredIndices.length === 0 ? (
                     <div style={styles.noResults}>
                         {filterSearch ? 'No matching values' : 'No values available'}
                     </div>
                 ) : (
-                    filteredValues.map((value, index) => (
+                    <div style={{ position: 'relative', height: `${filteredIndices.length * FILTER_ITEM_HEIGHT}px` }}>
+                    {filteredIndices.slice(firstVisible, lastVisible).map((valueIndex, offset) => {
+                        const index = firstVisible + offset;
+                        const value = uniqueValues[valueIndex];
+                        return (
                         <div
-                            key={index}
+                            key={valueIndex}
                             style={{
                                 ...styles.filterItem,
+                                top: `${index * FILTER_ITEM_HEIGHT}px`,
                                 ...(hoveredIndex === index ? styles.filterItemHover : {})
                             }}
                             onMouseEnter={() => setHoveredIndex(index)}
@@ -449,8 +505,13 @@ const HeaderMenu = ({
                                     String(value)
                                 )}
                             </span>
+                            {valueCounts && valueCounts[valueIndex] !== undefined && (
+                                <span style={styles.valueCount}>{valueCounts[valueIndex]}</span>
+                            )}
                         </div>
-                    ))
+                        );
+                    })}
+                    </div>
                 )}
             </div>
 
@@ -518,6 +579,8 @@ HeaderMenu.propTypes = {
     columnTitle: PropTypes.string,
     /** Array of unique values for this column */
     uniqueValues: PropTypes.array,
+    /** Number of rows holding each unique value (parallel to uniqueValues) */
+    valueCounts: PropTypes.arrayOf(PropTypes.number),
     /** Currently selected values (null = all selected, [] = none, [...] = specific values) */
     selectedValues: PropTypes.array,
     /** Callback when filter selection changes: (columnIndex, newSelectedValues) => void */
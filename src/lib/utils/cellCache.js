@@ -0,0 +1,100 @@
+/**
+ * Cache of built grid cells for getCellContent
+ *
+ * Building a cell (cell type detection, custom cell transform, valueFormatter)
+ * runs for every visible cell on every paint. Built cells are cached by
+ * (data row, column index). The cache is cleared when the store, the columns
+ * or the row order change wholesale. Edits only drop the cells they touched.
+ */
+
+/**
+ * Create a cell cache
+ *
+ * @param {number} maxSize - Maximum number of cached cells (least recently used are evicted first)
+ * @returns {object} - Cell cache
+ */
+export function createCellCache(maxSize) {
+    let cells = new Map();
+    let store = null;
+    let columns = null;
+    let rowOrder = null;
+    let numCols = 0;
+    let columnIndexById = null;
+
+    const keyFor = (row, col) => row * numCols + col;
+
+    const clear = () => {
+        cells = new Map();
+        columnIndexById = null;
+    };
+
+    // Column id -> column indices (built lazily, only needed for invalidation)
+    const indicesForColumn = (columnId) => {
+        if (!columnIndexById) {
+            columnIndexById = new Map();
+            (columns || []).forEach((columnDef, col) => {
+                const id = columnDef?.id || columnDef?.title;
+                if (!columnIndexById.has(id)) columnIndexById.set(id, []);
+                columnIndexById.get(id).push(col);
+            });
+        }
+        return columnIndexById.get(columnId) || [];
+    };
+
+    return {
+        /**
+         * Make sure cached cells belong to the given store, columns and row order
+         * Anything other than a store adopted through applyEdits clears the cache.
+         */
+        sync(newStore, newColumns, newRowOrder) {
+            if (newStore !== store || newColumns !== columns || newRowOrder !== rowOrder) {
+                store = newStore;
+                columns = newColumns;
+                rowOrder = newRowOrder;
+                numCols = newColumns ? newColumns.length : 0;
+                clear();
+            }
+        },
+
+        get(row, col) {
+            const key = keyFor(row, col);
+            const cell = cells.get(key);
+            if (cell !== undefined) {
+                // Move to the end to mark as recently used
+                cells.delete(key);
+                cells.set(key, cell);
+            }
+            return cell;
+        },
+
+        set(row, col, cell) {
+            cells.set(keyFor(row, col), cell);
+            if (cells.size > maxSize) {
+                // Evict the least recently used entry (first in insertion order)
+                cells.delete(cells.keys().next().value);
+            }
+        },
+
+        /**
+         * Drop the cells touched by edits ({row, columnId})
+         */
+        invalidate(edits) {
+            for (const edit of edits) {
+                for (const col of indicesForColumn(edit.columnId)) {
+                    cells.delete(keyFor(edit.row, col));
+                }
+            }
+        },
+
+        /**
+         * Drop the cells touched by edits and adopt the store the edits produced,
+         * so the next sync() keeps the rest of the cache
+         */
+        applyEdits(edits, newStore) {
+            if (store !== null) {
+                this.invalidate(edits);
+                store = newStore;
+            }
+        }
+    };
+}
@@ -0,0 +1,338 @@
+/**
+ * Display and sort values of cells, shared by the grid and the compute worker
+ *
+ * getCellDisplayValue gives the value the filter menu shows and matches on;
+ * extractSortValue gives the value and type rows are sorted by. The compute
+ * worker (computeWorker.js) is built from the source of these functions, so
+ * they must stay self-contained after Babel: they only call each other and
+ * isObjectValue, and avoid syntax that Babel turns into module-level helpers
+ * (array/object spread, for...of, destructuring, `typeof x === 'object'`).
+ */
+
+/**
+ * Whether a value is an object (typeof "object", but not null)
+ */
+export function isObjectValue(value) {
+    return value !== null && Object(value) === value;
+}
+
+/**
+ * Display value of a cell, as shown and matched by the filter menu
+ *
+ * @param {any} cellValue - Raw cell value from the data
+ * @returns {any} - Display value ("(Blank)" for empty cells)
+ */
+export function getCellDisplayValue(cellValue) {
+    // Handle null/undefined/empty
+    if (cellValue === null || cellValue === undefined) {
+        return '(Blank)';
+    }
+    if (cellValue === '') {
+        return '(Blank)';
+    }
+
+    // Handle primitives directly
+    if (!isObjectValue(cellValue)) {
+        return cellValue;
+    }
+
+    // Handle cell objects with kind property
+    const kind = cellValue.kind;
+
+    if (!kind) {
+        // Legacy object without kind
+        const data = cellValue.data;
+        if (data === null || data === undefined || data === '') {
+            return '(Blank)';
+        }
+        if (!isObjectValue(data)) {
+            return data;
+        }
+        return JSON.stringify(data);
+    }
+
+    // Handle custom cell types
+    switch (kind) {
+        case 'dropdown-cell': {
+            const value = cellValue.data?.value;
+            if (!value) return '(Blank)';
+            // Try to find matching option with label
+            const options = cellValue.data?.options || cellValue.data?.allowedValues || [];
+            const matchedOption = options.find(opt =>
+                (isObjectValue(opt) ? opt.value : opt) === value
+            );
+            if (matchedOption && isObjectValue(matchedOption) && matchedOption.label) {
+                return matchedOption.label;
+            }
+            return value;
+        }
+
+        case 'multi-select-cell': {
+            const values = cellValue.data?.values || [];
+            if (values.length === 0) return '(Blank)';
+            // Try to resolve labels
+            const options = cellValue.data?.options || [];
+            const labels = values.map(v => {
+                const opt = options.find(o =>
+                    (isObjectValue(o) ? o.value : o) === v
+                );
+                return (opt && isObjectValue(opt) && opt.label) ? opt.label : v;
+            });
+            return labels.join(', ');
+        }
+
+        case 'button-cell':
+            return cellValue.title || 'Button';
+
+        case 'tags-cell': {
+            const tags = cellValue.tags || [];
+            if (tags.length === 0) return '(Blank)';
+            return tags.join(', ');
+        }
+
+        case 'user-profile-cell':
+            return cellValue.name || '(Blank)';
+
+        case 'spinner-cell':
+            return '(Loading)';
+
+        case 'star-cell': {
+            const rating = cellValue.rating || 0;
+            const maxStars = cellValue.maxStars || 5;
+            return `${rating}/${maxStars}`;
+        }
+
+        case 'date-picker-cell': {
+            if (cellValue.displayDate) return cellValue.displayDate;
+            if (!cellValue.date) return '(Blank)';
+            try {
+                const d = new Date(cellValue.date);
+                if (!isNaN(d.getTime())) {
+                    return d.toLocaleDateString();
+                }
+            } catch {
+                // Fall through
+            }
+            return cellValue.date;
+        }
+
+        case 'range-cell': {
+            if (cellValue.label !== undefined && cellValue.label !== null) {
+                return String(cellValue.label);
+            }
+            return cellValue.value ?? 0;
+        }
+
+        case 'links-cell': {
+            const links = cellValue.links || [];
+            if (links.length === 0) return '(Blank)';
+            const titles = links.map(l => l.title || l.href || 'Link');
+            return titles.join(', ');
+        }
+
+        case 'sparkline-cell': {
+            const values = cellValue.values || [];
+            if (values.length === 0) return '(Blank)';
+            const sum = values.reduce((a, b) => a + (b || 0), 0);
+            const avg = sum / values.length;
+            return `Sparkline (avg: ${avg.toFixed(1)})`;
+        }
+
+        case 'tree-view-cell':
+            return cellValue.text || '(Blank)';
+
+        // Built-in cell types
+        case 'markdown':
+            return cellValue.data || '(Blank)';
+
+        case 'uri':
+            // Use displayData if available, otherwise the URL
+            return cellValue.displayData || cellValue.data || '(Blank)';
+
+        case 'image': {
+            // Image data is an array of URLs
+            const images = cellValue.data || [];
+            if (images.length === 0) return '(Blank)';
+            return `${images.length} image${images.length > 1 ? 's' : ''}`;
+        }
+
+        case 'bubble': {
+            // Bubble data is an array of strings
+            const bubbles = cellValue.data || [];
+            if (bubbles.length === 0) return '(Blank)';
+            return bubbles.join(', ');
+        }
+
+        case 'drilldown': {
+            // Drilldown data is an array of objects with text property
+            const items = cellValue.data || [];
+            if (items.length === 0) return '(Blank)';
+            return items.map(item => item.text || '').filter(Boolean).join(', ');
+        }
+
+        case 'loading':
+            return '(Loading)';
+
+        case 'rowid':
+            return cellValue.data || '(Blank)';
+
+        case 'protected':
+            return '(Protected)';
+
+        default: {
+            // Unknown cell type - try data property
+            const innerData = cellValue.data;
+            if (innerData === null || innerData === undefined || innerData === '') {
+                return '(Blank)';
+            }
+            if (!isObjectValue(innerData)) {
+                return innerData;
+            }
+            return JSON.stringify(innerData);
+        }
+    }
+}
+
+/**
+ * Sortable value of a cell
+ *
+ * @param {any} cellValue - Raw cell value from the data
+ * @returns {object} - {value, type: "number" | "string" | "date" | "unsortable"}
+ */
+export function extractSortValue(cellValue) {
+    // Handle null/undefined
+    if (cellValue === null || cellValue === undefined) {
+        return { value: null, type: 'string' };
+    }
+
+    // Handle primitives directly
+    if (!isObjectValue(cellValue)) {
+        if (typeof cellValue === 'number') {
+            return { value: cellValue, type: 'number' };
+        }
+        if (typeof cellValue === 'boolean') {
+            return { value: cellValue ? 1 : 0, type: 'number' };
+        }
+        return { value: String(cellValue), type: 'string' };
+    }
+
+    // Handle cell objects with kind property
+    const kind = cellValue.kind;
+
+    if (!kind) {
+        // Legacy object without kind - try to extract meaningful value
+        if (cellValue.data !== undefined) {
+            return extractSortValue(cellValue.data);
+        }
+        // Fallback to JSON stringification
+        try {
+            return { value: JSON.stringify(cellValue), type: 'string' };
+        } catch {
+            return { value: '', type: 'string' };
+        }
+    }
+
+    // Handle custom cell types
+    switch (kind) {
+        case 'dropdown-cell':
+            return { value: cellValue.data?.value || '', type: 'string' };
+
+        case 'multi-select-cell': {
+            const values = cellValue.data?.values || [];
+            return { value: values.slice().sort().join(', '), type: 'string' };
+        }
+
+        case 'button-cell':
+            // Buttons are not meaningfully sortable
+            return { value: null, type: 'unsortable' };
+
+        case 'tags-cell': {
+            const tags = cellValue.tags || [];
+            return { value: tags.slice().sort().join(', '), type: 'string' };
+        }
+
+        case 'user-profile-cell':
+            return { value: cellValue.name || '', type: 'string' };
+
+        case 'spinner-cell':
+            // Spinners are not sortable (loading state)
+            return { value: null, type: 'unsortable' };
+
+        case 'star-cell':
+            return { value: cellValue.rating || 0, type: 'number' };
+
+        case 'date-picker-cell':
+            // ISO date strings sort correctly with localeCompare
+            return { value: cellValue.date || '', type: 'date' };
+
+        case 'range-cell':
+            return { value: cellValue.value ?? 0, type: 'number' };
+
+        case 'links-cell': {
+            const links = cellValue.links || [];
+            if (links.length === 0) return { value: '', type: 'string' };
+            return { value: links[0]?.title || links[0]?.href || '', type: 'string' };
+        }
+
+        case 'sparkline-cell': {
+            const sparkValues = cellValue.values || [];
+            if (sparkValues.length === 0) return { value: 0, type: 'number' };
+            const sum = sparkValues.reduce((acc, v) => acc + (v || 0), 0);
+            const avg = sum / sparkValues.length;
+            return { value: avg, type: 'number' };
+        }
+
+        case 'tree-view-cell':
+            return { value: cellValue.text || '', type: 'string' };
+
+        // Built-in cell types
+        case 'markdown':
+            return { value: cellValue.data || '', type: 'string' };
+
+        case 'uri':
+            // Sort by displayData if available, otherwise URL
+            return { value: cellValue.displayData || cellValue.data || '', type: 'string' };
+
+        case 'image': {
+            // Sort by number of images
+            const images = cellValue.data || [];
+            return { value: images.length, type: 'number' };
+        }
+
+        case 'bubble': {
+            // Sort by joined bubble values
+            const bubbles = cellValue.data || [];
+            return { value: bubbles.slice().sort().join(', '), type: 'string' };
+        }
+
+        case 'drilldown': {
+            // Sort by first item's text
+            const items = cellValue.data || [];
+            if (items.length === 0) return { value: '', type: 'string' };
+            return { value: items[0]?.text || '', type: 'string' };
+        }
+
+        case 'loading':
+            // Loading cells are not meaningfully sortable
+            return { value: null, type: 'unsortable' };
+
+        case 'rowid':
+            return { value: cellValue.data || '', type: 'string' };
+
+        case 'protected':
+            // Protected cells are not meaningfully sortable
+            return { value: null, type: 'unsortable' };
+
+        default: {
+            // Unknown custom cell - try to extract data property
+            if (cellValue.data !== undefined) {
+                return extractSortValue(cellValue.data);
+            }
+            try {
+                return { value: JSON.stringify(cellValue), type: 'string' };
+            } catch {
+                return { value: '', type: 'string' };
+            }
+        }
+    }
+}
@@ -0,0 +1,394 @@
+/**
+ * Off-main-thread sort and filter (computeWorker prop)
+ *
+ * A dedicated worker keeps a copy of the raw values of the columns that
+ * sorting and filtering need, chunk by chunk as the data store lays them out
+ * (see columnChunks in dataStore.js). Only chunks the worker doesn't have yet
+ * are sent: an edit resends the edited chunks, an append the last chunk, and
+ * values written in place (cellUpdates) are sent as single values. The worker
+ * extracts the sort keys and filter display values itself and ranks and
+ * indexes each column once, until its values change.
+ *
+ * Each compute request returns the display order as a transferred
+ * Int32Array. A newer request supersedes older ones: queued requests are
+ * skipped in the worker and their promises resolve to null.
+ *
+ * The worker runs from a Blob URL, so its source is a string. The display
+ * and sort value helpers are the ones the grid uses (cellValues.js), added
+ * to it through their source text.
+ */
+
+import { isObjectValue, getCellDisplayValue, extractSortValue } from './cellValues';
+
+const WORKER_SOURCE = `
+var collator = typeof Intl !== 'undefined' ? new Intl.Collator(undefined, { sensitivity: 'accent' }) : null;
+// Column id -> {start, length, shift, chunks: Map(index -> {values, keys, display}), ranks, buckets, filter}
+var columns = {};
+var latestId = 0;
+
+// Display and sort values, from cellValues.js (function names may be minified)
+${[isObjectValue, getCellDisplayValue, extractSortValue].map(String).join('\n\n')}
+var displayValue = ${getCellDisplayValue.name};
+var sortValue = ${extractSortValue.name};
+
+// Same as sortKey in sortEngine: a number or string, null for blanks, undefined for unsortable
+function sortKey(cellValue) {
+    var extracted = sortValue(cellValue);
+    var value = extracted.value;
+    if (extracted.type === 'unsortable') return undefined;
+    if (value === null || value === undefined) return null;
+    if (extracted.type === 'number') return Number.isNaN(value) ? null : value;
+    if (extracted.type === 'date') {
+        var time = Date.parse(value);
+        return Number.isNaN(time) ? String(value) : time;
+    }
+    return String(value);
+}
+
+function compareKeys(a, b) {
+    if (typeof a === 'number' && typeof b === 'number') return a - b;
+    a = String(a);
+    b = String(b);
+    if (collator) return collator.compare(a, b);
+    a = a.toLowerCase();
+    b = b.toLowerCase();
+    return a < b ? -1 : (a > b ? 1 : 0);
+}
+
+// Missing values in float chunks are NaN; the data store's get() returns them as null
+function storedValue(value) {
+    return value !== value ? null : value;
+}
+
+// Sort keys and filter display values, extracted once per chunk
+function chunkKeys(chunk) {
+    if (!chunk.keys) chunk.keys = Array.from(chunk.values, function (value) { return sortKey(storedValue(value)); });
+    return chunk.keys;
+}
+
+function chunkDisplayValues(chunk) {
+    if (!chunk.display) {
+        chunk.display = Array.from(chunk.values, function (value) { return displayValue(storedValue(value)); });
+    }
+    return chunk.display;
+}
+
+// Per-row values of a column, read through the chunk of each row
+function forEachRow(column, valuesOf, callback) {
+    var mask = (1 << column.shift) - 1;
+    for (var row = 0; row < column.length; row++) {
+        var position = column.start + row;
+        var chunk = column.chunks.get(position >> column.shift);
+        callback(row, valuesOf(chunk)[position & mask]);
+    }
+}
+
+// Same ranking as sortEngine: values by key, then blanks, then unsortable
+function ranksFor(column) {
+    if (column.ranks) return column;
+    var length = column.length;
+    var keys = new Array(length);
+    var unique = new Set();
+    forEachRow(column, chunkKeys, function (row, key) {
+        keys[row] = key;
+        if (key !== null && key !== undefined) unique.add(key);
+    });
+    var sorted = Array.from(unique).sort(compareKeys);
+    var rankByKey = new Map();
+    var rank = -1;
+    for (var i = 0; i < sorted.length; i++) {
+        if (i === 0 || compareKeys(sorted[i - 1], sorted[i]) !== 0) rank++;
+        rankByKey.set(sorted[i], rank);
+    }
+    var ranks = new Uint32Array(length);
+    for (var row = 0; row < length; row++) {
+        var k = keys[row];
+        ranks[row] = k === undefined ? rank + 2 : (k === null ? rank + 1 : rankByKey.get(k));
+    }
+    column.ranks = ranks;
+    column.buckets = rank + 3;
+    return column;
+}
+
+// Same dictionary index as filterEngine: a value id per row
+function filterIndexFor(column) {
+    if (column.filter) return column.filter;
+    var codes = new Uint32Array(column.length);
+    var idByValue = new Map();
+    var values = [];
+    forEachRow(column, chunkDisplayValues, function (row, value) {
+        var id = idByValue.get(value);
+        if (id === undefined) {
+            id = values.length;
+            values.push(value);
+            idByValue.set(value, id);
+        }
+        codes[row] = id;
+    });
+    column.filter = { codes: codes, values: values, idByValue: idByValue };
+    return column.filter;
+}
+
+function countingSort(order, ranks, buckets, descending) {
+    var counts = new Uint32Array(buckets + 1);
+    var i, bucket;
+    for (i = 0; i < order.length; i++) {
+        bucket = descending ? buckets - 1 - ranks[order[i]] : ranks[order[i]];
+        counts[bucket + 1]++;
+    }
+    for (i = 1; i <= buckets; i++) counts[i] += counts[i - 1];
+    var sorted = new Int32Array(order.length);
+    for (i = 0; i < order.length; i++) {
+        bucket = descending ? buckets - 1 - ranks[order[i]] : ranks[order[i]];
+        sorted[counts[bucket]++] = order[i];
+    }
+    return sorted;
+}
+
+function compute(request) {
+    var order, i, row;
+    if (request.baseRows) {
+        order = request.baseRows;
+    } else {
+        order = new Int32Array(request.length);
+        for (i = 0; i < request.length; i++) order[i] = i;
+    }
+
+    if (request.filters.length > 0) {
+        var checks = [];
+        for (i = 0; i < request.filters.length; i++) {
+            var filter = request.filters[i];
+            var index = filterIndexFor(columns[filter.columnId]);
+            var allowed = new Uint8Array(index.values.length);
+            var selected = filter.selectedValues || [];
+            for (var s = 0; s < selected.length; s++) {
+                var id = index.idByValue.get(selected[s]);
+                if (id !== undefined) allowed[id] = 1;
+            }
+            checks.push({ codes: index.codes, allowed: allowed });
+        }
+        var kept = new Int32Array(order.length);
+        var count = 0;
+        for (i = 0; i < order.length; i++) {
+            row = order[i];
+            var passes = true;
+            for (var c = 0; c < checks.length; c++) {
+                if (!checks[c].allowed[checks[c].codes[row]]) {
+                    passes = false;
+                    break;
+                }
+            }
+            if (passes) kept[count++] = row;
+        }
+        order = kept.slice(0, count);
+    }
+
+    if (request.sort.length > 0) {
+        // Ties keep data row order, as in sortEngine
+        if (request.baseRows) order.sort();
+        for (i = request.sort.length - 1; i >= 0; i--) {
+            var spec = request.sort[i];
+            var ranked = ranksFor(columns[spec.columnId]);
+            order = countingSort(order, ranked.ranks, ranked.buckets, spec.direction === 'desc');
+        }
+    }
+    return order;
+}
+
+// New layout and changed chunks of a column; chunks outside [first, end) are released
+function updateColumn(message) {
+    var column = columns[message.columnId];
+    if (!column) {
+        column = { chunks: new Map() };
+        columns[message.columnId] = column;
+    }
+    column.chunks.forEach(function (chunk, index) {
+        if (index < message.first || index >= message.end) column.chunks.delete(index);
+    });
+    for (var i = 0; i < message.chunks.length; i++) {
+        column.chunks.set(message.chunks[i][0], { values: message.chunks[i][1], keys: null, display: null });
+    }
+    column.start = message.start;
+    column.length = message.length;
+    column.shift = Math.log2(message.chunkSize);
+    column.ranks = null;
+    column.filter = null;
+}
+
+// Values written into the store in place (cellUpdates)
+function applyEdits(edits) {
+    for (var i = 0; i < edits.length; i++) {
+        var edit = edits[i];
+        var column = columns[edit.columnId];
+        if (!column || edit.row < 0 || edit.row >= column.length) continue;
+        var position = column.start + edit.row;
+        var chunk = column.chunks.get(position >> column.shift);
+        if (!chunk) continue;
+        // The value may not fit a typed chunk
+        if (ArrayBuffer.isView(chunk.values)) chunk.values = Array.from(chunk.values, storedValue);
+        var offset = position & ((1 << column.shift) - 1);
+        chunk.values[offset] = edit.value;
+        if (chunk.keys) chunk.keys[offset] = sortKey(edit.value);
+        if (chunk.display) chunk.display[offset] = displayValue(edit.value);
+        column.ranks = null;
+        column.filter = null;
+    }
+}
+
+self.onmessage = function (event) {
+    var message = event.data;
+    if (message.type === 'column') {
+        updateColumn(message);
+    } else if (message.type === 'edits') {
+        applyEdits(message.edits);
+    } else if (message.type === 'compute') {
+        latestId = message.id;
+        // Let newer requests already queued arrive first, so superseded ones are skipped
+        setTimeout(function () {
+            if (message.id !== latestId) {
+                self.postMessage({ id: message.id, order: null });
+                return;
+            }
+            var order = compute(message);
+            self.postMessage({ id: message.id, order: order }, [order.buffer]);
+        }, 0);
+    }
+};
+`;
+
+/**
+ * Whether the browser can run the compute worker
+ */
+export function canUseComputeWorker() {
+    return typeof Worker !== 'undefined' && typeof Blob !== 'undefined' &&
+        typeof URL !== 'undefined' && typeof URL.createObjectURL === 'function';
+}
+
+/**
+ * Create a compute worker client
+ *
+ * @param {function} onError - Called if the worker fails (the grid falls back to main-thread compute)
+ * @returns {object} - {compute(store, request), invalidate(store, edits), terminate()}
+ */
+export function createComputeWorker(onError) {
+    const url = URL.createObjectURL(new Blob([WORKER_SOURCE], { type: 'application/javascript' }));
+    const worker = new Worker(url);
+
+    // Column id -> {store, start, length, tokens: Map(chunk index -> token)} of the worker's copy
+    const synced = new Map();
+    let requestId = 0;
+    const pending = new Map();
+
+    const settleAll = (value) => {
+        pending.forEach(resolve => resolve(value));
+        pending.clear();
+    };
+
+    worker.onmessage = (event) => {
+        const { id, order } = event.data;
+        const resolve = pending.get(id);
+        if (resolve) {
+            pending.delete(id);
+            resolve(order);
+        }
+    };
+
+    worker.onerror = (event) => {
+        console.warn('[GlideGrid] computeWorker failed, sorting and filtering on the main thread:', event.message);
+        settleAll(null);
+        if (onError) onError(event);
+    };
+
+    const tokensOf = (layout) => new Map(layout.chunks.map(chunk => [chunk.index, chunk.token]));
+
+    // Send the worker the chunks of a column it doesn't have yet for this store
+    const syncColumn = (store, columnId) => {
+        const state = synced.get(columnId);
+        if (state && state.store === store) return;
+
+        const layout = store.columnChunks(columnId);
+        const changed = [];
+        for (const chunk of layout.chunks) {
+            if (!state || state.tokens.get(chunk.index) !== chunk.token) {
+                changed.push([chunk.index, chunk.values()]);
+            }
+        }
+        const first = layout.chunks.length > 0 ? layout.chunks[0].index : 0;
+        const end = first + layout.chunks.length;
+        if (!state || changed.length > 0 || state.start !== layout.start || state.length !== layout.length ||
+            state.tokens.size !== layout.chunks.length) {
+            worker.postMessage({
+                type: 'column',
+                columnId,
+                start: layout.start,
+                length: layout.length,
+                chunkSize: layout.chunkSize,
+                first,
+                end,
+                chunks: changed
+            });
+        }
+        synced.set(columnId, { store, start: layout.start, length: layout.length, tokens: tokensOf(layout) });
+    };
+
+    return {
+        /**
+         * Compute the display order
+         *
+         * @param {object} store - Data store
+         * @param {object} request - {filters: [{columnId, selectedValues}], sort: [{columnId, direction}],
+         *   baseRows: Array<number> | null}
+         * @returns {Promise<Int32Array|null>} - Data row per display row, or null if superseded
+         */
+        compute(store, request) {
+            request.filters.forEach(({ columnId }) => syncColumn(store, columnId));
+            request.sort.forEach(({ columnId }) => syncColumn(store, columnId));
+
+            // Anything still pending is superseded by this request
+            settleAll(null);
+
+            requestId += 1;
+            const id = requestId;
+            const baseRows = request.baseRows ? Int32Array.from(request.baseRows) : null;
+            return new Promise(resolve => {
+                pending.set(id, resolve);
+                worker.postMessage({
+                    type: 'compute',
+                    id,
+                    length: store.length,
+                    filters: request.filters,
+                    sort: request.sort,
+                    baseRows
+                }, baseRows ? [baseRows.buffer] : []);
+            });
+        },
+
+        /**
+         * Forward values written into a store in place (applyInPlace) to the worker's copy
+         *
+         * @param {object} store - Store the edits were written into
+         * @param {Array<object>} edits - Edits ({row, columnId})
+         */
+        invalidate(store, edits) {
+            const updates = [];
+            for (const edit of edits) {
+                const state = synced.get(edit.columnId);
+                if (state && state.store === store) {
+                    updates.push({ columnId: edit.columnId, row: edit.row, value: store.get(edit.row, edit.columnId) });
+                }
+            }
+            if (updates.length > 0) worker.postMessage({ type: 'edits', edits: updates });
+
+            // applyInPlace may have copied chunks (for records, a whole row chunk): the copy now matches them
+            synced.forEach((state, columnId) => {
+                if (state.store === store) state.tokens = tokensOf(store.columnChunks(columnId));
+            });
+        },
+
+        terminate() {
+            settleAll(null);
+            worker.terminate();
+            URL.revokeObjectURL(url);
+        }
+    };
+}
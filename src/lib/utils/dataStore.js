@@ -0,0 +1,807 @@
+/**
+ * Data store abstraction for grid rows
+ *
+ * The grid accepts data either as a list of row dicts (`data`) or as a dict of
+ * column arrays (`dataColumns`). Both are wrapped in a store with the same
+ * read/write interface so the rest of the grid doesn't care which was given.
+ *
+ * Stores are immutable: writes return a new store that shares everything the
+ * edits didn't touch with the previous one. Edited rows and column values are
+ * kept in fixed-size chunks over the original arrays, so an edit copies one
+ * chunk rather than the whole row list or column. The one exception is
+ * applyInPlace, used for high-frequency cell updates, which writes into the
+ * store after copying the shared chunks once.
+ *
+ * Appended rows go into chunks past the end of the original arrays, and rows
+ * dropped from the top (maxRows) only move an offset: row r of a store lives
+ * at position r + offset of the chunk layout. Streaming appends therefore
+ * cost the appended rows plus one chunk, not the whole store.
+ */
+
+import {
+    isEncodedColumn,
+    isTypedColumn,
+    isFloatColumn,
+    decodeColumn,
+    encodeColumn,
+    canStoreInColumn
+} from './typedColumns';
+
+// Edited rows live in fixed-size chunks layered over the original arrays, so an edit
+// copies one chunk (plus the small chunk index) instead of a whole array
+const CHUNK_SHIFT = 12;
+const CHUNK_SIZE = 1 << CHUNK_SHIFT;
+const CHUNK_MASK = CHUNK_SIZE - 1;
+
+// Base of columns a store doesn't have (a shared array, so its chunk tokens stay the same)
+const NO_VALUES = [];
+
+function chunkCount(length) {
+    return (length + CHUNK_SIZE - 1) >> CHUNK_SHIFT;
+}
+
+// Writable copy of chunk `index`: from the existing chunk, or sliced out of the base array
+function copyChunk(chunks, base, index) {
+    const existing = chunks && chunks[index];
+    if (existing) return existing.slice();
+    const start = index << CHUNK_SHIFT;
+    return base.slice(start, start + CHUNK_SIZE);
+}
+
+// Writable copy of chunk `index` that can take appended values (typed chunks get a full CHUNK_SIZE)
+function appendableChunk(chunks, base, index) {
+    const existing = chunks && chunks[index];
+    const start = index << CHUNK_SHIFT;
+    if (!existing && !isTypedColumn(base)) return base.slice(start, start + CHUNK_SIZE);
+    const source = existing || base.subarray(start, start + CHUNK_SIZE);
+    if (!isTypedColumn(source)) return source.slice();
+    const chunk = new source.constructor(CHUNK_SIZE);
+    if (isFloatColumn(chunk) && source.length < CHUNK_SIZE) chunk.fill(NaN, source.length);
+    chunk.set(source);
+    return chunk;
+}
+
+// Raw values of one column by chunk (see columnChunks): `token` is the chunk array, or the base array for
+// chunks still read from it. Chunks are numbered from `origin`, so a chunk keeps its number when leading
+// chunks are released.
+function chunkLayout(base, chunks, offset, length, origin, valuesOf) {
+    const layout = { start: (origin << CHUNK_SHIFT) + offset, length, chunkSize: CHUNK_SIZE, chunks: [] };
+    const last = (offset + length - 1) >> CHUNK_SHIFT;
+    for (let index = offset >> CHUNK_SHIFT; length > 0 && index <= last; index++) {
+        const chunk = chunks && chunks[index];
+        const start = index << CHUNK_SHIFT;
+        layout.chunks.push({
+            index: origin + index,
+            token: chunk || base,
+            values: () => valuesOf(chunk || base.slice(start, start + CHUNK_SIZE))
+        });
+    }
+    return layout;
+}
+
+// Edits that fall outside the store grow it, which the chunk layout doesn't cover
+function editsInRange(edits, length) {
+    return edits.every(edit => edit.row >= 0 && edit.row < length);
+}
+
+// Layout after appending `added` rows to a store (offset, length), keeping at most maxRows
+// skip: appended rows dropped straight away; deadChunks: leading chunks no row lives in any more
+function appendLayout(offset, length, added, maxRows) {
+    const drop = appendOverflow(length, added, maxRows);
+    const end = offset + length + added;
+    const newLength = length + added - drop;
+    const newOffset = end - newLength;
+    return {
+        skip: Math.max(0, drop - length),
+        end,
+        newLength,
+        newOffset,
+        deadChunks: newOffset >> CHUNK_SHIFT
+    };
+}
+
+/**
+ * Wrap a list-of-records array in a store
+ *
+ * @param {Array<object>} records - Row dicts keyed by column id
+ * @returns {object} - Data store
+ */
+export function createRecordStore(records) {
+    const base = records || [];
+    return buildRecordStore(base, null, 0, base.length);
+}
+
+// base: the records array (never written); chunks: sparse array of edited/appended row chunks (or null)
+// Row r is at position r + offset of base/chunks; origin numbers the chunks for columnChunks
+function buildRecordStore(base, initialChunks, offset, length, origin = 0) {
+    let chunks = initialChunks;
+    // Flattened rows (base with chunks applied), built when the whole array is needed
+    let flatCache = !chunks && offset === 0 && length === base.length ? base : null;
+    // applyInPlace ownership: whether `chunks` is our own copy, and which chunks we copied
+    let ownsChunkIndex = false;
+    const ownedChunks = new Set();
+
+    const rowAt = (row) => {
+        if (row < 0 || row >= length) return undefined;
+        const position = row + offset;
+        const chunk = chunks && chunks[position >> CHUNK_SHIFT];
+        return chunk ? chunk[position & CHUNK_MASK] : base[position];
+    };
+
+    const flatRows = () => {
+        if (!flatCache) {
+            flatCache = new Array(length);
+            for (let row = 0; row < length; row++) {
+                flatCache[row] = rowAt(row);
+            }
+        }
+        return flatCache;
+    };
+
+    return {
+        kind: 'records',
+        length,
+
+        get source() {
+            return flatRows();
+        },
+
+        hasRow(row) {
+            return !!rowAt(row);
+        },
+
+        get(row, columnId) {
+            const rowData = rowAt(row);
+            return rowData ? rowData[columnId] : undefined;
+        },
+
+        getRow(row) {
+            return rowAt(row) || null;
+        },
+
+        toRecords() {
+            return flatRows();
+        },
+
+        /**
+         * Raw values of one column by chunk, for keeping a copy elsewhere (see computeWorker.js)
+         * Row r is at position start + r. A chunk's token changes when the chunk is replaced
+         * (edits, appends), but not when applyInPlace writes into it.
+         *
+         * @returns {object} - {start, length, chunkSize, chunks: [{index, token, values()}]}
+         */
+        columnChunks(columnId) {
+            const valuesOf = (rows) => Array.from(rows, rowData => (rowData ? rowData[columnId] : undefined));
+            return chunkLayout(base, chunks, offset, length, origin, valuesOf);
+        },
+
+        /**
+         * Apply edits ({row, columnId, newValue}) and return a new store
+         * Only the touched rows and their chunks are copied; everything else is shared.
+         */
+        withEdits(edits) {
+            if (!editsInRange(edits, length)) {
+                // Writing past the end grows the rows array
+                const newRows = flatRows().slice();
+                const copiedRows = new Set();
+                for (const edit of edits) {
+                    if (!copiedRows.has(edit.row)) {
+                        newRows[edit.row] = { ...newRows[edit.row] };
+                        copiedRows.add(edit.row);
+                    }
+                    newRows[edit.row][edit.columnId] = edit.newValue;
+                }
+                return createRecordStore(newRows);
+            }
+
+            const newChunks = chunks ? chunks.slice() : new Array(chunkCount(offset + length));
+            const copiedChunks = new Set();
+            const copiedRows = new Set();
+            for (const edit of edits) {
+                const position = edit.row + offset;
+                const index = position >> CHUNK_SHIFT;
+                if (!copiedChunks.has(index)) {
+                    newChunks[index] = copyChunk(chunks, base, index);
+                    copiedChunks.add(index);
+                }
+                const chunk = newChunks[index];
+                const chunkOffset = position & CHUNK_MASK;
+                if (!copiedRows.has(edit.row)) {
+                    chunk[chunkOffset] = { ...chunk[chunkOffset] };
+                    copiedRows.add(edit.row);
+                }
+                chunk[chunkOffset][edit.columnId] = edit.newValue;
+            }
+            return buildRecordStore(base, newChunks, offset, length, origin);
+        },
+
+        moveRow(startIndex, endIndex) {
+            const newRows = flatRows().slice();
+            const [moved] = newRows.splice(startIndex, 1);
+            newRows.splice(endIndex, 0, moved);
+            return createRecordStore(newRows);
+        },
+
+        /**
+         * Append the rows of another store and return a new store
+         * With maxRows, the oldest rows are dropped so at most maxRows remain.
+         * Only the last chunk is copied; the other chunks are shared with this store.
+         */
+        withAppended(appended, maxRows) {
+            const added = appended.toRecords();
+            const { skip, end, newLength, newOffset, deadChunks } = appendLayout(offset, length, added.length, maxRows);
+
+            const newChunks = chunks ? chunks.slice() : new Array(chunkCount(offset + length));
+            let writable = -1;
+            for (let i = skip; i < added.length; i++) {
+                const position = end - added.length + i;
+                const index = position >> CHUNK_SHIFT;
+                if (index !== writable) {
+                    newChunks[index] = copyChunk(newChunks, base, index);
+                    writable = index;
+                }
+                newChunks[index][position & CHUNK_MASK] = added[i];
+            }
+
+            // Release chunks no row lives in; once no row is read from base, drop base and re-base the layout
+            if (newOffset >= base.length) {
+                return buildRecordStore(
+                    [], newChunks.slice(deadChunks), newOffset - (deadChunks << CHUNK_SHIFT), newLength, origin + deadChunks
+                );
+            }
+            newChunks.fill(undefined, 0, deadChunks);
+            return buildRecordStore(base, newChunks, newOffset, newLength, origin);
+        },
+
+        /**
+         * Write edits ({row, columnId, newValue}) into this store without creating a new one
+         * Each touched chunk is copied on its first write only; each touched row object is replaced.
+         */
+        applyInPlace(edits) {
+            if (!ownsChunkIndex) {
+                chunks = chunks ? chunks.slice() : new Array(chunkCount(offset + length));
+                ownsChunkIndex = true;
+            }
+            for (const edit of edits) {
+                if (!rowAt(edit.row)) continue;
+                const position = edit.row + offset;
+                const index = position >> CHUNK_SHIFT;
+                if (!ownedChunks.has(index)) {
+                    chunks[index] = copyChunk(chunks, base, index);
+                    ownedChunks.add(index);
+                }
+                const chunkOffset = position & CHUNK_MASK;
+                chunks[index][chunkOffset] = { ...chunks[index][chunkOffset], [edit.columnId]: edit.newValue };
+            }
+            flatCache = null;
+        }
+    };
+}
+
+// Number of leading rows to drop so that length + added fits in maxRows
+function appendOverflow(length, added, maxRows) {
+    if (!(maxRows > 0)) return 0;
+    return Math.max(0, length + added - maxRows);
+}
+
+/**
+ * Wrap a columnar dict ({columnId: [values...]}) in a store
+ *
+ * Values are read straight from the column arrays by index. Row dicts are only
+ * built on demand (for user functions that receive rowData) and cached per store.
+ * Binary-encoded numeric columns ({dtype, data}) are decoded into typed arrays.
+ *
+ * @param {object} columns - Dict of column id -> array of values (or encoded column)
+ * @returns {object} - Data store
+ */
+export function createColumnarStore(columns) {
+    const cols = {};
+    const encoded = {};
+    for (const [id, column] of Object.entries(columns || {})) {
+        if (isEncodedColumn(column)) {
+            cols[id] = decodeColumn(column);
+            encoded[id] = column;
+        } else {
+            cols[id] = column || [];
+        }
+    }
+    return buildColumnarStore(cols, encoded, {});
+}
+
+// Move one item within a column copy (works for plain and typed arrays)
+function moveItem(column, startIndex, endIndex) {
+    const copy = column.slice();
+    const moved = copy[startIndex];
+    if (startIndex < endIndex) {
+        copy.copyWithin(startIndex, startIndex + 1, endIndex + 1);
+    } else {
+        copy.copyWithin(endIndex + 1, endIndex, startIndex);
+    }
+    copy[endIndex] = moved;
+    return copy;
+}
+
+// Write a value into a column or chunk (blanks are NaN in float arrays)
+function writeValue(column, index, value) {
+    column[index] = (value === null || value === undefined || value === '') &&
+        isFloatColumn(column) ? NaN : value;
+}
+
+// Plain-array copy of a typed column or chunk (NaN becomes null)
+function toPlainArray(column) {
+    return Array.from(column, v => (v !== v ? null : v));
+}
+
+// Whether every chunk the rows from `offset` (at most `length`) are read from is still typed
+// Released chunks before `offset` are skipped: they are undefined, not typed
+function liveChunksTyped(chunks, offset, length) {
+    const last = Math.min(chunks.length - 1, (offset + length - 1) >> CHUNK_SHIFT);
+    for (let index = offset >> CHUNK_SHIFT; index <= last; index++) {
+        if (chunks[index] && !isTypedColumn(chunks[index])) return false;
+    }
+    return true;
+}
+
+// Rows (from `offset`, at most `length`) of a base column with its chunks applied
+// Stays typed only if every live chunk is still typed
+function flattenColumn(base, chunks, offset, length) {
+    const typed = isTypedColumn(base) && liveChunksTyped(chunks, offset, length);
+    // A column can be shorter than the store: it ends after its base array or its last chunk
+    let columnEnd = base.length;
+    for (let index = chunks.length - 1; index >= 0; index--) {
+        if (chunks[index]) {
+            columnEnd = Math.max(columnEnd, (index + 1) << CHUNK_SHIFT);
+            break;
+        }
+    }
+    const flatLength = Math.max(0, Math.min(length, columnEnd - offset));
+    const flat = typed ? new base.constructor(flatLength) : new Array(flatLength);
+    for (let row = 0; row < flatLength; row++) {
+        const position = row + offset;
+        const chunk = chunks[position >> CHUNK_SHIFT];
+        const value = chunk ? chunk[position & CHUNK_MASK] : base[position];
+        flat[row] = !typed && value !== value ? null : value;
+    }
+    return flat;
+}
+
+function maxColumnLength(cols) {
+    return Object.values(cols).reduce((max, column) => Math.max(max, column.length), 0);
+}
+
+// cols: decoded base columns (never written); encoded: original {dtype, data} of typed columns still unchanged
+// colChunks: column id -> sparse array of edited/appended chunks; row r is at position r + offset
+// origin numbers the chunks for columnChunks
+function buildColumnarStore(cols, encoded, colChunks, offset = 0, length = maxColumnLength(cols), origin = 0) {
+    const columnIds = Object.keys(cols);
+
+    const rowCache = new Map();
+    let recordsCache = null;
+    let sourceCache = null;
+    const flatCache = new Map();
+    // applyInPlace ownership: column ids whose chunk index we copied, and "id:chunk" keys of copied chunks
+    const ownedChunkIndexes = new Set();
+    const ownedChunks = new Set();
+
+    const get = (row, columnId) => {
+        if (row < 0 || row >= length) return undefined;
+        const position = row + offset;
+        const chunks = colChunks[columnId];
+        const chunk = chunks && chunks[position >> CHUNK_SHIFT];
+        let value;
+        if (chunk) {
+            value = chunk[position & CHUNK_MASK];
+        } else {
+            const column = cols[columnId];
+            if (!column) return undefined;
+            value = column[position];
+        }
+        // Missing values in float columns are stored as NaN
+        return value !== value ? null : value;
+    };
+
+    // Whole column with edits applied (only materialized when needed)
+    const flatColumn = (id) => {
+        if (!colChunks[id] && offset === 0) return cols[id];
+        let flat = flatCache.get(id);
+        if (!flat) {
+            flat = flattenColumn(cols[id], colChunks[id] || [], offset, length);
+            flatCache.set(id, flat);
+        }
+        return flat;
+    };
+
+    const buildRow = (row) => {
+        const rowData = {};
+        for (const id of columnIds) {
+            rowData[id] = get(row, id);
+        }
+        return rowData;
+    };
+
+    // Write one value into a writable chunk, switching the chunk to a plain array if it can't hold the value
+    const writeToChunk = (chunks, index, offset, value) => {
+        if (isTypedColumn(chunks[index]) && !canStoreInColumn(chunks[index], value)) {
+            chunks[index] = toPlainArray(chunks[index]);
+        }
+        writeValue(chunks[index], offset, value);
+    };
+
+    return {
+        kind: 'columns',
+        length,
+
+        // Dash-facing form: typed columns are re-encoded (unchanged ones reuse the original payload)
+        get source() {
+            if (!sourceCache) {
+                sourceCache = {};
+                for (const id of columnIds) {
+                    const column = flatColumn(id);
+                    sourceCache[id] = (!colChunks[id] && offset === 0 && encoded[id]) || (isTypedColumn(column) ? encodeColumn(column) : column);
+                }
+            }
+            return sourceCache;
+        },
+
+        hasRow(row) {
+            return row >= 0 && row < length;
+        },
+
+        get,
+
+        getRow(row) {
+            if (row < 0 || row >= length) return null;
+            let rowData = rowCache.get(row);
+            if (!rowData) {
+                rowData = buildRow(row);
+                rowCache.set(row, rowData);
+            }
+            return rowData;
+        },
+
+        toRecords() {
+            if (!recordsCache) {
+                recordsCache = new Array(length);
+                for (let row = 0; row < length; row++) {
+                    recordsCache[row] = buildRow(row);
+                }
+            }
+            return recordsCache;
+        },
+
+        /**
+         * Raw values of one column by chunk, for keeping a copy elsewhere (see computeWorker.js)
+         * Row r is at position start + r. A chunk's token changes when the chunk is replaced
+         * (edits, appends), but not when applyInPlace writes into it. Typed chunks may hold
+         * padding past the last row; missing values in float chunks are NaN.
+         *
+         * @returns {object} - {start, length, chunkSize, chunks: [{index, token, values()}]}
+         */
+        columnChunks(columnId) {
+            return chunkLayout(cols[columnId] || NO_VALUES, colChunks[columnId], offset, length, origin, values => values);
+        },
+
+        /**
+         * Apply edits ({row, columnId, newValue}) and return a new store
+         * Only the touched chunks of the touched columns are copied; everything else is shared.
+         * A typed chunk falls back to a plain array if a value it can't hold is written.
+         */
+        withEdits(edits) {
+            const unknownColumn = edits.some(edit => !cols[edit.columnId]);
+            if (unknownColumn || !editsInRange(edits, length)) {
+                // New columns and writes past the end change the column shapes: start from flat columns
+                const flatCols = {};
+                for (const id of columnIds) flatCols[id] = flatColumn(id);
+                const newCols = { ...flatCols };
+                const copiedColumns = new Set();
+                for (const edit of edits) {
+                    const { columnId } = edit;
+                    if (!copiedColumns.has(columnId)) {
+                        const column = flatCols[columnId];
+                        const keepTyped = isTypedColumn(column) && edits.every(
+                            e => e.columnId !== columnId || canStoreInColumn(column, e.newValue)
+                        );
+                        if (!column) {
+                            newCols[columnId] = new Array(length);
+                        } else if (keepTyped) {
+                            newCols[columnId] = column.slice();
+                        } else {
+                            newCols[columnId] = toPlainArray(column);
+                        }
+                        copiedColumns.add(columnId);
+                    }
+                    writeValue(newCols[columnId], edit.row, edit.newValue);
+                }
+                const newEncoded = {};
+                for (const id of columnIds) {
+                    if (!colChunks[id] && offset === 0 && !copiedColumns.has(id) && encoded[id]) {
+                        newEncoded[id] = encoded[id];
+                    }
+                }
+                return buildColumnarStore(newCols, newEncoded, {});
+            }
+
+            const newColChunks = { ...colChunks };
+            const copied = new Set();
+            for (const edit of edits) {
+                const { columnId } = edit;
+                const position = edit.row + offset;
+                const index = position >> CHUNK_SHIFT;
+                if (!copied.has(columnId)) {
+                    newColChunks[columnId] = colChunks[columnId]
+                        ? colChunks[columnId].slice()
+                        : new Array(chunkCount(offset + length));
+                    copied.add(columnId);
+                }
+                const key = `${columnId}:${index}`;
+                if (!copied.has(key)) {
+                    newColChunks[columnId][index] = copyChunk(colChunks[columnId], cols[columnId], index);
+                    copied.add(key);
+                }
+                writeToChunk(newColChunks[columnId], index, position & CHUNK_MASK, edit.newValue);
+            }
+            return buildColumnarStore(cols, encoded, newColChunks, offset, length, origin);
+        },
+
+        moveRow(startIndex, endIndex) {
+            const newCols = {};
+            for (const id of columnIds) {
+                newCols[id] = moveItem(flatColumn(id), startIndex, endIndex);
+            }
+            return buildColumnarStore(newCols, {}, {});
+        },
+
+        /**
+         * Append the rows of another store and return a new store
+         * With maxRows, the oldest rows are dropped so at most maxRows remain.
+         * Only the last chunk of each column is copied; the other chunks are shared with this store.
+         * A typed chunk falls back to a plain array if an appended value doesn't fit in it.
+         */
+        withAppended(appended, maxRows) {
+            const { skip, end, newLength, newOffset, deadChunks } = appendLayout(offset, length, appended.length, maxRows);
+
+            const ids = new Set(columnIds);
+            if (appended.length > 0) {
+                Object.keys(appended.getRow(0) || {}).forEach(id => ids.add(id));
+            }
+            // Once no row is read from the base columns, drop them and re-base the layout
+            const rebase = columnIds.every(id => cols[id].length <= newOffset);
+
+            const newCols = {};
+            const newColChunks = {};
+            for (const id of ids) {
+                const base = cols[id] || [];
+                const chunks = colChunks[id] ? colChunks[id].slice() : new Array(chunkCount(offset + length));
+                let writable = -1;
+                for (let i = skip; i < appended.length; i++) {
+                    const position = end - appended.length + i;
+                    const index = position >> CHUNK_SHIFT;
+                    if (index !== writable) {
+                        chunks[index] = appendableChunk(chunks, base, index);
+                        writable = index;
+                    }
+                    writeToChunk(chunks, index, position & CHUNK_MASK, appended.get(i, id));
+                }
+
+                if (rebase) {
+                    newCols[id] = isTypedColumn(base) ? new base.constructor(0) : [];
+                    newColChunks[id] = chunks.slice(deadChunks);
+                } else {
+                    chunks.fill(undefined, 0, deadChunks);
+                    newCols[id] = base;
+                    newColChunks[id] = chunks;
+                }
+            }
+            if (rebase) {
+                return buildColumnarStore(
+                    newCols, {}, newColChunks, newOffset - (deadChunks << CHUNK_SHIFT), newLength, origin + deadChunks
+                );
+            }
+            return buildColumnarStore(newCols, {}, newColChunks, newOffset, newLength, origin);
+        },
+
+        /**
+         * Write edits ({row, columnId, newValue}) into this store without creating a new one
+         * Each touched chunk is copied on its first write only. Edits to unknown columns are skipped.
+         */
+        applyInPlace(edits) {
+            for (const edit of edits) {
+                const { columnId, row } = edit;
+                if (!cols[columnId] || row < 0 || row >= length) continue;
+
+                if (!ownedChunkIndexes.has(columnId)) {
+                    colChunks = { ...colChunks };
+                    colChunks[columnId] = colChunks[columnId]
+                        ? colChunks[columnId].slice()
+                        : new Array(chunkCount(offset + length));
+                    ownedChunkIndexes.add(columnId);
+                }
+                const position = row + offset;
+                const index = position >> CHUNK_SHIFT;
+                const key = `${columnId}:${index}`;
+                if (!ownedChunks.has(key)) {
+                    colChunks[columnId][index] = copyChunk(colChunks[columnId], cols[columnId], index);
+                    ownedChunks.add(key);
+                }
+                writeToChunk(colChunks[columnId], index, position & CHUNK_MASK, edit.newValue);
+                flatCache.delete(columnId);
+
+                rowCache.delete(row);
+                if (recordsCache) {
+                    recordsCache[row] = buildRow(row);
+                }
+            }
+            sourceCache = null;
+        }
+    };
+}
+
+/**
+ * Sparse store for the server row model
+ *
+ * Only the total row count is known up front. Rows arrive from the server in
+ * segments ({startRow, data | dataColumns}) and are indexed by fixed-size block.
+ * Rows of blocks that haven't arrived (or were evicted) read as not loaded.
+ *
+ * @param {number} totalRows - Total number of rows on the server
+ * @param {number} blockSize - Number of rows per block
+ * @param {Map} blocks - Block index -> segment {start, store} (internal)
+ * @returns {object} - Data store
+ */
+export function createBlockStore(totalRows, blockSize, blocks = new Map()) {
+    const length = Math.max(0, totalRows || 0);
+    const size = Math.max(1, blockSize || 100);
+
+    const segmentFor = (row) => blocks.get(Math.floor(row / size));
+    // Sparse records array, built on first use (callbacks may ask for it once per row)
+    let recordsCache = null;
+
+    const get = (row, columnId) => {
+        const segment = segmentFor(row);
+        return segment ? segment.store.get(row - segment.start, columnId) : undefined;
+    };
+
+    return {
+        kind: 'blocks',
+        length,
+        blockSize: size,
+        source: null,
+
+        isLoaded(row) {
+            return row >= 0 && row < length && blocks.has(Math.floor(row / size));
+        },
+
+        isBlockLoaded(blockIndex) {
+            return blocks.has(blockIndex);
+        },
+
+        loadedBlocks() {
+            return Array.from(blocks.keys());
+        },
+
+        hasRow(row) {
+            const segment = segmentFor(row);
+            return !!segment && segment.store.hasRow(row - segment.start);
+        },
+
+        get,
+
+        getRow(row) {
+            const segment = segmentFor(row);
+            return segment ? segment.store.getRow(row - segment.start) : null;
+        },
+
+        // Sparse array with only the loaded rows filled in
+        toRecords() {
+            if (recordsCache) return recordsCache;
+            const records = [];
+            records.length = length;
+            const seen = new Set();
+            for (const segment of blocks.values()) {
+                if (seen.has(segment)) continue;
+                seen.add(segment);
+                for (let i = 0; i < segment.store.length; i++) {
+                    if (blocks.has(Math.floor((segment.start + i) / size))) {
+                        records[segment.start + i] = segment.store.getRow(i);
+                    }
+                }
+            }
+            recordsCache = records;
+            return records;
+        },
+
+        /**
+         * Add rows received from the server and return a new store
+         * A block is marked loaded only when the segment covers all of it (or reaches the last row).
+         *
+         * @param {number} startRow - Row index of the first row in the segment
+         * @param {object} store - Record or columnar store holding the segment's rows
+         * @param {number} newTotalRows - Updated total row count (optional)
+         */
+        withSegment(startRow, store, newTotalRows) {
+            const total = typeof newTotalRows === 'number' ? newTotalRows : length;
+            const newBlocks = new Map(blocks);
+            const segment = { start: startRow, store };
+            const end = Math.min(startRow + store.length, total);
+            for (let block = Math.floor(startRow / size); block * size < end; block++) {
+                const blockStart = block * size;
+                const blockEnd = Math.min(blockStart + size, total);
+                if (blockStart >= startRow && blockEnd <= end) {
+                    newBlocks.set(block, segment);
+                }
+            }
+            return createBlockStore(total, size, newBlocks);
+        },
+
+        // Drop blocks (e.g. least recently used ones) and return a new store
+        withoutBlocks(blockIndices) {
+            const newBlocks = new Map(blocks);
+            for (const block of blockIndices) {
+                newBlocks.delete(block);
+            }
+            return createBlockStore(length, size, newBlocks);
+        },
+
+        withEdits(edits) {
+            // Group edits by segment so each segment store is copied once
+            const editsBySegment = new Map();
+            for (const edit of edits) {
+                const segment = segmentFor(edit.row);
+                if (!segment) continue;
+                if (!editsBySegment.has(segment)) editsBySegment.set(segment, []);
+                editsBySegment.get(segment).push({ ...edit, row: edit.row - segment.start });
+            }
+            const replaced = new Map();
+            for (const [segment, segmentEdits] of editsBySegment) {
+                replaced.set(segment, { start: segment.start, store: segment.store.withEdits(segmentEdits) });
+            }
+            const newBlocks = new Map();
+            for (const [block, segment] of blocks) {
+                newBlocks.set(block, replaced.get(segment) || segment);
+            }
+            return createBlockStore(length, size, newBlocks);
+        },
+
+        // Rows can't be reordered or appended locally when the server owns the rows
+        moveRow() {
+            return this;
+        },
+
+        withAppended() {
+            return this;
+        },
+
+        applyInPlace(edits) {
+            const editsBySegment = new Map();
+            for (const edit of edits) {
+                const segment = segmentFor(edit.row);
+                if (!segment) continue;
+                if (!editsBySegment.has(segment)) editsBySegment.set(segment, []);
+                editsBySegment.get(segment).push({ ...edit, row: edit.row - segment.start });
+            }
+            for (const [segment, segmentEdits] of editsBySegment) {
+                segment.store.applyInPlace(segmentEdits);
+                if (recordsCache) {
+                    for (const edit of segmentEdits) {
+                        recordsCache[segment.start + edit.row] = segment.store.getRow(edit.row);
+                    }
+                }
+            }
+        }
+    };
+}
+
+/**
+ * Create the right store for the grid's data props
+ * `dataColumns` takes precedence over `data` when both are provided.
+ *
+ * @param {Array<object>} data - List of row dicts
+ * @param {object} dataColumns - Dict of column id -> array of values
+ * @returns {object} - Data store
+ */
+export function createDataStore(data, dataColumns) {
+    if (dataColumns) {
+        return createColumnarStore(dataColumns);
+    }
+    return createRecordStore(data);
+}
@@ -0,0 +1,74 @@
+/**
+ * Throttling for high-frequency output props
+ *
+ * Each setProps call makes the Dash renderer walk its callback graph, and with a
+ * server callback attached it becomes an HTTP request. Events such as mouseMove
+ * or visibleRegion fire on every native event, so they are throttled per prop:
+ * the first value in a window is sent immediately and the latest value is
+ * always delivered when the window ends (trailing edge), so the final state is
+ * never lost.
+ */
+
+/**
+ * Create a per-prop throttle around setProps
+ *
+ * @param {function} getSetProps - Returns the current setProps function
+ * @returns {object} - {emit(propName, value, limit), cancel()}
+ *   limit: interval in ms (0/undefined sends immediately, false drops the event)
+ */
+export function createPropThrottle(getSetProps) {
+    // propName -> {lastSent, timer, pending}
+    const state = new Map();
+
+    const send = (propName, value) => {
+        const setProps = getSetProps();
+        if (setProps) {
+            setProps({ [propName]: value });
+        }
+    };
+
+    const emit = (propName, value, limit) => {
+        if (limit === false) return;
+        if (!limit || limit <= 0) {
+            send(propName, value);
+            return;
+        }
+
+        let entry = state.get(propName);
+        if (!entry) {
+            entry = { lastSent: 0, timer: null, pending: undefined };
+            state.set(propName, entry);
+        }
+
+        const now = Date.now();
+        const elapsed = now - entry.lastSent;
+        if (entry.timer === null && elapsed >= limit) {
+            entry.lastSent = now;
+            send(propName, value);
+            return;
+        }
+
+        // Inside the window: keep only the latest value for the trailing edge
+        entry.pending = value;
+        if (entry.timer === null) {
+            entry.timer = setTimeout(() => {
+                entry.timer = null;
+                entry.lastSent = Date.now();
+                const pendingValue = entry.pending;
+                entry.pending = undefined;
+                send(propName, pendingValue);
+            }, Math.max(0, limit - elapsed));
+        }
+    };
+
+    const cancel = () => {
+        state.forEach(entry => {
+            if (entry.timer !== null) {
+                clearTimeout(entry.timer);
+            }
+        });
+        state.clear();
+    };
+
+    return { emit, cancel };
+}
@@ -0,0 +1,231 @@
+/**
+ * Column filter engine for displayIndices
+ *
+ * Each filtered column gets a dictionary index, built lazily once per data
+ * store: every distinct display value gets an integer id, and a Uint32Array
+ * holds the value id of each row (plus a count per value). Applying a filter
+ * marks the selected value ids in a small lookup table and scans the id
+ * array, ANDing the columns together. No display values are recomputed and
+ * no list of selected values is searched per row.
+ *
+ * Edits carry the index over to the new store by updating only the edited
+ * rows, so toggling a filter after an edit doesn't rebuild anything.
+ *
+ * The same index provides the header filter menu's distinct values and counts.
+ */
+
+// Value id for rows that aren't loaded (server row model); never matches a filter
+const MISSING = 0xFFFFFFFF;
+
+// Display value of empty cells (see getCellDisplayValue)
+const BLANK = '(Blank)';
+
+const collator = typeof Intl !== 'undefined' ? new Intl.Collator() : null;
+
+// Data store -> Map(columnId -> column index)
+const storeIndexes = new WeakMap();
+
+function indexesFor(store) {
+    let indexes = storeIndexes.get(store);
+    if (!indexes) {
+        indexes = new Map();
+        storeIndexes.set(store, indexes);
+    }
+    return indexes;
+}
+
+function valueId(index, displayValue) {
+    let id = index.idByValue.get(displayValue);
+    if (id === undefined) {
+        id = index.values.length;
+        index.values.push(displayValue);
+        index.idByValue.set(displayValue, id);
+        if (id >= index.counts.length) {
+            const grown = new Uint32Array(Math.max(16, index.counts.length * 2));
+            grown.set(index.counts);
+            index.counts = grown;
+        }
+    }
+    return id;
+}
+
+/**
+ * Get (building it on first use) the dictionary index of one column
+ *
+ * @param {object} store - Data store (see dataStore.js)
+ * @param {string} columnId - Column id
+ * @param {function} getDisplayValue - Cell value -> display value used by the filter menu
+ * @returns {object} - {codes: Uint32Array, values: Array, idByValue: Map, counts: Uint32Array, ...}
+ */
+export function getColumnIndex(store, columnId, getDisplayValue) {
+    const indexes = indexesFor(store);
+    let index = indexes.get(columnId);
+    if (index) return index;
+
+    const length = store.length;
+    index = {
+        codes: new Uint32Array(length),
+        values: [],
+        idByValue: new Map(),
+        counts: new Uint32Array(16),
+        valueCounts: null,
+        search: null
+    };
+    for (let row = 0; row < length; row++) {
+        if (!store.hasRow(row)) {
+            index.codes[row] = MISSING;
+            continue;
+        }
+        const id = valueId(index, getDisplayValue(store.get(row, columnId)));
+        index.codes[row] = id;
+        index.counts[id]++;
+    }
+    indexes.set(columnId, index);
+    return index;
+}
+
+// Move rows of an index to their new values (in place)
+function updateIndexRows(index, store, columnId, rows, getDisplayValue) {
+    index.valueCounts = null;
+    for (const row of rows) {
+        if (row < 0 || row >= index.codes.length) continue;
+        const oldId = index.codes[row];
+        if (oldId !== MISSING) index.counts[oldId]--;
+        if (!store.hasRow(row)) {
+            index.codes[row] = MISSING;
+            continue;
+        }
+        const id = valueId(index, getDisplayValue(store.get(row, columnId)));
+        index.codes[row] = id;
+        index.counts[id]++;
+    }
+}
+
+function rowsByColumn(edits) {
+    const rows = new Map();
+    for (const edit of edits) {
+        if (!rows.has(edit.columnId)) rows.set(edit.columnId, []);
+        rows.get(edit.columnId).push(edit.row);
+    }
+    return rows;
+}
+
+/**
+ * Carry the column indexes of a store over to the store produced by edits
+ * Untouched columns share their index; edited columns get a copy with only the edited rows updated.
+ *
+ * @param {object} oldStore - Store the edits were applied to
+ * @param {object} newStore - Store returned by withEdits
+ * @param {Array<object>} edits - Edits ({row, columnId})
+ * @param {function} getDisplayValue - Cell value -> display value
+ */
+export function carryFilterIndexes(oldStore, newStore, edits, getDisplayValue) {
+    const oldIndexes = storeIndexes.get(oldStore);
+    if (!oldIndexes || oldStore.length !== newStore.length) return;
+
+    const editedRows = rowsByColumn(edits);
+    const newIndexes = indexesFor(newStore);
+    for (const [columnId, index] of oldIndexes) {
+        const rows = editedRows.get(columnId);
+        if (!rows) {
+            newIndexes.set(columnId, index);
+            continue;
+        }
+        // Value ids are stable, so the search index (see searchIndex.js) moves to the copy as is
+        const copy = {
+            codes: index.codes.slice(),
+            values: index.values.slice(),
+            idByValue: new Map(index.idByValue),
+            counts: index.counts.slice(),
+            valueCounts: null,
+            search: index.search
+        };
+        index.search = null;
+        updateIndexRows(copy, newStore, columnId, rows, getDisplayValue);
+        newIndexes.set(columnId, copy);
+    }
+}
+
+/**
+ * Update the indexes of a store whose values were written in place (applyInPlace)
+ */
+export function updateFilterIndexes(store, edits, getDisplayValue) {
+    const indexes = storeIndexes.get(store);
+    if (!indexes) return;
+    for (const [columnId, rows] of rowsByColumn(edits)) {
+        const index = indexes.get(columnId);
+        if (index) updateIndexRows(index, store, columnId, rows, getDisplayValue);
+    }
+}
+
+/**
+ * Distinct display values of a column with their row counts, for the filter menu
+ * Sorted with (Blank) first; computed once per column and data store.
+ *
+ * @returns {object} - {values: Array, counts: Array<number>} (parallel arrays)
+ */
+export function getColumnValueCounts(store, columnId, getDisplayValue) {
+    const index = getColumnIndex(store, columnId, getDisplayValue);
+    if (index.valueCounts) return index.valueCounts;
+
+    const { values } = index;
+    const labels = values.map(value => String(value));
+    const ids = [];
+    for (let id = 0; id < values.length; id++) {
+        // Values whose rows were all edited away drop out
+        if (index.counts[id] > 0) ids.push(id);
+    }
+    ids.sort((a, b) => {
+        if (values[a] === BLANK) return -1;
+        if (values[b] === BLANK) return 1;
+        return collator ? collator.compare(labels[a], labels[b]) : labels[a].localeCompare(labels[b]);
+    });
+
+    index.valueCounts = {
+        values: ids.map(id => values[id]),
+        counts: ids.map(id => index.counts[id])
+    };
+    return index.valueCounts;
+}
+
+/**
+ * Apply column filters
+ *
+ * @param {object} store - Data store
+ * @param {Array<object>} filters - [{columnId, selectedValues}]; an empty selection matches nothing
+ * @param {function} getDisplayValue - Cell value -> display value
+ * @param {Array<number>|null} rows - Data row indices to filter, or null for all rows
+ * @returns {Array<number>} - Data row indices that pass every filter
+ */
+export function filterRows(store, filters, getDisplayValue, rows) {
+    if (filters.some(filter => !filter.selectedValues || filter.selectedValues.length === 0)) {
+        return [];
+    }
+
+    // Per filter: the row -> value id array and a lookup of the selected value ids
+    const checks = filters.map(({ columnId, selectedValues }) => {
+        const index = getColumnIndex(store, columnId, getDisplayValue);
+        const allowed = new Uint8Array(index.values.length);
+        for (const value of selectedValues) {
+            const id = index.idByValue.get(value);
+            if (id !== undefined) allowed[id] = 1;
+        }
+        return { codes: index.codes, allowed };
+    });
+
+    const passes = (row) => {
+        for (let i = 0; i < checks.length; i++) {
+            const code = checks[i].codes[row];
+            if (code === MISSING || !checks[i].allowed[code]) return false;
+        }
+        return true;
+    };
+
+    if (rows) return rows.filter(passes);
+
+    const result = [];
+    for (let row = 0; row < store.length; row++) {
+        if (passes(row)) result.push(row);
+    }
+    return result;
+}
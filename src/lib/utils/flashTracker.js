@@ -0,0 +1,134 @@
+/**
+ * Cell flash tracking (showCellFlash)
+ *
+ * Flash timestamps live outside React: recording a flash does not re-render
+ * the grid. getCellContent reads a cell's timestamp with `get(row, col)`, and
+ * the cells flashed during a frame are repainted together with one
+ * `updateCells` call on the next animation frame.
+ *
+ * Cells are keyed by a number (row * MAX_COLUMNS + col). Each flash is also
+ * recorded in a time bucket, so expired entries are dropped a bucket at a time
+ * once the flash animation is over, without scanning the live entries.
+ */
+
+// Column count that fits in a numeric cell key
+const MAX_COLUMNS = 0x10000;
+
+// Width of an expiry bucket (ms)
+const BUCKET_MS = 100;
+
+const requestFrame = typeof requestAnimationFrame === 'function'
+    ? requestAnimationFrame
+    : (callback) => setTimeout(() => callback(performance.now()), 16);
+const cancelFrame = typeof cancelAnimationFrame === 'function' ? cancelAnimationFrame : clearTimeout;
+
+/**
+ * Create a flash tracker
+ *
+ * @param {number} duration - How long a flash lasts (ms); entries are dropped after this
+ * @param {function} onFlush - Called once per frame with the flashed cells as [[row, col], ...]
+ * @returns {object} - {add(row, col, time), get(row, col), shiftRows(count), clear(), dispose()}
+ */
+export function createFlashTracker(duration, onFlush) {
+    const times = new Map();       // Cell key -> timestamp
+    const buckets = [];            // [{end, keys}] in time order
+    let pending = new Set();       // Cell keys flashed since the last frame
+    let frame = null;
+    let sweepTimer = null;
+
+    const flush = () => {
+        frame = null;
+        const keys = pending;
+        pending = new Set();
+        const cells = [];
+        for (const key of keys) {
+            cells.push([Math.floor(key / MAX_COLUMNS), key % MAX_COLUMNS]);
+        }
+        if (cells.length > 0) onFlush(cells);
+    };
+
+    const sweep = () => {
+        sweepTimer = null;
+        const expired = performance.now() - duration;
+        let dropped = 0;
+        while (dropped < buckets.length && buckets[dropped].end <= expired) {
+            for (const key of buckets[dropped].keys) {
+                // The cell may have flashed again since (it is then in a later bucket)
+                if (times.get(key) <= buckets[dropped].end) times.delete(key);
+            }
+            dropped++;
+        }
+        if (dropped > 0) buckets.splice(0, dropped);
+        scheduleSweep();
+    };
+
+    const clear = () => {
+        times.clear();
+        buckets.length = 0;
+        pending = new Set();
+    };
+
+    const scheduleSweep = () => {
+        if (sweepTimer !== null || buckets.length === 0) return;
+        const delay = Math.max(0, buckets[0].end + duration - performance.now());
+        sweepTimer = setTimeout(sweep, delay);
+    };
+
+    return {
+        /**
+         * Flash a cell (data row, column) starting at `time` (performance.now())
+         */
+        add(row, col, time) {
+            const key = row * MAX_COLUMNS + col;
+            times.set(key, time);
+
+            const end = (Math.floor(time / BUCKET_MS) + 1) * BUCKET_MS;
+            let bucket = buckets[buckets.length - 1];
+            if (!bucket || bucket.end < end) {
+                bucket = { end, keys: [] };
+                buckets.push(bucket);
+            }
+            bucket.keys.push(key);
+
+            pending.add(key);
+            if (frame === null) frame = requestFrame(flush);
+            scheduleSweep();
+        },
+
+        /**
+         * Flash timestamp of a cell, or undefined
+         */
+        get(row, col) {
+            if (times.size === 0) return undefined;
+            return times.get(row * MAX_COLUMNS + col);
+        },
+
+        /**
+         * Move flashes up by `count` rows (rows dropped from the top); flashes on dropped rows are removed
+         */
+        shiftRows(count) {
+            if (count <= 0 || times.size === 0) return;
+            const shift = count * MAX_COLUMNS;
+            const shifted = new Map();
+            for (const [key, time] of times) {
+                if (key >= shift) shifted.set(key - shift, time);
+            }
+            times.clear();
+            for (const [key, time] of shifted) times.set(key, time);
+            for (const bucket of buckets) {
+                bucket.keys = bucket.keys.filter(key => key >= shift).map(key => key - shift);
+            }
+            pending = new Set();
+        },
+
+        clear,
+
+        dispose() {
+            if (frame !== null) cancelFrame(frame);
+            if (sweepTimer !== null) clearTimeout(sweepTimer);
+            frame = null;
+            sweepTimer = null;
+            clear();
+        }
+    };
+}
@@ -0,0 +1,130 @@
+/**
+ * Declarative column formats
+ *
+ * A column can declare `format` instead of a valueFormatter function, e.g.
+ * {"type": "currency", "currency": "EUR", "locale": "de-DE", "decimals": 2}.
+ * Each spec is compiled once into a cached Intl.NumberFormat/Intl.DateTimeFormat,
+ * and formatted strings are memoized per value.
+ */
+
+// Maximum number of memoized value -> string results per compiled format
+const MAX_MEMOIZED_VALUES = 10000;
+
+// Intl instances shared by all specs with the same options ("kind|locale|options" -> instance)
+const intlCache = new Map();
+
+// Compiled formatters by spec object (specs are stable while the columns don't change)
+const formatterBySpec = new WeakMap();
+
+function getIntl(kind, locale, options) {
+    const key = `${kind}|${locale || ''}|${JSON.stringify(options)}`;
+    let instance = intlCache.get(key);
+    if (!instance) {
+        instance = kind === 'date'
+            ? new Intl.DateTimeFormat(locale, options)
+            : new Intl.NumberFormat(locale, options);
+        intlCache.set(key, instance);
+    }
+    return instance;
+}
+
+function numberOptions(spec) {
+    const options = {};
+    if (spec.type === 'percent') {
+        options.style = 'percent';
+    } else if (spec.type === 'currency') {
+        options.style = 'currency';
+        options.currency = spec.currency || 'USD';
+    }
+    if (typeof spec.decimals === 'number') {
+        options.minimumFractionDigits = spec.decimals;
+        options.maximumFractionDigits = spec.decimals;
+    }
+    if (spec.thousandsSeparator === false) {
+        options.useGrouping = false;
+    }
+    return { ...options, ...(spec.options || {}) };
+}
+
+function dateOptions(spec) {
+    const options = {};
+    if (spec.type === 'date' || spec.type === 'datetime') {
+        options.dateStyle = spec.dateStyle || 'medium';
+    }
+    if (spec.type === 'time' || spec.type === 'datetime') {
+        options.timeStyle = spec.timeStyle || 'short';
+    }
+    if (spec.timeZone) {
+        options.timeZone = spec.timeZone;
+    }
+    // Explicit Intl options replace the style shortcuts (Intl rejects mixing them)
+    return spec.options ? { timeZone: spec.timeZone, ...spec.options } : options;
+}
+
+function toNumber(value) {
+    if (typeof value === 'number') return value;
+    if (typeof value === 'string' && value.trim() !== '') {
+        const number = Number(value);
+        return Number.isNaN(number) ? undefined : number;
+    }
+    return undefined;
+}
+
+function toDate(value) {
+    if (value instanceof Date) return value;
+    if (typeof value === 'string' || typeof value === 'number') {
+        const date = new Date(value);
+        return Number.isNaN(date.getTime()) ? undefined : date;
+    }
+    return undefined;
+}
+
+function compileFormat(spec) {
+    const isDate = spec.type === 'date' || spec.type === 'datetime' || spec.type === 'time';
+    const intl = isDate
+        ? getIntl('date', spec.locale, dateOptions(spec))
+        : getIntl('number', spec.locale, numberOptions(spec));
+    const convert = isDate ? toDate : toNumber;
+    const prefix = spec.prefix || '';
+    const suffix = spec.suffix || '';
+    const memo = new Map();
+
+    return (value) => {
+        if (value === null || value === undefined || value === '') return '';
+
+        let text = memo.get(value);
+        if (text !== undefined) return text;
+
+        const converted = convert(value);
+        // Values that can't be formatted keep their default display
+        if (converted === undefined) return undefined;
+
+        text = prefix + intl.format(converted) + suffix;
+        if (memo.size >= MAX_MEMOIZED_VALUES) memo.clear();
+        memo.set(value, text);
+        return text;
+    };
+}
+
+/**
+ * Get the compiled formatter for a column format spec
+ *
+ * @param {object} spec - Column format spec ({type, decimals, locale, currency, ...})
+ * @returns {function|null} - value => formatted string (undefined if the value can't be formatted),
+ *   or null if the spec is invalid
+ */
+export function getFormatter(spec) {
+    if (!spec || typeof spec !== 'object') return null;
+
+    let formatter = formatterBySpec.get(spec);
+    if (formatter === undefined) {
+        try {
+            formatter = compileFormat(spec);
+        } catch (e) {
+            console.warn('[GlideGrid] Invalid column format:', spec, e);
+            formatter = null;
+        }
+        formatterBySpec.set(spec, formatter);
+    }
+    return formatter;
+}
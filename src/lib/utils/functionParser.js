@@ -42,9 +42,91 @@ const BUILTIN_FUNCTIONS = {
     }
 };
 
+// Maximum number of compiled functions kept (each distinct function string + parameter names)
+const MAX_CACHED_FUNCTIONS = 500;
+
+// Compiled function cache: "functionString|paramNames" -> {fn, funcName, usedKeys}
+const compiledFunctions = new Map();
+
+// Words that can't be parameter names of the compiled function
+const RESERVED_WORDS = new Set((
+    'await break case catch class const continue debugger default delete do else enum export extends ' +
+    'false finally for function if implements import in instanceof interface let new null package private ' +
+    'protected public return static super switch this throw true try typeof var void while with yield ' +
+    'eval arguments'
+).split(' '));
+
+function getUserNamespace() {
+    return (typeof window !== 'undefined' && window[NAMESPACE]) || null;
+}
+
+// Current value of a name the expression uses: user functions, then built-ins, then globals
+function lookupName(namespace, key) {
+    if (namespace && key in namespace) return namespace[key];
+    if (key in BUILTIN_FUNCTIONS) return BUILTIN_FUNCTIONS[key];
+    return globalThis[key];
+}
+
+/**
+ * Clear the compiled function cache
+ *
+ * Compiled functions look up the functions in window.dashGlideGridFunctions on
+ * every call, so adding or replacing functions takes effect immediately. This
+ * only frees memory. It is also available as
+ * window.dashGlideGrid.invalidateFunctionCache().
+ */
+export function invalidateFunctionCache() {
+    compiledFunctions.clear();
+}
+
+if (typeof window !== 'undefined') {
+    window.dashGlideGrid = window.dashGlideGrid || {};
+    window.dashGlideGrid.invalidateFunctionCache = invalidateFunctionCache;
+}
+
+function warnMissingFunction(funcName) {
+    console.warn(
+        `[GlideGrid] Function "${funcName}" not found. ` +
+        `Add it to window.${NAMESPACE} in your assets folder. ` +
+        `Example: window.${NAMESPACE}.${funcName} = function(cell, newValue) { ... };`
+    );
+}
+
+// Compile a function string once for a given set of parameter names
+function compileFunction(functionString, paramKeys) {
+    // Extract function name to validate it exists
+    const funcMatch = functionString.match(/^(\w+)\s*\(/);
+    if (!funcMatch) {
+        console.warn(`[GlideGrid] Invalid function string: "${functionString}". Expected format: "functionName(args)"`);
+        return null;
+    }
+
+    // Every name the expression may refer to is passed in and looked up per call,
+    // so functions registered or replaced later are picked up (property names are skipped)
+    const identifiers = new Set(
+        Array.from(functionString.matchAll(/(^|[^\w$.])([A-Za-z_$][\w$]*)/g), match => match[2])
+    );
+    const usedKeys = Array.from(identifiers).filter(
+        key => !RESERVED_WORDS.has(key) && !paramKeys.includes(key)
+    );
+
+    // Create the function with the context and params as arguments
+    // Using Function constructor - safer than eval as it doesn't access local scope
+    const fn = new Function(
+        ...usedKeys,
+        ...paramKeys,
+        `"use strict"; return ${functionString};`
+    );
+
+    return { fn, funcName: funcMatch[1], usedKeys };
+}
+
 /**
  * Parse and execute a function string like "myFunc(cell, newValue)"
  *
+ * Each function string is compiled once per set of parameter names and cached,
+ * so repeated calls (per cell, per paint) don't invoke the JS compiler.
+ *
  * @param {string} functionString - The function call string, e.g. "validateAge(cell, newValue)"
  * @param {object} params - Named parameters to make available in the function scope
  * @returns {any} - The function's return value, or undefined on error
@@ -54,49 +136,37 @@ export function executeFunction(functionString, params = {}) {
         return undefined;
     }
 
-    // Get the user's namespace (may not exist yet)
-    const userNamespace = (typeof window !== 'undefined' && window[NAMESPACE]) || {};
-
-    // Combine built-ins with user functions (user functions take precedence)
-    const availableFunctions = { ...BUILTIN_FUNCTIONS, ...userNamespace };
+    // Add params to context (cell, newValue, col, row, val, etc.)
+    const paramKeys = Object.keys(params);
+    const cacheKey = `${functionString}|${paramKeys.join(',')}`;
 
     try {
-        // Extract function name to validate it exists
-        const funcMatch = functionString.match(/^(\w+)\s*\(/);
-        if (!funcMatch) {
-            console.warn(`[GlideGrid] Invalid function string: "${functionString}". Expected format: "functionName(args)"`);
+        let entry = compiledFunctions.get(cacheKey);
+        if (entry === undefined) {
+            entry = compileFunction(functionString, paramKeys);
+            compiledFunctions.set(cacheKey, entry);
+            if (compiledFunctions.size > MAX_CACHED_FUNCTIONS) {
+                // Evict the least recently used entry (first in insertion order)
+                compiledFunctions.delete(compiledFunctions.keys().next().value);
+            }
+        } else {
+            // Move to the end to mark as recently used
+            compiledFunctions.delete(cacheKey);
+            compiledFunctions.set(cacheKey, entry);
+        }
+        if (entry === null) {
             return undefined;
         }
 
-        const funcName = funcMatch[1];
-
-        // Check if function exists
-        if (!(funcName in availableFunctions)) {
-            console.warn(
-                `[GlideGrid] Function "${funcName}" not found. ` +
-                `Add it to window.${NAMESPACE} in your assets folder. ` +
-                `Example: window.${NAMESPACE}.${funcName} = function(cell, newValue) { ... };`
-            );
+        // Check if function exists (user functions may be registered after the first call)
+        const namespace = getUserNamespace();
+        if (!(namespace && entry.funcName in namespace) && !(entry.funcName in BUILTIN_FUNCTIONS)) {
+            warnMissingFunction(entry.funcName);
             return undefined;
         }
 
-        // Build execution context with available functions
-        const contextKeys = Object.keys(availableFunctions);
-        const contextValues = Object.values(availableFunctions);
-
-        // Add params to context (cell, newValue, col, row, val, etc.)
-        const paramKeys = Object.keys(params);
-        const paramValues = Object.values(params);
-
-        // Create the function with all context available
-        // Using Function constructor - safer than eval as it doesn't access local scope
-        const fn = new Function(
-            ...contextKeys,
-            ...paramKeys,
-            `"use strict"; return ${functionString};`
-        );
-
-        return fn(...contextValues, ...paramValues);
+        const values = entry.usedKeys.map(key => lookupName(namespace, key));
+        return entry.fn(...values, ...Object.values(params));
     } catch (error) {
         console.error(`[GlideGrid] Error executing function "${functionString}":`, error);
         return undefined;
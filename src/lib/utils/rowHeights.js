@@ -0,0 +1,46 @@
+/**
+ * Variable row height table
+ *
+ * Glide asks for the height of every row, repeatedly, while laying out and
+ * scrolling. Heights are resolved into a Float64Array once per data store /
+ * row order / height source, so heightAt(row) is an array read.
+ *
+ * Cheap sources (lists, data columns, hidden rows) are resolved for all rows
+ * up front. A lazy table (rowHeight function) resolves a row the first time
+ * it is asked for, so only the rows Glide actually lays out run the function.
+ */
+
+/**
+ * Build a row height table
+ *
+ * @param {number} numRows - Number of (display) rows
+ * @param {function} heightOf - Display row -> height in pixels
+ * @param {number} defaultHeight - Height of rows outside the table
+ * @param {boolean} [lazy] - Resolve each row on first use instead of all rows now
+ * @returns {object} - {heights, heightAt(row)}
+ */
+export function createRowHeightTable(numRows, heightOf, defaultHeight, lazy = false) {
+    const heights = new Float64Array(numRows);
+    if (lazy) {
+        // NaN marks rows not resolved yet
+        heights.fill(NaN);
+    } else {
+        for (let row = 0; row < numRows; row++) {
+            heights[row] = heightOf(row);
+        }
+    }
+
+    return {
+        heights,
+
+        heightAt(row) {
+            if (row < 0 || row >= numRows) return defaultHeight;
+            let height = heights[row];
+            if (height !== height) {
+                height = heightOf(row);
+                heights[row] = height;
+            }
+            return height;
+        }
+    };
+}
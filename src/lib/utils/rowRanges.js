@@ -0,0 +1,112 @@
+/**
+ * Row sets stored as sorted, merged ranges (hiddenRows)
+ *
+ * `hiddenRows` can list single rows and inclusive ranges, e.g.
+ * [3, [10, 500000], 700000]. Collapsing a large tree section is then one
+ * entry instead of one entry per row, and the set costs memory per range.
+ * The set answers `has(row)` with a binary search (plus a shortcut for the
+ * range hit last, since rows are mostly checked in order), and `size` is the
+ * number of rows covered, so it can stand in for the `Set` used before.
+ */
+
+function normalizeRanges(entries) {
+    // Single rows are sorted as a typed array; ranges separately (there are usually few)
+    let pointCount = 0;
+    const ranges = [];
+    for (const entry of entries) {
+        if (typeof entry === 'number') {
+            pointCount++;
+        } else if (Array.isArray(entry) && entry.length === 2 && entry[1] >= entry[0]) {
+            ranges.push([entry[0], entry[1]]);
+        }
+    }
+    const points = new Float64Array(pointCount);
+    let p = 0;
+    for (const entry of entries) {
+        if (typeof entry === 'number') points[p++] = entry;
+    }
+    points.sort();
+    ranges.sort((a, b) => a[0] - b[0]);
+
+    // Merge both sorted streams into disjoint, non-adjacent ranges
+    const starts = [];
+    const ends = [];
+    const add = (start, end) => {
+        const last = ends.length - 1;
+        if (last >= 0 && start <= ends[last] + 1) {
+            if (end > ends[last]) ends[last] = end;
+        } else {
+            starts.push(start);
+            ends.push(end);
+        }
+    };
+    let r = 0;
+    for (let i = 0; i < points.length; i++) {
+        while (r < ranges.length && ranges[r][0] <= points[i]) {
+            add(ranges[r][0], ranges[r][1]);
+            r++;
+        }
+        add(points[i], points[i]);
+    }
+    for (; r < ranges.length; r++) add(ranges[r][0], ranges[r][1]);
+
+    return { starts, ends };
+}
+
+/**
+ * Create a row set
+ *
+ * @param {Array<number|Array<number>>} entries - Row indices and inclusive [start, end] ranges
+ * @returns {object} - {size, starts, ends, has(row)}
+ */
+export function createRowSet(entries) {
+    const { starts, ends } = normalizeRanges(entries || []);
+    let size = 0;
+    for (let i = 0; i < starts.length; i++) size += ends[i] - starts[i] + 1;
+
+    let lastHit = -1;
+
+    return {
+        size,
+        starts,
+        ends,
+
+        has(row) {
+            if (lastHit >= 0 && row >= starts[lastHit] && row <= ends[lastHit]) return true;
+            // Last range starting at or before row
+            let low = 0;
+            let high = starts.length - 1;
+            let found = -1;
+            while (low <= high) {
+                const mid = (low + high) >> 1;
+                if (starts[mid] <= row) {
+                    found = mid;
+                    low = mid + 1;
+                } else {
+                    high = mid - 1;
+                }
+            }
+            if (found >= 0 && row <= ends[found]) {
+                lastHit = found;
+                return true;
+            }
+            return false;
+        }
+    };
+}
+
+/**
+ * Rows 0..length-1 that are not in the set, in order
+ * Runs in O(visible rows + ranges), so hiding most of a large grid is cheap.
+ */
+export function rowsNotIn(rowSet, length) {
+    const rows = [];
+    let next = 0;
+    for (let i = 0; i < rowSet.starts.length && next < length; i++) {
+        const start = Math.min(rowSet.starts[i], length);
+        for (let row = next; row < start; row++) rows.push(row);
+        next = Math.max(next, rowSet.ends[i] + 1);
+    }
+    for (let row = next; row < length; row++) rows.push(row);
+    return rows;
+}
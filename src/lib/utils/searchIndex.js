@@ -0,0 +1,142 @@
+/**
+ * Indexed grid search (searchIndex prop)
+ *
+ * Builds on the filter engine's per-column value index (display value ->
+ * id, plus the value id of each row), which is already kept up to date on
+ * edits. On top of it, each searched column gets a trigram index over its
+ * distinct lowercased display texts:
+ *
+ * 1. Queries of 3+ characters intersect the posting lists of their trigrams
+ *    (smallest list first) and verify the few candidates with `includes`.
+ *    Shorter queries scan the distinct texts.
+ * 2. The matching value ids are marked in a Uint8Array, and one pass over the
+ *    rows' value id arrays produces the matching cells in display order.
+ *
+ * No cells are built and nothing is formatted while searching. Values that
+ * appear through edits are added to the trigram index incrementally.
+ */
+import { getColumnIndex } from './filterEngine';
+import { getFormatter } from './formatters';
+
+// Value id for rows that aren't loaded (see filterEngine)
+const MISSING = 0xFFFFFFFF;
+
+// Display value of empty cells (see getCellDisplayValue)
+const BLANK = '(Blank)';
+
+function trigramsOf(text) {
+    const grams = new Set();
+    for (let i = 0; i + 3 <= text.length; i++) {
+        grams.add(text.slice(i, i + 3));
+    }
+    return grams;
+}
+
+// Text a value is searched by: the column format's output if it has one, else the display value
+function searchText(value, formatter) {
+    if (value === BLANK) return '';
+    if (formatter) {
+        const formatted = formatter(value);
+        if (formatted !== undefined) return String(formatted).toLowerCase();
+    }
+    return String(value).toLowerCase();
+}
+
+/**
+ * Get the search index of a column, indexing any values added since the last search
+ * It lives on the filter engine's value index, so edits carry it to the new store.
+ */
+function columnSearchIndex(store, columnId, formatSpec, getDisplayValue) {
+    const valueIndex = getColumnIndex(store, columnId, getDisplayValue);
+    let search = valueIndex.search;
+    if (!search || search.formatSpec !== formatSpec) {
+        search = { formatSpec, texts: [], trigrams: new Map() };
+        valueIndex.search = search;
+    }
+
+    const { values } = valueIndex;
+    if (search.texts.length < values.length) {
+        const formatter = getFormatter(formatSpec);
+        for (let id = search.texts.length; id < values.length; id++) {
+            const text = searchText(values[id], formatter);
+            search.texts.push(text);
+            for (let i = 0; i + 3 <= text.length; i++) {
+                const gram = text.slice(i, i + 3);
+                let list = search.trigrams.get(gram);
+                if (!list) {
+                    list = [];
+                    search.trigrams.set(gram, list);
+                }
+                // Ids are added in increasing order, so a repeated trigram is the last entry
+                if (list[list.length - 1] !== id) list.push(id);
+            }
+        }
+    }
+    return { valueIndex, search };
+}
+
+// Value ids of a column whose text contains the query
+function matchingValueIds(valueIndex, search, query) {
+    const matched = new Uint8Array(search.texts.length);
+    let any = false;
+    const mark = (id) => {
+        // Values no row holds any more (edited away) don't match
+        if (valueIndex.counts[id] > 0 && search.texts[id].includes(query)) {
+            matched[id] = 1;
+            any = true;
+        }
+    };
+
+    if (query.length < 3) {
+        for (let id = 0; id < search.texts.length; id++) mark(id);
+        return any ? matched : null;
+    }
+
+    // Start from the rarest trigram of the query
+    let candidates = null;
+    for (const gram of trigramsOf(query)) {
+        const list = search.trigrams.get(gram);
+        if (!list) return null;
+        if (!candidates || list.length < candidates.length) candidates = list;
+    }
+    for (const id of candidates) mark(id);
+    return any ? matched : null;
+}
+
+/**
+ * Search the grid's cells
+ *
+ * @param {object} store - Data store (see dataStore.js)
+ * @param {Array<object>} columns - Column definitions (searched by id; `format` specs are applied)
+ * @param {string} query - Search text (case-insensitive substring match)
+ * @param {Array<number>|null} displayIndices - Data row per display row, or null for data order
+ * @param {function} getDisplayValue - Cell value -> display value
+ * @param {Set<number>} hiddenRows - Data rows to skip
+ * @returns {Array<Array<number>>} - Matching cells as [col, displayRow], in display order
+ */
+export function searchCells(store, columns, query, displayIndices, getDisplayValue, hiddenRows) {
+    const needle = (query || '').toLowerCase();
+    if (!needle || !store || !columns) return [];
+
+    // Per column: the rows' value ids and the matching ids, for columns with any match
+    const checks = [];
+    columns.forEach((columnDef, col) => {
+        const columnId = columnDef?.id || columnDef?.title;
+        const { valueIndex, search } = columnSearchIndex(store, columnId, columnDef?.format || null, getDisplayValue);
+        const matched = matchingValueIds(valueIndex, search, needle);
+        if (matched) checks.push({ col, codes: valueIndex.codes, matched });
+    });
+    if (checks.length === 0) return [];
+
+    const results = [];
+    const numRows = displayIndices ? displayIndices.length : store.length;
+    for (let displayRow = 0; displayRow < numRows; displayRow++) {
+        const row = displayIndices ? displayIndices[displayRow] : displayRow;
+        if (hiddenRows && hiddenRows.size > 0 && hiddenRows.has(row)) continue;
+        for (let i = 0; i < checks.length; i++) {
+            const code = checks[i].codes[row];
+            if (code !== MISSING && checks[i].matched[code]) results.push([checks[i].col, displayRow]);
+        }
+    }
+    return results;
+}
@@ -0,0 +1,189 @@
+/**
+ * Multi-column sort engine for displayIndices
+ *
+ * Sorting used to extract and compare cell values inside the comparator, so
+ * every comparison re-ran value extraction and string allocation. Instead:
+ *
+ * 1. Each sort column's values are extracted once per data store and ranked:
+ *    unique values are sorted once (numbers numerically, dates as epoch ms,
+ *    strings with a shared case-insensitive Intl.Collator) and every row gets
+ *    its value's rank in a Uint32Array.
+ * 2. Rows are ordered with a stable counting sort per column, from the last
+ *    sort column to the first (LSD radix), so no comparator runs at all.
+ * 3. The full permutation is cached per (data store, sortColumns), so toggling
+ *    back to a previous sort is instant. Values written into a store in place
+ *    (applyInPlace) drop the cached ranks and permutations of the edited
+ *    columns through invalidateSortCaches.
+ *
+ * Ordering matches the previous comparator: blanks sort after all values,
+ * unsortable cells after blanks, and descending reverses everything.
+ */
+
+// Permutations kept per data store (one per distinct sortColumns)
+const MAX_CACHED_PERMUTATIONS = 8;
+
+const collator = typeof Intl !== 'undefined'
+    ? new Intl.Collator(undefined, { sensitivity: 'accent' })
+    : null;
+
+function compareStrings(a, b) {
+    if (collator) return collator.compare(a, b);
+    const lowerA = a.toLowerCase();
+    const lowerB = b.toLowerCase();
+    return lowerA < lowerB ? -1 : (lowerA > lowerB ? 1 : 0);
+}
+
+function compareKeys(a, b) {
+    if (typeof a === 'number' && typeof b === 'number') return a - b;
+    return compareStrings(String(a), String(b));
+}
+
+// Data store -> {ranks: Map(columnId -> {ranks, buckets}), permutations: Map(key -> {columnIds, permutation})}
+const storeCaches = new WeakMap();
+
+function cacheFor(store) {
+    let cache = storeCaches.get(store);
+    if (!cache) {
+        cache = { ranks: new Map(), permutations: new Map() };
+        storeCaches.set(store, cache);
+    }
+    return cache;
+}
+
+// Turn an extracted {value, type} into a comparable key (null for blanks, undefined for unsortable)
+function sortKey(extracted) {
+    const { value, type } = extracted;
+    if (type === 'unsortable') return undefined;
+    if (value === null || value === undefined) return null;
+    if (type === 'number') return Number.isNaN(value) ? null : value;
+    if (type === 'date') {
+        const time = Date.parse(value);
+        return Number.isNaN(time) ? String(value) : time;
+    }
+    return String(value);
+}
+
+/**
+ * Rank one column's values (extracted once per store)
+ *
+ * @returns {object} - {ranks: Uint32Array, buckets: number of distinct ranks}
+ */
+function columnRanks(store, columnId, extractSortValue) {
+    const cache = cacheFor(store);
+    let entry = cache.ranks.get(columnId);
+    if (entry) return entry;
+
+    const length = store.length;
+    const keys = new Array(length);
+    const uniqueKeys = new Set();
+    for (let row = 0; row < length; row++) {
+        const key = sortKey(extractSortValue(store.get(row, columnId)));
+        keys[row] = key;
+        if (key !== null && key !== undefined) uniqueKeys.add(key);
+    }
+
+    const sortedKeys = Array.from(uniqueKeys).sort(compareKeys);
+    const rankByKey = new Map();
+    let rank = -1;
+    let previous;
+    for (let i = 0; i < sortedKeys.length; i++) {
+        // Keys the collator considers equal (e.g. differing only in case) share a rank
+        if (i === 0 || compareKeys(previous, sortedKeys[i]) !== 0) rank++;
+        rankByKey.set(sortedKeys[i], rank);
+        previous = sortedKeys[i];
+    }
+
+    const blankRank = rank + 1;
+    const unsortableRank = rank + 2;
+    const ranks = new Uint32Array(length);
+    for (let row = 0; row < length; row++) {
+        const key = keys[row];
+        ranks[row] = key === undefined ? unsortableRank : (key === null ? blankRank : rankByKey.get(key));
+    }
+
+    entry = { ranks, buckets: unsortableRank + 1 };
+    cache.ranks.set(columnId, entry);
+    return entry;
+}
+
+// Stable counting sort of `order` by rank
+function countingSort(order, ranks, buckets, descending) {
+    const counts = new Uint32Array(buckets + 1);
+    const bucketOf = descending ? (row => buckets - 1 - ranks[row]) : (row => ranks[row]);
+    for (let i = 0; i < order.length; i++) {
+        counts[bucketOf(order[i]) + 1]++;
+    }
+    for (let b = 1; b <= buckets; b++) {
+        counts[b] += counts[b - 1];
+    }
+    const sorted = new Int32Array(order.length);
+    for (let i = 0; i < order.length; i++) {
+        const row = order[i];
+        sorted[counts[bucketOf(row)]++] = row;
+    }
+    return sorted;
+}
+
+function fullPermutation(store, sortSpecs, extractSortValue) {
+    const cache = cacheFor(store);
+    const key = JSON.stringify(sortSpecs);
+    const cached = cache.permutations.get(key);
+    if (cached) return cached.permutation;
+
+    let permutation = new Int32Array(store.length);
+    for (let row = 0; row < permutation.length; row++) permutation[row] = row;
+
+    // Least significant column first; stability keeps earlier passes as tie-breakers
+    for (let i = sortSpecs.length - 1; i >= 0; i--) {
+        const { columnId, direction } = sortSpecs[i];
+        const { ranks, buckets } = columnRanks(store, columnId, extractSortValue);
+        permutation = countingSort(permutation, ranks, buckets, direction === 'desc');
+    }
+
+    if (cache.permutations.size >= MAX_CACHED_PERMUTATIONS) {
+        cache.permutations.delete(cache.permutations.keys().next().value);
+    }
+    cache.permutations.set(key, { columnIds: sortSpecs.map(spec => spec.columnId), permutation });
+    return permutation;
+}
+
+/**
+ * Drop the cached ranks and permutations of a store whose values were written in place (applyInPlace)
+ *
+ * @param {object} store - Data store (see dataStore.js)
+ * @param {Array<object>} edits - Edits ({row, columnId}) written into the store
+ */
+export function invalidateSortCaches(store, edits) {
+    const cache = storeCaches.get(store);
+    if (!cache) return;
+    const columnIds = new Set(edits.map(edit => edit.columnId));
+    for (const columnId of columnIds) {
+        cache.ranks.delete(columnId);
+    }
+    for (const [key, { columnIds: sortedBy }] of cache.permutations) {
+        if (sortedBy.some(columnId => columnIds.has(columnId))) cache.permutations.delete(key);
+    }
+}
+
+/**
+ * Sort data rows by one or more columns
+ *
+ * @param {object} store - Data store (see dataStore.js)
+ * @param {Array<object>} sortSpecs - [{columnId, direction: "asc" | "desc"}], primary first
+ * @param {Array<number>|null} rows - Data row indices to sort (e.g. after filtering), or null for all rows
+ * @param {function} extractSortValue - Cell value -> {value, type}
+ * @returns {Array<number>} - Sorted data row indices
+ */
+export function sortRows(store, sortSpecs, rows, extractSortValue) {
+    const permutation = fullPermutation(store, sortSpecs, extractSortValue);
+    if (!rows) return Array.from(permutation);
+
+    // Keep only the requested rows, in sorted order
+    const included = new Uint8Array(store.length);
+    for (const row of rows) included[row] = 1;
+    const sorted = [];
+    for (let i = 0; i < permutation.length; i++) {
+        if (included[permutation[i]]) sorted.push(permutation[i]);
+    }
+    return sorted;
+}
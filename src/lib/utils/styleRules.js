@@ -0,0 +1,177 @@
+/**
+ * Declarative conditional styling (styleRules)
+ *
+ * A rule is {column, operator, value, theme, scope}. When the cell value in
+ * `column` matches, the named theme override (from styleThemes, or an inline
+ * theme object) is applied to the whole row (scope "row") or to that cell only
+ * (scope "cell"). The last matching rule wins.
+ *
+ * Rules are evaluated lazily, at most once per row per data store, and the
+ * matching theme is recorded as a small integer in a Uint16Array. Painting is
+ * then an array lookup; no user functions run while drawing.
+ */
+
+// Array entries: 0 = not evaluated yet, 1 = no rule matched, n + 2 = theme n
+const NOT_EVALUATED = 0;
+const NO_MATCH = 1;
+
+function isBlank(value) {
+    return value === null || value === undefined || value === '' || (typeof value === 'number' && Number.isNaN(value));
+}
+
+// Unwrap custom cell objects to their comparable value
+function comparableValue(value) {
+    if (value && typeof value === 'object' && !Array.isArray(value)) {
+        if (value.data !== undefined && typeof value.data !== 'object') return value.data;
+        if (value.data && value.data.value !== undefined) return value.data.value;
+    }
+    return value;
+}
+
+function compileRule(rule) {
+    const { operator = '==', value } = rule;
+    const text = (v) => String(v).toLowerCase();
+    // Membership with the same coercion as "==": exact match, or equal as strings for non-blank values
+    const memberOf = (list) => {
+        const values = new Set(Array.isArray(list) ? list : [list]);
+        const strings = new Set(Array.from(values, String));
+        return v => values.has(v) || (!isBlank(v) && strings.has(String(v)));
+    };
+
+    switch (operator) {
+        case '==': return v => v === value || (!isBlank(v) && String(v) === String(value));
+        case '!=': return v => !(v === value || (!isBlank(v) && String(v) === String(value)));
+        case '>': return v => !isBlank(v) && v > value;
+        case '>=': return v => !isBlank(v) && v >= value;
+        case '<': return v => !isBlank(v) && v < value;
+        case '<=': return v => !isBlank(v) && v <= value;
+        case 'between': {
+            const [low, high] = Array.isArray(value) ? value : [];
+            return v => !isBlank(v) && v >= low && v <= high;
+        }
+        case 'in': return memberOf(value);
+        case 'notIn': {
+            const isMember = memberOf(value);
+            return v => !isMember(v);
+        }
+        case 'contains': {
+            const needle = text(value);
+            return v => !isBlank(v) && text(v).includes(needle);
+        }
+        case 'startsWith': {
+            const needle = text(value);
+            return v => !isBlank(v) && text(v).startsWith(needle);
+        }
+        case 'endsWith': {
+            const needle = text(value);
+            return v => !isBlank(v) && text(v).endsWith(needle);
+        }
+        case 'isBlank': return v => isBlank(v);
+        case 'notBlank': return v => !isBlank(v);
+        default:
+            console.warn(`[GlideGrid] Unknown styleRules operator: "${operator}"`);
+            return () => false;
+    }
+}
+
+/**
+ * Build the style index for a data store
+ *
+ * @param {object} store - Data store (see dataStore.js)
+ * @param {Array<object>} columns - Column definitions
+ * @param {Array<object>} rules - styleRules prop
+ * @param {object} namedThemes - styleThemes prop (theme name -> theme override)
+ * @returns {object} - {rowTheme(row), cellTheme(row, col), invalidateRows(rows)}
+ */
+export function createStyleIndex(store, columns, rules, namedThemes) {
+    const themes = [];
+    const themeIndexByName = new Map();
+
+    const themeIndexFor = (theme) => {
+        if (theme && typeof theme === 'object') {
+            themes.push(theme);
+            return themes.length - 1;
+        }
+        if (!themeIndexByName.has(theme)) {
+            const named = namedThemes && namedThemes[theme];
+            if (!named) {
+                console.warn(`[GlideGrid] styleRules theme "${theme}" not found in styleThemes`);
+            }
+            themes.push(named || null);
+            themeIndexByName.set(theme, themes.length - 1);
+        }
+        return themeIndexByName.get(theme);
+    };
+
+    // Compile rules, split by scope. Cell rules are grouped by the column index they style.
+    const rowRules = [];
+    const cellRulesByCol = new Map();
+    (rules || []).forEach(rule => {
+        const columnId = rule.column;
+        const compiled = { columnId, test: compileRule(rule), theme: themeIndexFor(rule.theme) };
+        if (rule.scope === 'cell') {
+            (columns || []).forEach((columnDef, col) => {
+                if ((columnDef?.id || columnDef?.title) !== columnId) return;
+                if (!cellRulesByCol.has(col)) cellRulesByCol.set(col, []);
+                cellRulesByCol.get(col).push(compiled);
+            });
+        } else {
+            rowRules.push(compiled);
+        }
+    });
+
+    const length = store ? store.length : 0;
+    const rowStyles = rowRules.length > 0 ? new Uint16Array(length) : null;
+    const cellStyles = new Map();
+
+    const evaluate = (row, compiledRules) => {
+        let match = NO_MATCH;
+        for (const rule of compiledRules) {
+            if (rule.test(comparableValue(store.get(row, rule.columnId)))) {
+                match = rule.theme + 2;
+            }
+        }
+        return match;
+    };
+
+    const lookup = (styles, row, compiledRules) => {
+        if (row < 0 || row >= styles.length) return undefined;
+        let index = styles[row];
+        if (index === NOT_EVALUATED) {
+            // Rows not loaded yet (server row model) are evaluated once they arrive
+            if (!store.hasRow(row)) return undefined;
+            index = evaluate(row, compiledRules);
+            styles[row] = index;
+        }
+        return index === NO_MATCH ? undefined : (themes[index - 2] || undefined);
+    };
+
+    return {
+        hasRules: rowRules.length > 0 || cellRulesByCol.size > 0,
+
+        rowTheme(row) {
+            return rowStyles ? lookup(rowStyles, row, rowRules) : undefined;
+        },
+
+        cellTheme(row, col) {
+            const compiledRules = cellRulesByCol.get(col);
+            if (!compiledRules) return undefined;
+            let styles = cellStyles.get(col);
+            if (!styles) {
+                styles = new Uint16Array(length);
+                cellStyles.set(col, styles);
+            }
+            return lookup(styles, row, compiledRules);
+        },
+
+        // Re-evaluate rows whose values were written in place
+        invalidateRows(rows) {
+            for (const row of rows) {
+                if (rowStyles && row < rowStyles.length) rowStyles[row] = NOT_EVALUATED;
+                for (const styles of cellStyles.values()) {
+                    if (row < styles.length) styles[row] = NOT_EVALUATED;
+                }
+            }
+        }
+    };
+}
@@ -0,0 +1,107 @@
+/**
+ * Binary encoding for numeric columns in `dataColumns`
+ *
+ * A numeric column can be sent as {dtype: "float64", data: "<base64>"} where the
+ * base64 string holds the raw little-endian bytes of a NumPy array. Decoding wraps
+ * the bytes in a typed array view, so no per-value JSON number parsing happens.
+ */
+
+const TYPED_ARRAYS = {
+    float64: Float64Array,
+    float32: Float32Array,
+    int32: Int32Array,
+    int16: Int16Array,
+    int8: Int8Array,
+    uint32: Uint32Array,
+    uint16: Uint16Array,
+    uint8: Uint8Array
+};
+
+/**
+ * Check whether a dataColumns value is a binary-encoded column
+ */
+export function isEncodedColumn(value) {
+    return !!value &&
+        typeof value === 'object' &&
+        !Array.isArray(value) &&
+        typeof value.data === 'string' &&
+        Object.prototype.hasOwnProperty.call(TYPED_ARRAYS, value.dtype);
+}
+
+/**
+ * Check whether a column is held as a typed array
+ */
+export function isTypedColumn(column) {
+    return ArrayBuffer.isView(column) && !(column instanceof DataView);
+}
+
+/**
+ * Check whether a typed column holds floats (NaN is used for missing values)
+ */
+export function isFloatColumn(column) {
+    return column instanceof Float64Array || column instanceof Float32Array;
+}
+
+function base64ToBytes(base64) {
+    if (typeof Uint8Array.fromBase64 === 'function') {
+        return Uint8Array.fromBase64(base64);
+    }
+    const binary = atob(base64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+}
+
+function bytesToBase64(bytes) {
+    if (typeof bytes.toBase64 === 'function') {
+        return bytes.toBase64();
+    }
+    // Build the binary string in chunks to stay under the argument limit of fromCharCode
+    const chunkSize = 0x8000;
+    let binary = '';
+    for (let i = 0; i < bytes.length; i += chunkSize) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + chunkSize));
+    }
+    return btoa(binary);
+}
+
+/**
+ * Decode {dtype, data} into a typed array
+ *
+ * @param {object} encoded - Binary-encoded column
+ * @returns {TypedArray} - Typed array view over the decoded bytes
+ */
+export function decodeColumn(encoded) {
+    const ArrayType = TYPED_ARRAYS[encoded.dtype];
+    const bytes = base64ToBytes(encoded.data);
+    // A freshly allocated buffer is always aligned for the element size
+    return new ArrayType(bytes.buffer, 0, Math.floor(bytes.byteLength / ArrayType.BYTES_PER_ELEMENT));
+}
+
+/**
+ * Encode a typed array back into {dtype, data} for sending to Dash
+ *
+ * @param {TypedArray} column - Typed array column
+ * @returns {object} - Binary-encoded column
+ */
+export function encodeColumn(column) {
+    const dtype = Object.keys(TYPED_ARRAYS).find(key => column instanceof TYPED_ARRAYS[key]);
+    const bytes = new Uint8Array(column.buffer, column.byteOffset, column.byteLength);
+    return { dtype, data: bytesToBase64(bytes) };
+}
+
+/**
+ * Check whether a value can be written into a typed column without loss
+ * null/undefined can be stored in float columns as NaN.
+ */
+export function canStoreInColumn(column, value) {
+    if (value === null || value === undefined || value === '') {
+        return isFloatColumn(column);
+    }
+    if (typeof value !== 'number' || Number.isNaN(value)) {
+        return false;
+    }
+    return new column.constructor([value])[0] === value;
+}
@@ -0,0 +1,164 @@
+/**
+ * Compact undo/redo batches
+ *
+ * Edits are collected per batch as {row, col, columnId, oldValue, newValue}.
+ * When a batch is finalized it is range-encoded: cells are grouped into runs
+ * of consecutive rows per column, and columns with the same row runs share a
+ * block holding one old-values and one new-values array per column (a
+ * Float64Array when every value is a number). A 100k-cell paste becomes a
+ * handful of blocks instead of 100k objects.
+ *
+ * Each batch records its approximate size in bytes, so the history can be
+ * trimmed to a memory budget (maxUndoBytes) as well as a step count.
+ */
+
+// Rough per-item sizes (bytes) used to estimate memory held by the history
+const BLOCK_OVERHEAD = 96;
+const VALUE_OVERHEAD = 16;
+const OBJECT_VALUE_SIZE = 64;
+
+function valueBytes(value) {
+    if (typeof value === 'number') return 8;
+    if (typeof value === 'string') return VALUE_OVERHEAD + value.length * 2;
+    if (value && typeof value === 'object') return OBJECT_VALUE_SIZE;
+    return 8;
+}
+
+// Store a run of values as a Float64Array when they are all numbers
+function packValues(values) {
+    if (values.length > 1 && values.every(value => typeof value === 'number')) {
+        return Float64Array.from(values);
+    }
+    return values;
+}
+
+function packedBytes(values) {
+    if (values instanceof Float64Array) return values.byteLength;
+    let bytes = 0;
+    for (const value of values) bytes += valueBytes(value);
+    return bytes;
+}
+
+/**
+ * Encode a batch of edits
+ *
+ * A cell edited more than once keeps its first old value and its last new value,
+ * which is what undoing (in reverse) or redoing (in order) the raw edits produces.
+ *
+ * @param {Array<object>} edits - Edits ({row, col, columnId, oldValue, newValue}) in the order applied
+ * @returns {object} - {blocks, cellCount, bytes}
+ */
+export function encodeBatch(edits) {
+    // Column -> slot per row, with old/new values by slot
+    const cellsByColumn = new Map();
+    for (const edit of edits) {
+        let column = cellsByColumn.get(edit.col);
+        if (!column) {
+            column = { columnId: edit.columnId, slots: new Map(), oldValues: [], newValues: [] };
+            cellsByColumn.set(edit.col, column);
+        }
+        const slot = column.slots.get(edit.row);
+        if (slot !== undefined) {
+            column.newValues[slot] = edit.newValue;
+        } else {
+            column.slots.set(edit.row, column.oldValues.length);
+            column.oldValues.push(edit.oldValue);
+            column.newValues.push(edit.newValue);
+        }
+    }
+
+    // Row runs per column; columns with identical runs share a block
+    const blocksByRun = new Map();
+    let cellCount = 0;
+    for (const [col, column] of cellsByColumn) {
+        const { slots } = column;
+        const rows = Float64Array.from(slots.keys()).sort();
+        let start = 0;
+        while (start < rows.length) {
+            let end = start + 1;
+            while (end < rows.length && rows[end] === rows[end - 1] + 1) end++;
+
+            const rowStart = rows[start];
+            const rowCount = end - start;
+            const key = `${rowStart}:${rowCount}`;
+            let block = blocksByRun.get(key);
+            if (!block) {
+                block = { rowStart, rowCount, cols: [], columnIds: [], oldValues: [], newValues: [] };
+                blocksByRun.set(key, block);
+            }
+            const oldValues = new Array(rowCount);
+            const newValues = new Array(rowCount);
+            for (let i = 0; i < rowCount; i++) {
+                const slot = slots.get(rowStart + i);
+                oldValues[i] = column.oldValues[slot];
+                newValues[i] = column.newValues[slot];
+            }
+            block.cols.push(col);
+            block.columnIds.push(column.columnId);
+            block.oldValues.push(packValues(oldValues));
+            block.newValues.push(packValues(newValues));
+            cellCount += rowCount;
+            start = end;
+        }
+    }
+
+    const blocks = Array.from(blocksByRun.values());
+    let bytes = 0;
+    for (const block of blocks) {
+        bytes += BLOCK_OVERHEAD;
+        for (let c = 0; c < block.cols.length; c++) {
+            bytes += packedBytes(block.oldValues[c]) + packedBytes(block.newValues[c]);
+        }
+    }
+    return { blocks, cellCount, bytes };
+}
+
+/**
+ * Turn a batch back into edits
+ *
+ * @param {object} batch - Encoded batch
+ * @param {string} direction - "undo" (write old values) or "redo" (write new values)
+ * @returns {Array<object>} - Edits ({row, col, columnId, oldValue, newValue}) for commitDataEdits
+ */
+export function decodeBatch(batch, direction) {
+    const isUndo = direction === 'undo';
+    const edits = new Array(batch.cellCount);
+    let n = 0;
+    for (const block of batch.blocks) {
+        for (let c = 0; c < block.cols.length; c++) {
+            const before = isUndo ? block.newValues[c] : block.oldValues[c];
+            const after = isUndo ? block.oldValues[c] : block.newValues[c];
+            for (let i = 0; i < block.rowCount; i++) {
+                edits[n++] = {
+                    row: block.rowStart + i,
+                    col: block.cols[c],
+                    columnId: block.columnIds[c],
+                    oldValue: before[i],
+                    newValue: after[i]
+                };
+            }
+        }
+    }
+    return edits;
+}
+
+/**
+ * Trim a history stack (oldest first) to a step count and byte budget
+ *
+ * @param {Array<object>} stack - Encoded batches, oldest first
+ * @param {number} maxSteps - Maximum number of batches
+ * @param {number|null} maxBytes - Maximum total bytes (null/0 for no limit)
+ * @returns {Array<object>} - The stack, or a trimmed copy
+ */
+export function trimHistory(stack, maxSteps, maxBytes) {
+    let first = Math.max(0, stack.length - maxSteps);
+    if (maxBytes > 0) {
+        let total = 0;
+        for (let i = first; i < stack.length; i++) total += stack[i].bytes;
+        while (first < stack.length && total > maxBytes) {
+            total -= stack[first].bytes;
+            first++;
+        }
+    }
+    return first === 0 ? stack : stack.slice(first);
+}
@@ -0,0 +1,90 @@
+import math
+
+import pandas as pd
+import pytest
+
+from dash_glide_grid import apply_data_patch, data_patch_to_dash_patch, encode_typed_column
+from dash_glide_grid.dataframe import decode_typed_column
+
+
+def _patch(*edits):
+    return {
+        "edits": [{"row": row, "columnId": column_id, "value": value} for row, column_id, value in edits],
+        "source": "edit",
+    }
+
+
+def _operations(patch):
+    return [(op["location"], op["params"]["value"]) for op in patch.to_plotly_json()["operations"]]
+
+
+def test_apply_to_records_and_plain_columns():
+    records = [{"a": 1}, {"a": 2}]
+    apply_data_patch(records, _patch((1, "a", 5)))
+    assert records == [{"a": 1}, {"a": 5}]
+
+    columns = {"a": [1, 2]}
+    apply_data_patch(columns, _patch((0, "a", 7)))
+    assert columns == {"a": [7, 2]}
+
+
+def test_apply_to_binary_column_keeps_dtype():
+    columns = {"price": encode_typed_column([1.5, 2.5, 3.5]), "name": ["x", "y", "z"]}
+    apply_data_patch(columns, _patch((1, "price", 9.25), (2, "price", None), (0, "name", "w")))
+
+    assert columns["price"]["dtype"] == "float64"
+    values = decode_typed_column(columns["price"])
+    assert values[0] == 1.5 and values[1] == 9.25 and math.isnan(values[2])
+    assert columns["name"] == ["w", "y", "z"]
+
+
+def test_apply_to_binary_column_falls_back_to_list():
+    columns = {"qty": encode_typed_column(pd.Series([1, 2, 3], dtype="int32"))}
+    apply_data_patch(columns, _patch((0, "qty", 1.5), (2, "qty", "n/a")))
+    assert columns["qty"] == [1.5, 2, "n/a"]
+
+    columns = {"qty": encode_typed_column(pd.Series([1, 2], dtype="int32"))}
+    apply_data_patch(columns, _patch((1, "qty", None)))
+    assert columns["qty"] == [1, None]
+
+
+def test_dash_patch_for_binary_column():
+    data_columns = {"price": encode_typed_column([1.0, 2.0]), "name": ["x", "y"]}
+    patch = data_patch_to_dash_patch(
+        _patch((0, "price", 4.0), (1, "name", "z")), columnar=True, data_columns=data_columns
+    )
+    operations = dict((tuple(location), value) for location, value in _operations(patch))
+
+    assert operations[("name", 1)] == "z"
+    price = operations[("price",)]
+    assert price["dtype"] == "float64"
+    assert list(decode_typed_column(price)) == [4.0, 2.0]
+    # The State value passed in is not modified
+    assert list(decode_typed_column(data_columns["price"])) == [1.0, 2.0]
+
+
+def test_dash_patch_for_plain_columns_and_records():
+    assert _operations(data_patch_to_dash_patch(_patch((3, "a", 1)), columnar=True)) == [(["a", 3], 1)]
+    assert _operations(data_patch_to_dash_patch(_patch((3, "a", 1)))) == [([3, "a"], 1)]
+
+
+def test_apply_to_dataframe_with_non_string_labels():
+    df = pd.DataFrame({0: [1, 2], "b": [3, 4], 2.5: [5, 6]})
+    apply_data_patch(df, _patch((0, "0", 10), (1, "b", 40), (1, "2.5", 60)))
+
+    assert df[0].tolist() == [10, 2]
+    assert df["b"].tolist() == [3, 40]
+    assert df[2.5].tolist() == [5, 60]
+
+
+def test_apply_to_dataframe_skips_unknown_columns():
+    df = pd.DataFrame({"a": [1, 2]})
+    apply_data_patch(df, _patch((0, "missing", 1)))
+    assert df["a"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("empty", [None, {}, {"edits": []}])
+def test_empty_patch(empty):
+    records = [{"a": 1}]
+    assert apply_data_patch(records, empty) == [{"a": 1}]
+    assert _operations(data_patch_to_dash_patch(empty)) == []
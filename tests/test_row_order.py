@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from dash_glide_grid import compute_row_order, filter_mask, sort_order
+
+
+def _df():
+    return pd.DataFrame(
+        {
+            "when": pd.to_datetime(["2024-01-03", "2024-01-02", None, "2024-01-01"]),
+            "name": ["b", "A", "", "c"],
+            "score": [2.0, np.nan, 1.0, 2.0],
+        }
+    )
+
+
+def test_filter_datetime_column_by_iso_string():
+    df = _df()
+    mask = filter_mask(df, {"0": ["2024-01-02T00:00:00", "(Blank)"]})
+    assert mask.tolist() == [False, True, True, False]
+    assert compute_row_order(df, None, {"0": ["2024-01-02T00:00:00"]}) == [1]
+
+
+def test_filter_values_and_blanks():
+    df = _df()
+    assert filter_mask(df, {"1": ["b", "(Blank)"]}).tolist() == [True, False, True, False]
+    assert filter_mask(df, {"2": [2.0]}).tolist() == [True, False, False, True]
+
+
+def test_empty_selection_filters_everything():
+    assert not filter_mask(_df(), {"1": []}).any()
+
+
+def test_sort_strings_case_insensitive_blanks_last():
+    order = sort_order(_df(), [{"columnIndex": 1, "direction": "asc"}])
+    assert order.tolist() == [1, 0, 3, 2]
+    order = sort_order(_df(), [{"columnIndex": 1, "direction": "desc"}])
+    assert order.tolist() == [2, 3, 0, 1]
+
+
+def test_sort_multi_column_keeps_ties_in_data_order():
+    df = _df()
+    order = sort_order(df, [{"columnIndex": 2, "direction": "desc"}, {"columnIndex": 0, "direction": "asc"}])
+    assert order.tolist() == [1, 3, 0, 2]
+
+
+def test_sort_datetimes_and_filtered_rows():
+    df = _df()
+    order = compute_row_order(df, [{"columnIndex": 0, "direction": "asc"}], {"1": ["b", "c", "A"]})
+    assert order == [3, 1, 0]
+
+
+def test_columns_map_indices_to_labels():
+    columns = [{"id": "score"}, {"id": "missing"}]
+    assert filter_mask(_df(), {"0": [1.0], "1": ["x"]}, columns).tolist() == [False, False, True, False]
+
+
+def test_nothing_to_do_returns_none():
+    assert compute_row_order(_df()) is None